@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: agent_core/task_journal.py
+
+import json
+import os
+import threading
+import time
+
+from environments.orchestrator import CFG, logger, resolve_path
+
+JOURNAL_CFG = CFG.get("agent_core", {}).get("task_queue", {})
+FSYNC_POLICIES = ("always", "interval", "never")
+
+
+class TaskJournal:
+    """
+    Write-ahead journal for TaskQueue: one JSON line per queue operation,
+    plus a compacted checkpoint of the whole queue.
+
+    Every record carries a sequence number and the checkpoint stores the
+    last one it covers, so recovery loads the checkpoint and replays only
+    the journal records after it. After checkpoint_records appends the
+    queue writes a new checkpoint (atomic replace) and the journal is
+    truncated; a crash between the two just replays records the
+    checkpoint already covers, and those are skipped by sequence.
+
+    fsync policy: "always" syncs each record; "interval" syncs on the first
+    append after fsync_interval_sec has passed (records are always flushed
+    to the OS, so only power loss can drop that window); "never" leaves it
+    to the OS.
+    """
+
+    def __init__(
+        self,
+        checkpoint_path,
+        journal_path=None,
+        fsync="interval",
+        fsync_interval_sec=1.0,
+        checkpoint_records=1000,
+    ):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.checkpoint_path = str(checkpoint_path)
+        self.journal_path = str(journal_path or f"{self.checkpoint_path}.journal")
+        self.fsync = fsync
+        self.fsync_interval_sec = fsync_interval_sec
+        self.checkpoint_records = checkpoint_records
+        self.seq = 0
+        self.records = 0
+        self.checkpoints = 0
+        self._file = None
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+
+    # ── recovery ────────────────────────────────────────────
+
+    def load(self):
+        """
+        Returns (checkpoint, records): the last checkpoint dict (or None)
+        and the journal records written after it, in order.
+        """
+        checkpoint = None
+        try:
+            with open(self.checkpoint_path, "r") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.warning(f"[TaskJournal] Unreadable checkpoint, replaying only: {e}")
+        covered = (checkpoint or {}).get("seq", 0)
+        self.seq = covered
+        records = []
+        try:
+            with open(self.journal_path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # torn last line after a crash
+                    if record.get("seq", 0) <= covered:
+                        continue
+                    records.append(record)
+                    self.seq = max(self.seq, record["seq"])
+        except FileNotFoundError:
+            pass
+        self.records = len(records)
+        return checkpoint, records
+
+    # ── writing ─────────────────────────────────────────────
+
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        self._file = open(self.journal_path, "a")
+
+    def _sync(self, force=False):
+        now = time.monotonic()
+        if (
+            force
+            or self.fsync == "always"
+            or (
+                self.fsync == "interval"
+                and now - self._last_sync >= self.fsync_interval_sec
+            )
+        ):
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def append(self, record):
+        """Writes one record; returns True when a checkpoint is due."""
+        with self._lock:
+            if self._file is None:
+                self._open()
+            self.seq += 1
+            record["seq"] = self.seq
+            self._file.write(json.dumps(record, separators=(",", ":"), default=str))
+            self._file.write("\n")
+            self._file.flush()
+            self._sync()
+            self.records += 1
+            return self.records >= self.checkpoint_records
+
+    def checkpoint(self, state):
+        """Atomically writes state (plus seq) and truncates the journal."""
+        with self._lock:
+            state = dict(state, seq=self.seq)
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self.checkpoint_path)), exist_ok=True
+            )
+            tmp_path = f"{self.checkpoint_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(state, f, separators=(",", ":"), default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.checkpoint_path)
+            if self._file is not None:
+                self._file.close()
+            self._file = open(self.journal_path, "w")
+            self._sync(force=True)
+            self.records = 0
+            self.checkpoints += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._sync(force=True)
+                self._file.close()
+                self._file = None
+
+    def stats(self):
+        return {
+            "journal": self.journal_path,
+            "seq": self.seq,
+            "pending_records": self.records,
+            "checkpoint_records": self.checkpoint_records,
+            "checkpoints": self.checkpoints,
+            "fsync": self.fsync,
+        }
+
+
+def make_task_journal(checkpoint_path, **overrides):
+    """
+    Builds the journal from the [agent_core.task_queue] config section.
+    Returns None when journaling is disabled (full snapshot per change).
+    """
+    opts = dict(JOURNAL_CFG, **overrides)
+    if not opts.get("journal", True):
+        return None
+    journal_path = opts.get("journal_file")
+    return TaskJournal(
+        checkpoint_path,
+        journal_path=resolve_path(journal_path) if journal_path else None,
+        fsync=opts.get("fsync", "interval"),
+        fsync_interval_sec=opts.get("fsync_interval_sec", 1.0),
+        checkpoint_records=opts.get("checkpoint_records", 1000),
+    )
+
+
+__all__ = ["TaskJournal", "make_task_journal"]
@@ -12,27 +12,160 @@
 from conda_envs.environments.orchestrator.globals import *
 
 
+import heapq
+import itertools
 import json
 import uuid
 from collections import deque, defaultdict
 from datetime import datetime
 from environments.orchestrator import CFG, logger, resolve_path, DATA_DIR
+from agent_core.task_journal import make_task_journal
 
 QUEUE_FILE = resolve_path(
     CFG["paths"].get("task_queue_file", "$ROOT/run/checkpoints/task_queue.json")
 )
 ESCALATION_THRESHOLD_SEC = 120
+LEVELS = ("high", "normal", "low")
+# Levels that age, and where their overdue tasks go
+PROMOTIONS = (("low", "normal"), ("normal", "high"))
+_EPOCH = datetime(1970, 1, 1)
+
+# Journal record kinds (see _replay)
+OP_ENQUEUE = "e"
+OP_FETCH = "f"
+OP_REPRIORITIZE = "r"
+OP_PROMOTE = "p"
+OP_RETRY = "t"
+OP_STATUS = "s"
+
+# Dead lane entries a level tolerates before rebuilding its lanes
+COMPACT_MIN_DEAD = 1024
+
+
+class _Entry:
+    """One queued task; seq orders entries across the lanes of a level."""
+
+    __slots__ = ("task", "id", "type", "level", "seq", "live")
+
+    def __init__(self, task, level, seq):
+        self.task = task
+        self.id = task.get("id")
+        self.type = task.get("type")
+        self.level = level
+        self.seq = seq
+        self.live = True
+
+
+class PriorityLevel:
+    """
+    The tasks of one priority, split into FIFO lanes per task type.
+
+    A typed fetch pops its lane's head in O(1); an untyped fetch takes the
+    oldest head across lanes (O(types)), which keeps the level's overall
+    FIFO order. Entries removed out of order (reprioritize, promotion) are
+    only flagged dead and skipped when they reach a lane head; the lanes
+    are rebuilt once dead entries outnumber live ones.
+    """
+
+    def __init__(self):
+        self.lanes = {}
+        self.live = 0
+        self.dead = 0
+
+    def append(self, entry):
+        lane = self.lanes.get(entry.type)
+        if lane is None:
+            lane = self.lanes[entry.type] = deque()
+        lane.append(entry)
+        self.live += 1
+
+    def _head(self, task_type):
+        lane = self.lanes.get(task_type)
+        while lane and not lane[0].live:
+            lane.popleft()
+            self.dead -= 1
+        if lane is not None and not lane:
+            del self.lanes[task_type]
+            return None
+        return lane
+
+    def popleft(self, task_type=None):
+        """Removes and returns the oldest live entry (of task_type), or None."""
+        if task_type is not None:
+            lane = self._head(task_type)
+        else:
+            lane = None
+            for lane_type in list(self.lanes):
+                candidate = self._head(lane_type)
+                if candidate and (lane is None or candidate[0].seq < lane[0].seq):
+                    lane = candidate
+        if not lane:
+            return None
+        entry = lane.popleft()
+        entry.live = False
+        self.live -= 1
+        return entry
+
+    def discard(self, entry):
+        entry.live = False
+        self.live -= 1
+        self.dead += 1
+        if self.dead > max(COMPACT_MIN_DEAD, self.live):
+            self._compact()
+
+    def _compact(self):
+        for task_type in list(self.lanes):
+            lane = deque(e for e in self.lanes[task_type] if e.live)
+            if lane:
+                self.lanes[task_type] = lane
+            else:
+                del self.lanes[task_type]
+        self.dead = 0
+
+    def entries(self):
+        """Live entries in enqueue order (O(n log n); for dumps and scans)."""
+        return sorted(
+            (e for lane in self.lanes.values() for e in lane if e.live),
+            key=lambda e: e.seq,
+        )
+
+    def clear(self):
+        self.lanes.clear()
+        self.live = self.dead = 0
+
+    def __len__(self):
+        return self.live
+
+    def __iter__(self):
+        return (entry.task for entry in self.entries())
 
 
 class TaskQueue:
     """
     Production-ready prioritized task queue for FSM and agents.
+
+    Each priority level keeps per-type FIFO lanes (see PriorityLevel) and
+    an id -> entry map finds queued tasks in O(1) for reprioritize, retry
+    and promotion.
+
+    Each mutation appends one record to a write-ahead journal (O(1) per
+    operation); the full queue, status and meta maps are only written as
+    periodic checkpoints. Without a journal every mutation rewrites the
+    snapshot, as before.
     """
 
-    def __init__(self):
-        self.task_queue = {"high": deque(), "normal": deque(), "low": deque()}
+    def __init__(self, journal="config"):
+        self.task_queue = {level: PriorityLevel() for level in LEVELS}
+        self._entries = {}
+        self._seq = itertools.count()
+        # level -> heap of (due, seq, entry); entries that left the level stay
+        # until they surface and are skipped
+        self._aging = {level: [] for level, _ in PROMOTIONS}
         self.task_status = {}
         self.task_meta = defaultdict(dict)
+        self._journal = (
+            make_task_journal(QUEUE_FILE) if journal == "config" else journal
+        )
         self._load_snapshot()
 
     def enqueue_task(self, task):
@@ -44,7 +177,6 @@ class TaskQueue:
                 f"[TaskQueue] Invalid priority '{priority}', defaulting to normal."
             )
             priority = "normal"
-        self.task_queue[priority].append(task)
         self.task_status[task_id] = "queued"
         self.task_meta[task_id] = {
             "type": task["type"],
@@ -52,55 +184,120 @@ class TaskQueue:
             "timestamp": datetime.utcnow().isoformat(),
             "retries": 0,
         }
+        self._push(task, priority)
         logger.debug(f"[TaskQueue] Enqueued ({priority}): {task['type']} ({task_id})")
-        self._save_snapshot()
+        self._log(
+            {
+                "op": OP_ENQUEUE,
+                "id": task_id,
+                "p": priority,
+                "task": task,
+                "meta": self.task_meta[task_id],
+            }
+        )
+
+    def _push(self, task, level):
+        """Queues task at the back of its (level, type) lane."""
+        entry = _Entry(task, level, next(self._seq))
+        key = entry.id if entry.id is not None else id(task)
+        previous = self._entries.get(key)
+        if previous is not None:
+            # Re-queued while still queued (retry): keep a single entry
+            self.task_queue[previous.level].discard(previous)
+        self._entries[key] = entry
+        self.task_queue[level].append(entry)
+        heap = self._aging.get(level)
+        if heap is not None:
+            due = self._due(entry.id)
+            if due is not None:
+                heapq.heappush(heap, (due, entry.seq, entry))
+                if len(heap) > max(COMPACT_MIN_DEAD, 2 * len(self.task_queue[level])):
+                    self._aging[level] = [item for item in heap if item[2].live]
+                    heapq.heapify(self._aging[level])
+        return entry
+
+    def _due(self, task_id):
+        """When task_id becomes overdue (UTC epoch seconds), from its enqueue time."""
+        try:
+            enqueued = datetime.fromisoformat(self.task_meta[task_id]["timestamp"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        return (enqueued - _EPOCH).total_seconds() + ESCALATION_THRESHOLD_SEC
+
+    def _take(self, task_id):
+        """Removes the queued entry for task_id; returns it or None."""
+        entry = self._entries.pop(task_id, None)
+        if entry is not None:
+            self.task_queue[entry.level].discard(entry)
+        return entry
 
     def fetch_task(self, task_type=None):
-        for level in ["high", "normal", "low"]:
-            for _ in range(len(self.task_queue[level])):
-                task = self.task_queue[level].popleft()
-                if not task_type or task["type"] == task_type:
-                    self.task_status[task["id"]] = "running"
-                    return task
-                self.task_queue[level].append(task)
+        for level in LEVELS:
+            entry = self.task_queue[level].popleft(task_type)
+            if entry is None:
+                continue
+            self._entries.pop(
+                entry.id if entry.id is not None else id(entry.task), None
+            )
+            self.task_status[entry.id] = "running"
+            self._log({"op": OP_FETCH, "id": entry.id, "p": level})
+            return entry.task
         return None
 
     def reprioritize(self, task_id, new_priority):
         if new_priority not in self.task_queue:
             logger.error(f"[TaskQueue] Invalid target priority: {new_priority}")
             return False
-        for level in ["high", "normal", "low"]:
-            for task in list(self.task_queue[level]):
-                if task.get("id") == task_id:
-                    self.task_queue[level].remove(task)
-                    task["priority"] = new_priority
-                    self.task_queue[new_priority].append(task)
-                    self.task_meta[task_id]["priority"] = new_priority
-                    self.task_status[task_id] = "reprioritized"
-                    logger.info(f"[TaskQueue] Task {task_id} moved to {new_priority}")
-                    self._save_snapshot()
-                    return True
-        logger.warning(f"[TaskQueue] Task ID {task_id} not found in any queue.")
-        return False
+        entry = self._take(task_id)
+        if entry is None:
+            logger.warning(f"[TaskQueue] Task ID {task_id} not found in any queue.")
+            return False
+        entry.task["priority"] = new_priority
+        self._push(entry.task, new_priority)
+        self.task_meta[task_id]["priority"] = new_priority
+        self.task_status[task_id] = "reprioritized"
+        logger.info(f"[TaskQueue] Task {task_id} moved to {new_priority}")
+        self._log(
+            {
+                "op": OP_REPRIORITIZE,
+                "id": task_id,
+                "from": entry.level,
+                "p": new_priority,
+            }
+        )
+        return True
 
     def promote_old_tasks(self):
-        now = datetime.utcnow()
-        threshold = timedelta(seconds=ESCALATION_THRESHOLD_SEC)
-        for level, next_level in [("low", "normal"), ("normal", "high")]:
+        """
+        Moves tasks enqueued more than ESCALATION_THRESHOLD_SEC ago up one
+        level (low -> normal -> high, both in one pass as before). Each
+        aging level keeps a heap ordered by due time, so a tick with nothing
+        due only peeks at two heap tops and a promotion is O(log n).
+        """
+        now = (datetime.utcnow() - _EPOCH).total_seconds()
+        for level, next_level in PROMOTIONS:
+            heap = self._aging[level]
             to_promote = []
-            for task in list(self.task_queue[level]):
-                tid = task.get("id")
-                if not tid or tid not in self.task_meta:
-                    continue
-                timestamp = datetime.fromisoformat(self.task_meta[tid]["timestamp"])
-                if now - timestamp > threshold:
-                    to_promote.append(task)
-                    self.task_queue[level].remove(task)
-                    self.task_meta[tid]["priority"] = next_level
-                    logger.info(f"[ESCALATION] Promoted task {tid} to {next_level}")
+            while heap and heap[0][0] < now:
+                _, _, entry = heapq.heappop(heap)
+                if not entry.live:
+                    continue  # fetched, reprioritized or re-queued since
+                tid = entry.id
+                to_promote.append(entry.task)
+                self._take(tid)
+                self.task_meta[tid]["priority"] = next_level
+                logger.info(f"[ESCALATION] Promoted task {tid} to {next_level}")
             for task in to_promote:
-                self.task_queue[next_level].append(task)
-        self._save_snapshot()
+                self._push(task, next_level)
+            if to_promote:
+                self._log(
+                    {
+                        "op": OP_PROMOTE,
+                        "from": level,
+                        "p": next_level,
+                        "ids": [task["id"] for task in to_promote],
+                    }
+                )
 
     def retry(self, task):
         tid = task.get("id")
@@ -108,14 +305,22 @@ class TaskQueue:
             self.task_meta[tid]["retries"] += 1
             self.task_status[tid] = "retried"
             priority = self.task_meta[tid].get("priority", "normal")
-            self.task_queue[priority].append(task)
+            self._push(task, priority)
             logger.warning(f"[TaskQueue] Retried ({priority}): {tid}")
-            self._save_snapshot()
+            self._log(
+                {
+                    "op": OP_RETRY,
+                    "id": tid,
+                    "p": priority,
+                    "task": task,
+                    "retries": self.task_meta[tid]["retries"],
+                }
+            )
 
     def update_task_status(self, task_id, status):
         self.task_status[task_id] = status
         logger.debug(f"[TaskQueue] {task_id} => {status}")
-        self._save_snapshot()
+        self._log({"op": OP_STATUS, "id": task_id, "status": status})
 
     def get_all_tasks(self):
         return [
@@ -137,7 +342,20 @@ class TaskQueue:
             "low": list(self.task_queue["low"]),
         }
 
+    def _log(self, record):
+        """Journals one operation; checkpoints when the journal is long enough."""
+        if self._journal is None:
+            self._save_snapshot()
+            return
+        try:
+            if self._journal.append(record):
+                self._save_snapshot()
+        except Exception as e:
+            logger.error(f"[TaskQueue] Journal append failed: {e}")
+
     def _save_snapshot(self):
+        """Writes the whole queue: a journal checkpoint, or the legacy snapshot."""
+
         def make_serializable(obj):
             if isinstance(obj, defaultdict):
                 obj = dict(obj)
@@ -155,24 +373,87 @@ class TaskQueue:
                 "status": make_serializable(self.task_status),
                 "meta": make_serializable(dict(self.task_meta)),
             }
+            if self._journal is not None:
+                self._journal.checkpoint(snapshot)
+                logger.debug("[TaskQueue] Checkpoint saved.")
+                return
             with open(QUEUE_FILE, "w") as f:
                 json.dump(snapshot, f, indent=2, default=str)
                 logger.debug("[TaskQueue] Snapshot saved.")
         except Exception as e:
             logger.error(f"[TaskQueue] Snapshot save failed: {e}")
 
+    def _restore(self, data):
+        for level in self.task_queue.values():
+            level.clear()
+        self._entries.clear()
+        for heap in self._aging.values():
+            heap.clear()
+        self.task_status.update(data.get("status", {}))
+        self.task_meta = defaultdict(dict, data.get("meta", {}))
+        for level in LEVELS:
+            for task in data.get("queue", {}).get(level, []):
+                self._push(task, level)
+
     def _load_snapshot(self):
+        if self._journal is None:
+            try:
+                with open(QUEUE_FILE, "r") as f:
+                    self._restore(json.load(f))
+                logger.info("[TaskQueue] Queue restored from snapshot.")
+            except Exception as e:
+                logger.warning(f"[TaskQueue] Failed to load queue snapshot: {e}")
+            return
         try:
-            with open(QUEUE_FILE, "r") as f:
-                data = json.load(f)
-                for level in self.task_queue:
-                    self.task_queue[level].clear()
-                    self.task_queue[level].extend(data.get("queue", {}).get(level, []))
-                self.task_status.update(data.get("status", {}))
-                self.task_meta = defaultdict(dict, data.get("meta", {}))
-            logger.info("[TaskQueue] Queue restored from snapshot.")
+            checkpoint, records = self._journal.load()
+            if checkpoint:
+                self._restore(checkpoint)
+            if records:
+                self._replay(records)
+                # Fold the replayed tail into a fresh checkpoint
+                self._save_snapshot()
+            logger.info(
+                f"[TaskQueue] Queue restored from checkpoint + {len(records)} journal records."
+            )
         except Exception as e:
-            logger.warning(f"[TaskQueue] Failed to load queue snapshot: {e}")
+            logger.warning(f"[TaskQueue] Failed to recover queue journal: {e}")
+
+    def _replay(self, records):
+        """Re-applies journaled operations on top of the restored checkpoint."""
+        for record in records:
+            op, tid = record.get("op"), record.get("id")
+            if op == OP_ENQUEUE:
+                self.task_status[tid] = "queued"
+                self.task_meta[tid] = record["meta"]
+                self._push(record["task"], record["p"])
+            elif op == OP_FETCH:
+                self._take(tid)
+                self.task_status[tid] = "running"
+            elif op == OP_REPRIORITIZE:
+                entry = self._take(tid)
+                if entry is not None:
+                    entry.task["priority"] = record["p"]
+                    self._push(entry.task, record["p"])
+                self.task_meta[tid]["priority"] = record["p"]
+                self.task_status[tid] = "reprioritized"
+            elif op == OP_PROMOTE:
+                for pid in record["ids"]:
+                    entry = self._take(pid)
+                    if entry is not None:
+                        self._push(entry.task, record["p"])
+                    self.task_meta[pid]["priority"] = record["p"]
+            elif op == OP_RETRY:
+                self._push(record["task"], record["p"])
+                self.task_meta[tid]["retries"] = record["retries"]
+                self.task_status[tid] = "retried"
+            elif op == OP_STATUS:
+                self.task_status[tid] = record["status"]
+
+    def close(self):
+        """Checkpoints and closes the journal (clean shutdown)."""
+        if self._journal is not None:
+            self._save_snapshot()
+            self._journal.close()
 
     def is_empty(self):
         """
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: agent_core/task_queue_benchmark.py
+# Microbenchmark: TaskQueue operations at a large queue depth.
+#
+#   python -m agent_core.task_queue_benchmark --tasks 100000
+
+import argparse
+import random
+import tempfile
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+
+from agent_core.task_journal import TaskJournal
+from agent_core.task_queue import ESCALATION_THRESHOLD_SEC, LEVELS, TaskQueue
+
+TASK_TYPES = ["nlp", "trade", "mutation", "memory", "signal", "shell", "summarize"]
+
+
+class _RotatingQueue:
+    """The previous deque-per-priority algorithm, kept as a baseline."""
+
+    def __init__(self):
+        self.task_queue = {level: deque() for level in LEVELS}
+        self.task_status = {}
+        self.task_meta = {}
+
+    def enqueue_task(self, task):
+        task["id"] = str(uuid.uuid4())
+        self.task_queue[task.get("priority", "normal")].append(task)
+        self.task_status[task["id"]] = "queued"
+        self.task_meta[task["id"]] = {
+            "type": task["type"],
+            "priority": task.get("priority", "normal"),
+            "timestamp": datetime.utcnow().isoformat(),
+            "retries": 0,
+        }
+
+    def fetch_task(self, task_type=None):
+        for level in LEVELS:
+            for _ in range(len(self.task_queue[level])):
+                task = self.task_queue[level].popleft()
+                if not task_type or task["type"] == task_type:
+                    self.task_status[task["id"]] = "running"
+                    return task
+                self.task_queue[level].append(task)
+        return None
+
+    def reprioritize(self, task_id, new_priority):
+        for level in LEVELS:
+            for task in list(self.task_queue[level]):
+                if task.get("id") == task_id:
+                    self.task_queue[level].remove(task)
+                    self.task_queue[new_priority].append(task)
+                    return True
+        return False
+
+    def promote_old_tasks(self):
+        now = datetime.utcnow()
+        threshold = timedelta(seconds=ESCALATION_THRESHOLD_SEC)
+        for level, next_level in [("low", "normal"), ("normal", "high")]:
+            to_promote = []
+            for task in list(self.task_queue[level]):
+                timestamp = datetime.fromisoformat(
+                    self.task_meta[task["id"]]["timestamp"]
+                )
+                if now - timestamp > threshold:
+                    to_promote.append(task)
+                    self.task_queue[level].remove(task)
+            self.task_queue[next_level].extend(to_promote)
+
+
+class _NullJournal:
+    """Journal stand-in that persists nothing, to time the indexing alone."""
+
+    def load(self):
+        return None, []
+
+    def append(self, record):
+        return False
+
+    def checkpoint(self, state):
+        pass
+
+    def close(self):
+        pass
+
+
+def _tasks(count, scrape_every, rng):
+    """count tasks over all priorities; every scrape_every-th is a "scrape"."""
+    for i in range(count):
+        yield {
+            "type": "scrape" if i % scrape_every == 0 else rng.choice(TASK_TYPES),
+            "priority": rng.choice(LEVELS),
+            "payload": {"n": i},
+        }
+
+
+def _per_op_us(fn, ops):
+    started = time.perf_counter()
+    for i in range(ops):
+        fn(i)
+    return (time.perf_counter() - started) * 1e6 / max(ops, 1)
+
+
+def bench(queue, tasks, ops, rng):
+    """Microseconds per operation for each TaskQueue operation."""
+    results = {}
+    started = time.perf_counter()
+    for task in tasks:
+        queue.enqueue_task(task)
+    results["enqueue"] = (time.perf_counter() - started) * 1e6 / len(tasks)
+    # Tasks the fetches above cannot reach: still queued when reprioritized
+    ids = [t["id"] for t in tasks[len(tasks) // 2 :] if t["type"] != "scrape"]
+    results["fetch_task('scrape')"] = _per_op_us(
+        lambda _: queue.fetch_task("scrape"), ops
+    )
+    # The scraper loop's idle tick: no task of the requested type is queued
+    results["fetch_task('idle')"] = _per_op_us(lambda _: queue.fetch_task("idle"), ops)
+    results["fetch_task()"] = _per_op_us(lambda _: queue.fetch_task(), ops)
+    results["reprioritize"] = _per_op_us(
+        lambda _: queue.reprioritize(rng.choice(ids), rng.choice(LEVELS)), ops
+    )
+    # An FSM tick with nothing old enough to promote
+    results["promote_old_tasks()"] = _per_op_us(
+        lambda _: queue.promote_old_tasks(), ops
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TaskQueue microbenchmark")
+    parser.add_argument("--tasks", type=int, default=100_000, help="queue depth")
+    parser.add_argument("--ops", type=int, default=1000, help="timed ops each")
+    parser.add_argument(
+        "--baseline-ops", type=int, default=50, help="timed ops for the old queue"
+    )
+    parser.add_argument("--scrape-every", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    def run(queue, ops):
+        rng = random.Random(args.seed)
+        return bench(queue, list(_tasks(args.tasks, args.scrape_every, rng)), ops, rng)
+
+    indexed = run(TaskQueue(journal=_NullJournal()), args.ops)
+    with tempfile.TemporaryDirectory() as tmp:
+        # The journal append is part of each mutation's real cost; fsync is not
+        journal = TaskJournal(
+            f"{tmp}/task_queue.json", fsync="never", checkpoint_records=10**12
+        )
+        journaled = run(TaskQueue(journal=journal), args.ops)
+        journal.close()
+    baseline = run(_RotatingQueue(), args.baseline_ops)
+
+    print(f"{args.tasks} queued tasks, 1 in {args.scrape_every} of type 'scrape'")
+    print(
+        f"{'us/op':<24}{'indexed':>12}{'+ journal':>12}{'rotating':>12}{'speedup':>10}"
+    )
+    for op, us in indexed.items():
+        old = baseline[op]
+        print(f"{op:<24}{us:>12.2f}{journaled[op]:>12.2f}{old:>12.2f}{old / us:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
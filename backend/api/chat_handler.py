@@ -50,10 +50,22 @@ def lazy_import_memory():
         return None, None
 
 
+def lazy_import_retriever():
+    """Lazy import memory retrieval to prevent circular dependencies"""
+    try:
+        from memory.vector_store.retriever import make_retriever, format_citations
+
+        return make_retriever(), format_citations
+    except Exception as e:
+        logger.warning(f"Memory retrieval not available: {e}")
+        return None, None
+
+
 # Get cross-environment functions lazily
 request, jsonify, has_request_context = lazy_import_flask()
 tokenize, encode = lazy_import_nlp()
 embedder, log_event = lazy_import_memory()
+retriever, format_citations = lazy_import_retriever()
 
 # Use relative imports within orchestrator environment
 from agent_core.task_queue import enqueue_task
@@ -71,10 +83,26 @@ sys.path.insert(0, str(project_root))
 from environments.dashboard import logger
 
 
-def chat(user_input=None):
+def retrieve_context(vector, session_id=None, filters=None):
+    """
+    Related memories for a chat turn, within the [memory.retrieval] budget.
+    Never raises: retrieval problems yield an empty result.
+    """
+    if retriever is None:
+        return {"citations": [], "source": None}
+    try:
+        return retriever.search(vector, session_id=session_id, filters=filters)
+    except Exception as e:
+        logger.warning(f"[CHAT] Retrieval failed: {e}")
+        return {"citations": [], "source": None, "error": str(e)}
+
+
+def chat(user_input=None, session_id=None, filters=None):
     if has_request_context():
         data = request.get_json()
         user_input = data.get("message", "").strip()
+        session_id = data.get("session_id") or session_id
+        filters = data.get("filters") or filters
     elif user_input is not None:
         user_input = user_input.strip()
     else:
@@ -117,6 +145,15 @@ def chat(user_input=None):
         task = commands.parse_command(user_input)
         result = commands.execute_command(task)
 
+        # Related memory, looked up before this input is stored
+        retrieval = retrieve_context(vector, session_id, filters)
+        citations = retrieval.pop("citations", [])
+        cited = (
+            f". Related memory: {format_citations(citations)}"
+            if citations and format_citations
+            else ""
+        )
+
         # Log the interaction
         embedder.package_embedding(
             text=user_input,
@@ -137,6 +174,7 @@ def chat(user_input=None):
                 "input": user_input,
                 "task_type": task.get("type", "unknown"),
                 "agent_status": agent_status,
+                "citations": [c["id"] for c in citations],
             },
         )
 
@@ -149,9 +187,11 @@ def chat(user_input=None):
                 enqueue_task(task)
 
             response = {
-                "response": f"GremlinGPT agents processed your message. Command interpreted as: {task['type']}",
+                "response": f"GremlinGPT agents processed your message. Command interpreted as: {task['type']}{cited}",
                 "tokens": tokens,
                 "result": result,
+                "citations": citations,
+                "retrieval": retrieval,
                 "status": "active",
                 "agent_status": "running",
                 "timestamp": datetime.datetime.utcnow().isoformat(),
@@ -162,9 +202,11 @@ def chat(user_input=None):
                 logger.warning(f"[CHAT] Fallback processing for: {user_input}")
 
             response = {
-                "response": f"Processed with limited services. Command interpreted as: {task['type']}",
+                "response": f"Processed with limited services. Command interpreted as: {task['type']}{cited}",
                 "tokens": tokens,
                 "result": result,
+                "citations": citations,
+                "retrieval": retrieval,
                 "status": "degraded",
                 "note": "Core agent services not fully active",
                 "timestamp": datetime.datetime.utcnow().isoformat(),
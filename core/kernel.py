@@ -11,6 +11,7 @@
 from environments.orchestrator import CFG, logger, resolve_path, DATA_DIR, MEM
 from backend.api.api_endpoints import *
 from backend.router import route_task
+from nlp_engine.structural_diff import diff_code
 
 
 def read_file(path):
@@ -89,7 +90,7 @@ def apply_patch(file_path, new_code, reason="mutation", safe_mode=True):
 
     backup_snapshot(file_path)
 
-    diff = diff_texts(original, new_code)
+    diff = diff_code(file_path, original, new_code)
     diff_text = "\n".join(diff["diff_lines"])
     vector = embed_text(diff_text)
     patch_id = str(uuid.uuid4())
@@ -105,6 +106,9 @@ def apply_patch(file_path, new_code, reason="mutation", safe_mode=True):
             "patch_id": patch_id,
             "semantic_score": diff.get("semantic_score", 0),
             "embedding_delta": diff.get("embedding_delta", 0),
+            "min_unit_score": diff.get("min_unit_score", 0),
+            "max_unit_delta": diff.get("max_unit_delta", 0),
+            "diff_mode": diff.get("mode"),
             "timestamp": datetime.utcnow().isoformat(),
         },
     )
@@ -19,6 +19,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 from environments.orchestrator import CFG, logger, resolve_path, DATA_DIR, MEM
+from nlp_engine.structural_diff import diff_code
 
 SNAPSHOT_ROOT = Path("run/checkpoints/snapshots/")
 SNAPSHOT_ROOT.mkdir(parents=True, exist_ok=True)
@@ -104,7 +105,7 @@ def rollback(file_path, snapshot_file):
         logger.info("[SNAPSHOT] File already matches snapshot.")
         return True
 
-    diff = diff_texts(current_code, old_code)
+    diff = diff_code(file_path, current_code, old_code)
     diff_text = "\n".join(diff["diff_lines"])
     vector = embed_text(diff_text)
 
@@ -117,6 +118,9 @@ def rollback(file_path, snapshot_file):
             "type": "rollback",
             "semantic_score": diff["semantic_score"],
             "embedding_delta": diff["embedding_delta"],
+            "min_unit_score": diff["min_unit_score"],
+            "max_unit_delta": diff["max_unit_delta"],
+            "diff_mode": diff.get("mode"),
             "lineage_id": lineage_id,
             "timestamp": datetime.utcnow().isoformat(),
         },
@@ -12,6 +12,12 @@
 import os
 import uuid
 import json
+import shutil
+import threading
+from datetime import datetime, timezone
+
+import numpy as np
+
 from environments.memory import (
     CFG,
     logger,
@@ -91,18 +97,43 @@ for path in (FAISS_DIR, CHROMA_DIR, LOCAL_INDEX_PATH):
         logger.error(f"[EMBEDDER] Failed to create directory {path}: {e}")
 
 # --- Chroma Client Setup ---
+# One collection per source dimension: each model's vectors (reduced or
+# not) live in their own space. The configured model keeps "gremlin_memory".
+CHROMA_COLLECTION = "gremlin_memory"
+chroma_client = None
+chroma_collections = {}
+
+
+def chroma_collection(source_dim):
+    """The collection for vectors from source_dim-dim models, or None."""
+    if chroma_client is None:
+        return None
+    coll = chroma_collections.get(source_dim)
+    if coll is None:
+        name = (
+            CHROMA_COLLECTION
+            if source_dim == DIMENSION
+            else f"{CHROMA_COLLECTION}_{source_dim}"
+        )
+        try:
+            coll = chroma_client.get_or_create_collection(name=name)
+        except Exception as e:
+            logger.error(f"[CHROMA] Failed to open collection {name}: {e}")
+            return None
+        coll = chroma_collections.setdefault(source_dim, coll)
+    return coll
+
+
 if HAS_CHROMADB and chromadb:
     try:
         chroma_client = chromadb.PersistentClient(path=CHROMA_DIR)
-        collection = chroma_client.get_or_create_collection(name="gremlin_memory")
     except Exception as e:
         logger.error(f"[EMBEDDER] Failed to initialize Chroma client: {e}")
-        collection = None
-else:
-    collection = None
+collection = chroma_collection(DIMENSION)
 
 
-def add_to_chroma(text, emb_id, vector, meta):
+def add_to_chroma(text, emb_id, vector, meta, source_dim=DIMENSION):
+    collection = chroma_collection(source_dim)
     if not collection:
         logger.warning(f"[CHROMA] Skipping add; collection not available")
         return
@@ -119,23 +150,86 @@ def add_to_chroma(text, emb_id, vector, meta):
 
 
 # --- FAISS Index Setup ---
+# One index per source dimension, like the collections above; the
+# configured model's index keeps the original file name
 FAISS_INDEX_PATH = os.path.join(FAISS_DIR, "faiss_index.index")
-try:
-    if faiss and os.path.exists(FAISS_INDEX_PATH):
-        faiss_index = faiss.read_index(FAISS_INDEX_PATH)  # type: ignore
-        logger.info(f"[FAISS] Loaded index from {FAISS_INDEX_PATH}")
-    elif faiss:
-        faiss_index = faiss.IndexFlatL2(DIMENSION)  # type: ignore
-        logger.info("[FAISS] Initialized new IndexFlatL2")
-    else:
-        faiss_index = None
+
+
+def faiss_index_path(source_dim):
+    if source_dim == DIMENSION:
+        return FAISS_INDEX_PATH
+    return os.path.join(FAISS_DIR, f"faiss_index_{source_dim}.index")
+
+
+# --- Dimensionality Reduction (persisted next to the FAISS index) ---
+from memory.vector_store.reducer import make_reducer
+
+REDUCER_PATH = os.path.join(FAISS_DIR, "reducer.npz")
+reducer = make_reducer(REDUCER_PATH)
+INDEX_DIM = reducer.target_dim if reducer else DIMENSION
+faiss_indexes = {}
+_needs_reindex = False
+
+
+def index_dim(source_dim):
+    """Dimension of the index that source_dim-dim vectors go to."""
+    proj = reducer.projection(source_dim) if reducer else None
+    return proj.target_dim if proj is not None else source_dim
+
+
+def faiss_index_for(source_dim):
+    """The FAISS index for vectors from source_dim-dim models, created on first use."""
+    if not faiss:
+        return None
+    index = faiss_indexes.get(source_dim)
+    if index is None:
+        try:
+            index = faiss.IndexFlatL2(index_dim(source_dim))  # type: ignore
+        except Exception as e:
+            logger.error(f"[FAISS] Failed to init index for {source_dim} dims: {e}")
+            return None
+        index = faiss_indexes.setdefault(source_dim, index)
+        logger.info(f"[FAISS] Initialized new IndexFlatL2 for {source_dim} dims")
+    return index
+
+
+def _load_faiss_indexes():
+    global _needs_reindex
+    if not faiss:
         logger.error("[FAISS] faiss unavailable; index not initialized")
+        return
+    for fname in sorted(os.listdir(FAISS_DIR)):
+        if fname == os.path.basename(FAISS_INDEX_PATH):
+            source_dim = DIMENSION
+        elif fname.startswith("faiss_index_") and fname.endswith(".index"):
+            source_dim = int(fname[len("faiss_index_") : -len(".index")])
+        else:
+            continue
+        path = os.path.join(FAISS_DIR, fname)
+        try:
+            index = faiss.read_index(path)  # type: ignore
+        except Exception as e:
+            logger.error(f"[FAISS] Failed to load index {path}: {e}")
+            continue
+        logger.info(f"[FAISS] Loaded index from {path}")
+        if index.d != index_dim(source_dim):
+            logger.warning(
+                f"[FAISS] Index for {source_dim} dims has {index.d}, "
+                f"expected {index_dim(source_dim)}; rebuilding"
+            )
+            _needs_reindex = True
+            continue
+        faiss_indexes[source_dim] = index
+
+
+try:
+    _load_faiss_indexes()
 except Exception as e:
-    logger.error(f"[FAISS] Failed to load or init index: {e}")
-    faiss_index = None
+    logger.error(f"[FAISS] Failed to load indexes: {e}")
 
 
-def add_to_faiss(vector, emb_id):
+def add_to_faiss(vector, emb_id, source_dim=DIMENSION):
+    faiss_index = faiss_index_for(source_dim)
     if not faiss_index:
         logger.warning(f"[FAISS] Skipping add; index not available")
         return
@@ -197,7 +291,7 @@ def add_to_faiss(vector, emb_id):
                 f"[FAISS] Index object missing valid 'add' or 'add_with_ids' method. Type: {type(faiss_index)}"
             )
             return
-        faiss.write_index(faiss_index, FAISS_INDEX_PATH)  # type: ignore
+        faiss.write_index(faiss_index, faiss_index_path(source_dim))  # type: ignore
         logger.info(f"[FAISS] Added {emb_id}")
     except Exception as e:
         logger.error(f"[FAISS] Add failed for {emb_id}: {e}")
@@ -207,19 +301,27 @@ def get_index_info():
     """Return diagnostic info about FAISS and Chroma index types and available methods."""
     info = {}
     # FAISS
-    if "faiss_index" in globals() and faiss_index:
+    faiss_index = next(iter(faiss_indexes.values()), None)
+    if faiss_index:
         info["faiss_type"] = str(type(faiss_index))
         info["faiss_methods"] = dir(faiss_index)
     else:
         info["faiss_type"] = None
         info["faiss_methods"] = []
+    info["faiss_indexes"] = {
+        dim: {"d": index.d, "ntotal": index.ntotal}
+        for dim, index in faiss_indexes.items()
+    }
     # Chroma
-    if "collection" in globals() and collection:
+    if collection:
         info["chroma_type"] = str(type(collection))
         info["chroma_methods"] = dir(collection)
     else:
         info["chroma_type"] = None
         info["chroma_methods"] = []
+    info["chroma_collections"] = {
+        dim: coll.name for dim, coll in chroma_collections.items()
+    }
     return info
 
 
@@ -273,23 +375,30 @@ def get_backend_status():
     """Get status of both FAISS and Chroma backends."""
     status = {
         "current_backend": dashboard_selected_backend,
-        "faiss_available": faiss is not None and faiss_index is not None,
+        "faiss_available": faiss is not None,
         "chromadb_available": chromadb is not None and collection is not None,
         "faiss_index_count": 0,
         "chroma_collection_count": 0,
+        "index_dim": INDEX_DIM,
+        "index_dims": {dim: index_dim(dim) for dim in faiss_indexes},
+        "reduction": reducer.stats() if reducer else None,
     }
 
-    # Get FAISS count
+    # Get FAISS count, summed over the per-dimension indexes
     if status["faiss_available"]:
         try:
-            status["faiss_index_count"] = faiss_index.ntotal  # type: ignore
+            status["faiss_index_count"] = sum(
+                index.ntotal for index in list(faiss_indexes.values())
+            )
         except Exception as e:
             logger.warning(f"[EMBEDDER] Failed to get FAISS count: {e}")
 
-    # Get Chroma count
+    # Get Chroma count, summed over the per-dimension collections
     if status["chromadb_available"]:
         try:
-            status["chroma_collection_count"] = collection.count()  # type: ignore
+            status["chroma_collection_count"] = sum(
+                coll.count() for coll in list(chroma_collections.values())
+            )
         except Exception as e:
             logger.warning(f"[EMBEDDER] Failed to get Chroma count: {e}")
 
@@ -310,6 +419,33 @@ else:
 
 memory_vectors = {}
 
+# Ingestion log: ids in the order they entered memory_vectors, so readers
+# (the retriever) take only what is new instead of iterating the dict while
+# it is written. Appended under _ingest_lock; a clear starts a new generation.
+_ingest_lock = threading.Lock()
+ingested_ids = []
+ingest_generation = 0
+
+
+def _store(embedding):
+    """Puts embedding in memory_vectors, logging its id if it is new."""
+    with _ingest_lock:
+        if embedding["id"] not in memory_vectors:
+            ingested_ids.append(embedding["id"])
+        memory_vectors[embedding["id"]] = embedding
+
+
+def ingested_since(generation, position):
+    """
+    Returns (current generation, ids): the ids logged after position when
+    generation is current, else every id of the current generation (the
+    store was cleared since, so the caller starts over).
+    """
+    with _ingest_lock:
+        if generation != ingest_generation:
+            position = 0
+        return ingest_generation, ingested_ids[position:]
+
 
 # --- Core Embedding Functions ---
 def embed_text(text):
@@ -325,6 +461,97 @@ def embed_text(text):
         return np.zeros(DIMENSION, dtype="float32")
 
 
+def index_vector(vector):
+    """
+    The form of vector that goes into (or queries) the FAISS/Chroma index
+    for its source dimension: reduced by that dimension's map when a
+    reducer is configured, else unchanged.
+    """
+    if reducer is None:
+        return vector
+    return reducer.reduce(vector)
+
+
+def search_index(vector, k=10):
+    """
+    Nearest stored vectors on the current backend, looked up in the index
+    for len(vector): FAISS gives (distances, ids), Chroma a query result.
+    None when that dimension has no index yet.
+    """
+    source_dim, query = len(vector), index_vector(vector)
+    if get_current_backend() == "chromadb":
+        coll = chroma_collection(source_dim)
+        if coll is None:
+            return None
+        return coll.query(query_embeddings=[[float(x) for x in query]], n_results=k)
+    index = faiss_indexes.get(source_dim)
+    if index is None or not index.ntotal:
+        return None
+    distances, ids = index.search(np.asarray(query, dtype="float32").reshape(1, -1), k)
+    return distances[0].tolist(), ids[0].tolist()
+
+
+def stored_matrices():
+    """Stored (unreduced) embeddings grouped as {dimension: float32 matrix}."""
+    if not memory_vectors:
+        _load_from_disk()
+    rows = {}
+    for emb in memory_vectors.values():
+        vec = emb.get("embedding")
+        if vec:
+            rows.setdefault(len(vec), []).append(vec)
+    return {dim: np.asarray(vecs, dtype=np.float32) for dim, vecs in rows.items()}
+
+
+def rebuild_index():
+    """Re-adds every stored embedding to fresh per-source-dimension FAISS indexes."""
+    if not faiss:
+        return 0
+    groups = {}
+    for emb in list(memory_vectors.values()):
+        vec = emb.get("embedding")
+        if vec:
+            groups.setdefault(len(vec), []).append(index_vector(vec))
+    total = 0
+    for source_dim in sorted(set(groups) | set(faiss_indexes)):
+        vectors = groups.get(source_dim, [])
+        index = faiss.IndexFlatL2(index_dim(source_dim))  # type: ignore
+        if vectors:
+            index.add(np.asarray(vectors, dtype="float32"))  # type: ignore
+        faiss.write_index(index, faiss_index_path(source_dim))  # type: ignore
+        faiss_indexes[source_dim] = index
+        total += len(vectors)
+        logger.info(
+            f"[FAISS] Rebuilt {source_dim}-dim index: "
+            f"{len(vectors)} vectors x {index.d} dims"
+        )
+    return total
+
+
+def fit_reducer(**overrides):
+    """
+    Fits the reducer on the stored embeddings, saves it with the index and
+    rebuilds the index in the reduced space. Returns the reducer.
+    """
+    global reducer, INDEX_DIM
+    from memory.vector_store.reducer import EmbeddingReducer, REDUCTION_CFG
+
+    opts = dict(REDUCTION_CFG, **overrides)
+    fitted = EmbeddingReducer(
+        target_dim=opts.get("target_dim", 256),
+        method=opts.get("method", "pca"),
+        fallback=opts.get("fallback", "random"),
+        seed=opts.get("seed", 0),
+        path=REDUCER_PATH,
+    )
+    report = fitted.fit(stored_matrices(), min_samples=opts.get("min_samples"))
+    fitted.save()
+    reducer, INDEX_DIM = fitted, fitted.target_dim
+    logger.info(f"[EMBEDDER] Reducer fitted, retained variance by dim: {report}")
+    rebuild_index()
+    return fitted
+
+
 def package_embedding(text, vector, meta):
     emb_id = str(uuid.uuid4())
     if not isinstance(meta, dict):
@@ -342,13 +569,16 @@ def package_embedding(text, vector, meta):
     }
 
     # Use current backend selection (dynamically determined)
+    # The index for the vector's source dimension gets the reduced vector;
+    # the stored record keeps the original
     current_backend = get_current_backend()
-    if current_backend == "faiss" and faiss_index is not None:
-        add_to_faiss(vector, emb_id)
-    if current_backend == "chromadb" and collection is not None:
-        add_to_chroma(text, emb_id, vector, meta)
+    source_dim, indexed = len(vector), index_vector(vector)
+    if current_backend == "faiss" and faiss is not None:
+        add_to_faiss(indexed, emb_id, source_dim)
+    elif current_backend == "chromadb" and chroma_client is not None:
+        add_to_chroma(text, emb_id, indexed, meta, source_dim)
 
-    memory_vectors[emb_id] = embedding
+    _store(embedding)
     try:
         _write_to_disk(embedding)
         logger.info(f"[EMBEDDER] Stored embedding: {emb_id} using {current_backend}")
@@ -413,7 +643,7 @@ def _load_from_disk():
         try:
             with open(fpath, "r") as f:
                 emb = json.load(f)
-            memory_vectors[emb["id"]] = emb
+            _store(emb)
         except Exception as e:
             logger.warning(f"[EMBEDDER] Failed to load {fname}: {e}")
 
@@ -436,7 +666,11 @@ def get_memory_graph():
 
 
 def repair_index():
-    memory_vectors.clear()
+    global ingest_generation
+    with _ingest_lock:
+        memory_vectors.clear()
+        ingested_ids.clear()
+        ingest_generation += 1
     _load_from_disk()
     logger.info("[EMBEDDER] Index repaired")
 
@@ -452,5 +686,7 @@ def inject_watermark(origin="unknown"):
 try:
     _load_from_disk()
     logger.info("[EMBEDDER] Initial disk load complete")
+    if _needs_reindex:
+        rebuild_index()
 except Exception as e:
     logger.error(f"[EMBEDDER] Initial load failed: {e}")
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: Memory Embedding Reducer (PCA / random projection)
+
+import argparse
+import os
+import threading
+
+import numpy as np
+
+from environments.memory import CFG, logger
+
+REDUCTION_CFG = CFG.get("memory", {}).get("reduction", {})
+METHODS = ("pca", "random")
+
+
+def _as_matrix(vectors):
+    return np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+
+
+def _unit_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
+
+
+class Projection:
+    """
+    A linear map from one source dimension to target_dim:
+    reduced = (x - mean) @ components.T
+
+    PCA projections are fitted on stored vectors; random projections are
+    seeded orthonormal Gaussian maps that need no data.
+    """
+
+    def __init__(self, method, mean, components, retained_variance=None, samples=0):
+        self.method = method
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)
+        self.retained_variance = retained_variance
+        self.samples = samples
+
+    @property
+    def source_dim(self):
+        return self.components.shape[1]
+
+    @property
+    def target_dim(self):
+        return self.components.shape[0]
+
+    def transform(self, vectors):
+        return (_as_matrix(vectors) - self.mean) @ self.components.T
+
+    @classmethod
+    def fit_pca(cls, matrix, target_dim):
+        """
+        Principal components of unit-normalized rows (cosine geometry).
+
+        Raises:
+            ValueError: With fewer vectors than target_dim (the map would
+                come out narrower than the index)
+        """
+        data = _unit_rows(_as_matrix(matrix))
+        target_dim = min(target_dim, data.shape[1])
+        if data.shape[0] < max(target_dim, 2):
+            raise ValueError(
+                f"PCA to {target_dim} dims needs at least {max(target_dim, 2)} "
+                f"vectors, got {data.shape[0]}"
+            )
+        mean = data.mean(axis=0)
+        _, singular, vt = np.linalg.svd(data - mean, full_matrices=False)
+        variance = singular**2
+        retained = float(variance[:target_dim].sum() / variance.sum())
+        return cls("pca", mean, vt[:target_dim], retained, data.shape[0])
+
+    @classmethod
+    def random(cls, source_dim, target_dim, seed=0):
+        rng = np.random.default_rng(seed + source_dim)
+        gaussian = rng.standard_normal((source_dim, min(target_dim, source_dim)))
+        q, _ = np.linalg.qr(gaussian)
+        return cls("random", np.zeros(source_dim, np.float32), q.T)
+
+    def variance_on(self, matrix):
+        """Share of the variance of matrix (unit rows, centered) this map keeps."""
+        data = _unit_rows(_as_matrix(matrix))
+        data = data - data.mean(axis=0)
+        total = float((data**2).sum())
+        kept = float(((data @ self.components.T) ** 2).sum())
+        return kept / total if total else 1.0
+
+
+class EmbeddingReducer:
+    """
+    Maps stored embeddings to target_dim before they reach a vector index,
+    and queries the same way.
+
+    One Projection per source dimension (bert 768, MiniLM 384, ...). Each
+    source dimension is reduced by its own map, so its reduced vectors are
+    only comparable with each other and must go to an index of their own:
+    the embedder and the retriever both keep one index per source
+    dimension. Fitted PCA maps come from fit(); dimensions without one get
+    a seeded random projection when fallback is "random", or pass through
+    unchanged when it is "none". The state is saved as one .npz next to
+    the index.
+    """
+
+    def __init__(
+        self, target_dim=256, method="pca", fallback="random", seed=0, path=None
+    ):
+        if method not in METHODS:
+            raise ValueError(f"Unknown reduction method: {method}")
+        self.target_dim = target_dim
+        self.method = method
+        self.fallback = fallback
+        self.seed = seed
+        self.path = path
+        self.projections = {}
+        self._lock = threading.Lock()
+
+    def projection(self, source_dim):
+        with self._lock:
+            proj = self.projections.get(source_dim)
+            if proj is None and source_dim > self.target_dim:
+                if self.method == "random" or self.fallback == "random":
+                    proj = Projection.random(source_dim, self.target_dim, self.seed)
+                    self.projections[source_dim] = proj
+            return proj
+
+    def reduce(self, vector):
+        """Reduced float32 vector, or the input unchanged if no map applies."""
+        vec = np.asarray(vector, dtype=np.float32).ravel()
+        proj = self.projection(vec.shape[0])
+        return vec if proj is None else proj.transform(vec)[0]
+
+    def reduce_many(self, matrix):
+        matrix = _as_matrix(matrix)
+        proj = self.projection(matrix.shape[1])
+        return matrix if proj is None else proj.transform(matrix)
+
+    def fit(self, vectors_by_dim, min_samples=None):
+        """
+        Fits one projection per source dimension from {dim: matrix}. With
+        method "pca", dimensions with fewer than min_samples vectors (never
+        less than target_dim) keep their fallback. Returns {dim: retained variance}.
+        """
+        min_samples = max(min_samples or 0, self.target_dim)
+        report = {}
+        for dim, matrix in vectors_by_dim.items():
+            matrix = _as_matrix(matrix)
+            if dim <= self.target_dim:
+                continue
+            if self.method == "pca" and matrix.shape[0] >= min_samples:
+                proj = Projection.fit_pca(matrix, self.target_dim)
+            elif self.method == "pca" and self.fallback != "random":
+                continue
+            else:
+                proj = Projection.random(dim, self.target_dim, self.seed)
+                proj.retained_variance = proj.variance_on(matrix)
+                proj.samples = matrix.shape[0]
+            with self._lock:
+                self.projections[dim] = proj
+            report[dim] = round(proj.retained_variance, 4)
+        return report
+
+    def recall_at_k(self, matrix, k=10, queries=100, seed=0):
+        """
+        Mean overlap between the cosine top-k in the source space and in
+        the reduced space, using up to queries rows of matrix as queries.
+        """
+        data = _unit_rows(_as_matrix(matrix))
+        if data.shape[0] <= k:
+            return 1.0
+        reduced = _unit_rows(self.reduce_many(data))
+        rng = np.random.default_rng(seed)
+        picks = rng.choice(data.shape[0], min(queries, data.shape[0]), replace=False)
+        hits = 0
+        for i in picks:
+            full = data @ data[i]
+            small = reduced @ reduced[i]
+            full[i] = small[i] = -np.inf  # the query itself
+            top_full = set(np.argpartition(-full, k)[:k])
+            top_small = set(np.argpartition(-small, k)[:k])
+            hits += len(top_full & top_small)
+        return round(hits / (len(picks) * k), 4)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "target_dim": self.target_dim,
+                "method": self.method,
+                "projections": {
+                    dim: {
+                        "method": p.method,
+                        "retained_variance": (
+                            round(p.retained_variance, 4)
+                            if p.retained_variance is not None
+                            else None
+                        ),
+                        "samples": p.samples,
+                    }
+                    for dim, p in self.projections.items()
+                },
+            }
+
+    def save(self, path=None):
+        path = path or self.path
+        arrays = {
+            "meta": np.array([self.target_dim, self.seed], dtype=np.int64),
+            "method": np.array(self.method),
+            "fallback": np.array(self.fallback),
+        }
+        with self._lock:
+            for dim, p in self.projections.items():
+                arrays[f"{dim}_method"] = np.array(p.method)
+                arrays[f"{dim}_mean"] = p.mean
+                arrays[f"{dim}_components"] = p.components
+                arrays[f"{dim}_stats"] = np.array(
+                    [
+                        -1.0 if p.retained_variance is None else p.retained_variance,
+                        p.samples,
+                    ]
+                )
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+        logger.info(f"[REDUCER] Saved {len(self.projections)} projections to {path}")
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            target_dim, seed = (int(v) for v in data["meta"])
+            reducer = cls(
+                target_dim=target_dim,
+                method=str(data["method"]),
+                fallback=str(data["fallback"]),
+                seed=seed,
+                path=path,
+            )
+            for key in data.files:
+                if not key.endswith("_components"):
+                    continue
+                dim = int(key.split("_", 1)[0])
+                retained, samples = data[f"{dim}_stats"]
+                reducer.projections[dim] = Projection(
+                    str(data[f"{dim}_method"]),
+                    data[f"{dim}_mean"],
+                    data[key],
+                    None if retained < 0 else float(retained),
+                    int(samples),
+                )
+        return reducer
+
+
+def make_reducer(path, **overrides):
+    """
+    Loads the reducer persisted at path, or builds one from the
+    [memory.reduction] config section. Returns None when disabled.
+    """
+    opts = dict(REDUCTION_CFG, **overrides)
+    if not opts.get("enabled", False):
+        return None
+    if os.path.exists(path):
+        try:
+            reducer = EmbeddingReducer.load(path)
+            if reducer.target_dim == opts.get("target_dim", reducer.target_dim):
+                return reducer
+            logger.warning(
+                f"[REDUCER] {path} targets {reducer.target_dim} dims, config wants "
+                f"{opts.get('target_dim')}; refit with `python -m memory.vector_store.reducer --fit`"
+            )
+        except Exception as e:
+            logger.error(f"[REDUCER] Failed to load {path}: {e}")
+    return EmbeddingReducer(
+        target_dim=opts.get("target_dim", 256),
+        method=opts.get("method", "pca"),
+        fallback=opts.get("fallback", "random"),
+        seed=opts.get("seed", 0),
+        path=path,
+    )
+
+
+def _main():
+    parser = argparse.ArgumentParser(
+        description="Fit or evaluate the stored-embedding reducer"
+    )
+    parser.add_argument("--fit", action="store_true", help="fit, save and reindex")
+    parser.add_argument("--method", choices=METHODS)
+    parser.add_argument("--dim", type=int, help="target dimension")
+    parser.add_argument("--k", type=int, default=10, help="recall@k to report")
+    args = parser.parse_args()
+
+    from memory.vector_store import embedder
+
+    overrides = {"enabled": True}
+    if args.method:
+        overrides["method"] = args.method
+    if args.dim:
+        overrides["target_dim"] = args.dim
+    matrices = embedder.stored_matrices()
+    if args.fit:
+        reducer = embedder.fit_reducer(**overrides)
+    else:
+        reducer = embedder.reducer or make_reducer(embedder.REDUCER_PATH, **overrides)
+    for dim, matrix in sorted(matrices.items()):
+        proj = reducer.projection(dim)
+        retained = proj.variance_on(matrix) if proj is not None else 1.0
+        print(
+            f"{dim:>5} -> {proj.target_dim if proj else dim:<4} "
+            f"{(proj.method if proj else 'none'):<6} n={matrix.shape[0]:<7} "
+            f"variance={retained:.4f} recall@{args.k}={reducer.recall_at_k(matrix, args.k):.4f}"
+        )
+
+
+__all__ = ["Projection", "EmbeddingReducer", "make_reducer"]
+
+
+if __name__ == "__main__":
+    _main()
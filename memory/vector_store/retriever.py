@@ -0,0 +1,400 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: Memory Retriever (kNN over stored embeddings)
+
+import threading
+import time
+from collections import Counter, OrderedDict
+
+import numpy as np
+
+from environments.memory import CFG, logger
+
+RETRIEVAL_CFG = CFG.get("memory", {}).get("retrieval", {})
+
+# Text written by embedder.inject_watermark; never useful as context
+WATERMARK_PREFIX = "Watermark from "
+
+
+def _unit(vector):
+    vec = np.asarray(vector, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm else None
+
+
+def _normalize_filters(filters):
+    """{"origin": "x" | [..], "type": ...} -> {"origin": frozenset, ...}"""
+    out = {}
+    for field, allowed in (filters or {}).items():
+        if allowed in (None, "", [], ()):
+            continue
+        if isinstance(allowed, str):
+            allowed = [allowed]
+        out[field] = frozenset(str(a) for a in allowed)
+    return out
+
+
+def _narrow_filters(base, extra):
+    """base narrowed by extra: allowed sets of a field in both intersect."""
+    out = dict(base)
+    for field, allowed in extra.items():
+        out[field] = out[field] & allowed if field in out else allowed
+    return out
+
+
+class _DimIndex:
+    """
+    Unit-normalized rows of one source embedding dimension (reduced when
+    the source has a reducer), appended in place. Row masks of the
+    max_masks most recently used filters are cached and extended on flush.
+    """
+
+    def __init__(self, dim, source_dim=None, max_masks=16):
+        self.dim = dim
+        self.source_dim = source_dim or dim
+        self.max_masks = max_masks
+        self.ids = []
+        self.metas = []
+        self.texts = []
+        self._rows = np.empty((0, dim), dtype=np.float32)
+        self._pending = []
+        self.masks = OrderedDict()
+
+    @property
+    def matrix(self):
+        return self._rows[: len(self.ids) - len(self._pending)]
+
+    def add(self, emb_id, unit, meta, text):
+        self.ids.append(emb_id)
+        self.metas.append(meta)
+        self.texts.append(text)
+        self._pending.append(unit)
+
+    def flush(self):
+        if not self._pending:
+            return
+        start = len(self.ids) - len(self._pending)
+        if len(self.ids) > self._rows.shape[0]:
+            # Grow by doubling so appends stay amortized O(1) per row
+            rows = np.empty((max(len(self.ids), 2 * start, 64), self.dim), np.float32)
+            rows[:start] = self._rows[:start]
+            self._rows = rows
+        self._rows[start : len(self.ids)] = np.stack(self._pending)
+        self._pending = []
+        for key, mask in self.masks.items():
+            self.masks[key] = np.concatenate([mask, self._match(key, start)])
+
+    def _match(self, key, start=0):
+        return np.fromiter(
+            (
+                all(str(meta.get(f, "")) in allowed for f, allowed in key)
+                for meta in self.metas[start:]
+            ),
+            dtype=bool,
+            count=len(self.metas) - start,
+        )
+
+    def mask(self, filters):
+        """Boolean row mask for normalized filters, extended as rows arrive."""
+        if not filters:
+            return None
+        key = tuple(sorted(filters.items()))
+        mask = self.masks.get(key)
+        if mask is None:
+            mask = self.masks[key] = self._match(key)
+            while len(self.masks) > self.max_masks:
+                self.masks.popitem(last=False)
+        self.masks.move_to_end(key)
+        return mask
+
+
+class MemoryRetriever:
+    """
+    Top-k cosine retrieval over the embedder's memory_vectors.
+
+    Stored vectors are normalized once into per-dimension matrices that
+    grow as new embeddings are packaged. A query scans them in blocks of
+    block_rows and stops after time_budget_ms, returning the best found so far
+    (flagged "truncated"). Each session keeps a small LRU of the neighbors
+    it retrieved recently; when they already answer a query (k results
+    scoring at least hot_accept) the full scan is skipped.
+    """
+
+    def __init__(
+        self,
+        source=None,
+        k=5,
+        time_budget_ms=50.0,
+        min_score=0.3,
+        hot_accept=0.8,
+        hot_size=64,
+        max_sessions=256,
+        block_rows=4096,
+        snippet_chars=240,
+        filters=None,
+        max_masks=16,
+    ):
+        if source is None:
+            from memory.vector_store import embedder as source
+        self.source = source
+        self.k = k
+        self.time_budget_ms = time_budget_ms
+        self.min_score = min_score
+        self.hot_accept = hot_accept
+        self.hot_size = hot_size
+        self.max_sessions = max_sessions
+        self.block_rows = block_rows
+        self.snippet_chars = snippet_chars
+        self.filters = _normalize_filters(filters)
+        self.max_masks = max_masks
+        self._indexes = {}
+        self._synced = 0
+        self._generation = 0
+        self._reducer = None
+        self._hot = OrderedDict()  # session_id -> OrderedDict(emb_id -> hit)
+        self._lock = threading.Lock()
+        self.counters = Counter()
+
+    # ── index maintenance ───────────────────────────────────
+
+    def _sync(self):
+        """Indexes embeddings packaged since the last query."""
+        vectors = getattr(self.source, "memory_vectors", None) or {}
+        reducer = getattr(self.source, "reducer", None)
+        if reducer is not self._reducer:
+            # fit_reducer() changed the reduced space
+            self._reducer = reducer
+            self._indexes.clear()
+            self._synced = 0
+            self._hot.clear()
+        generation, ids = self._drain(vectors)
+        if generation != self._generation:
+            # repair_index() or a reload cleared the store
+            self._indexes.clear()
+            self._generation = generation
+            self._synced = 0
+        self._synced += len(ids)
+        touched = set()
+        for emb_id in ids:
+            emb = vectors.get(emb_id)
+            if emb is None:
+                continue
+            text = emb.get("text") or ""
+            if text.startswith(WATERMARK_PREFIX):
+                continue
+            raw = emb.get("embedding") or ()
+            unit = _unit(self._reduce(raw))
+            if unit is None:
+                continue
+            # Keyed by source dimension: vectors of different models never mix
+            index = self._indexes.get(len(raw))
+            if index is None:
+                index = self._indexes[len(raw)] = _DimIndex(
+                    unit.shape[0], len(raw), self.max_masks
+                )
+            index.add(emb_id, unit, emb.get("meta") or {}, text)
+            touched.add(index)
+        for index in touched:
+            index.flush()
+
+    def _drain(self, vectors):
+        """(generation, ids) packaged since the last sync."""
+        drain = getattr(self.source, "ingested_since", None)
+        if drain is not None:
+            return drain(self._generation, self._synced)
+        # Sources without a log (a plain dict): only grows between clears
+        ids = list(vectors)
+        if len(ids) < self._synced:
+            return self._generation + 1, ids
+        return self._generation, ids[self._synced :]
+
+    def _reduce(self, vector):
+        if self._reducer is None or not len(vector):
+            return vector
+        return self._reducer.reduce(vector)
+
+    # ── query ───────────────────────────────────────────────
+
+    def _hit(self, index, row, score):
+        meta = index.metas[row]
+        return {
+            "id": index.ids[row],
+            "score": round(float(score), 4),
+            "snippet": index.texts[row][: self.snippet_chars],
+            "origin": meta.get("origin") or meta.get("source"),
+            "type": meta.get("type"),
+            "timestamp": meta.get("timestamp"),
+            "_unit": index.matrix[row],
+            "_meta": meta,
+            "_source_dim": index.source_dim,
+        }
+
+    def _from_hot(self, session_id, query, source_dim, k, filters):
+        hot = self._hot.get(session_id)
+        if not hot:
+            return []
+        scored = []
+        for hit in hot.values():
+            if hit["_source_dim"] != source_dim:
+                continue
+            if any(str(hit["_meta"].get(f, "")) not in a for f, a in filters.items()):
+                continue
+            scored.append((float(hit["_unit"] @ query), hit))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [dict(hit, score=round(s, 4)) for s, hit in scored[:k]]
+
+    def _remember(self, session_id, hits):
+        hot = self._hot.get(session_id)
+        if hot is None:
+            hot = self._hot[session_id] = OrderedDict()
+            while len(self._hot) > self.max_sessions:
+                self._hot.popitem(last=False)
+        self._hot.move_to_end(session_id)
+        for hit in hits:
+            hot[hit["id"]] = hit
+            hot.move_to_end(hit["id"])
+        while len(hot) > self.hot_size:
+            hot.popitem(last=False)
+
+    def _scan(self, index, query, k, filters, deadline):
+        mask = index.mask(filters)
+        best_scores = np.empty(0, dtype=np.float32)
+        best_rows = np.empty(0, dtype=np.int64)
+        scanned, truncated = 0, False
+        rows = index.matrix.shape[0]
+        for start in range(0, rows, self.block_rows):
+            if scanned and time.perf_counter() > deadline:
+                truncated = True
+                break
+            block = index.matrix[start : start + self.block_rows]
+            scores = block @ query
+            if mask is not None:
+                scores = np.where(mask[start : start + len(block)], scores, -np.inf)
+            scanned += len(block)
+            top = min(k, len(scores))
+            local = np.argpartition(-scores, top - 1)[:top]
+            best_scores = np.concatenate([best_scores, scores[local]])
+            best_rows = np.concatenate([best_rows, local + start])
+            if len(best_scores) > k:
+                keep = np.argpartition(-best_scores, k - 1)[:k]
+                best_scores, best_rows = best_scores[keep], best_rows[keep]
+        order = np.argsort(-best_scores)
+        hits = [
+            self._hit(index, int(best_rows[i]), best_scores[i])
+            for i in order
+            if best_scores[i] >= self.min_score
+        ]
+        return hits, scanned, truncated
+
+    def search(self, vector, session_id=None, k=None, filters=None):
+        """
+        Returns {"citations": [...], "source", "scanned", "truncated",
+        "elapsed_ms"} for the k stored memories closest to vector.
+
+        filters ({"origin": [...], "type": [...]}) narrow the configured
+        defaults (a field set in both keeps only values allowed by both);
+        a memory matches when every filtered meta field is in the allowed set.
+        """
+        started = time.perf_counter()
+        k = max(1, int(k or self.k))
+        merged = _narrow_filters(self.filters, _normalize_filters(filters))
+        raw = np.asarray(vector, dtype=np.float32).ravel()
+        result = {"citations": [], "source": None, "scanned": 0, "truncated": False}
+
+        with self._lock:
+            self._sync()
+            query = _unit(self._reduce(raw))
+            if query is None:
+                self.counters["empty_queries"] += 1
+                return self._finish(result, started)
+            if session_id:
+                hot = self._from_hot(session_id, query, raw.shape[0], k, merged)
+                if len(hot) >= k and hot[-1]["score"] >= self.hot_accept:
+                    self.counters["hot_hits"] += 1
+                    self._remember(session_id, hot)
+                    result.update(citations=hot, source="hot")
+                    return self._finish(result, started)
+            deadline = time.perf_counter() + self.time_budget_ms / 1000.0
+            index = self._indexes.get(raw.shape[0])
+            if index is None or not index.ids:
+                self.counters["misses"] += 1
+                return self._finish(result, started)
+            hits, scanned, truncated = self._scan(index, query, k, merged, deadline)
+            self.counters["scans"] += 1
+            if truncated:
+                self.counters["truncated"] += 1
+            if session_id and hits:
+                self._remember(session_id, hits)
+        result.update(
+            citations=hits, source="index", scanned=scanned, truncated=truncated
+        )
+        return self._finish(result, started)
+
+    def _finish(self, result, started):
+        result["citations"] = [
+            {key: value for key, value in hit.items() if not key.startswith("_")}
+            for hit in result["citations"]
+        ]
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000.0, 3)
+        return result
+
+    def forget(self, session_id):
+        with self._lock:
+            self._hot.pop(session_id, None)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "indexed": sum(len(ix.ids) for ix in self._indexes.values()),
+                "dimensions": {
+                    dim: ix.dim for dim, ix in sorted(self._indexes.items())
+                },
+                "sessions": len(self._hot),
+                "k": self.k,
+                "time_budget_ms": self.time_budget_ms,
+                "counters": dict(self.counters),
+            }
+
+
+def make_retriever(**overrides):
+    """Builds a retriever from the [memory.retrieval] config section."""
+    opts = dict(RETRIEVAL_CFG, **overrides)
+    if not opts.get("enabled", True):
+        return None
+    return MemoryRetriever(
+        source=opts.get("source"),
+        k=opts.get("k", 5),
+        time_budget_ms=opts.get("time_budget_ms", 50.0),
+        min_score=opts.get("min_score", 0.3),
+        hot_accept=opts.get("hot_accept", 0.8),
+        hot_size=opts.get("hot_size", 64),
+        max_sessions=opts.get("max_sessions", 256),
+        block_rows=opts.get("block_rows", 4096),
+        snippet_chars=opts.get("snippet_chars", 240),
+        max_masks=opts.get("max_masks", 16),
+        filters={
+            "origin": opts.get("origins"),
+            "type": opts.get("types"),
+        },
+    )
+
+
+def format_citations(citations, limit=3):
+    """Short "[1] snippet" references for appending to a chat reply."""
+    refs = []
+    for n, hit in enumerate(citations[:limit], 1):
+        snippet = " ".join(hit["snippet"].split())
+        if len(snippet) > 80:
+            snippet = snippet[:77] + "..."
+        refs.append(f"[{n}] {snippet}")
+    return " ".join(refs)
+
+
+__all__ = ["MemoryRetriever", "make_retriever", "format_citations"]
@@ -0,0 +1,705 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/benchmark.py :: Module Integrity Directive
+# Load-test and latency benchmark for the NLP service endpoints.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import argparse
+import random
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+try:
+    import psutil
+
+    HAS_PSUTIL = True
+except ImportError:
+    psutil = None
+    HAS_PSUTIL = False
+
+BENCH_CFG = CFG.get("nlp", {}).get("benchmark", {})
+PERCENTILES = (50, 95, 99)
+SCENARIOS = ("chat", "scrape", "diff")
+
+# ── payloads ────────────────────────────────────────────────
+
+_CHAT_TURNS = [
+    "What moved the market today?",
+    "Summarize the last scrape of the Fed minutes.",
+    "Why did the mutation daemon roll back kernel.py?",
+    "Compare NVDA and AMD guidance for next quarter.",
+    "Which tasks are still pending in the queue?",
+    "Explain the drop in BTC after the ETF news.",
+    "Is the embedding index healthy?",
+    "What did the trading agent learn from yesterday's signals?",
+]
+_PAGE_SENTENCES = [
+    "Shares of {co} rose {n}% in early trading after quarterly revenue beat estimates.",
+    "Analysts at {bank} raised their price target, citing stronger margins.",
+    "The Federal Reserve held rates steady and signaled patience on cuts.",
+    "{co} announced a ${n} billion buyback alongside its dividend increase.",
+    "Supply chain constraints eased, although freight costs remain elevated.",
+    "Traders rotated out of megacap tech into small caps and energy names.",
+    "The company guided full-year earnings per share above consensus.",
+    "Volume was {n} million shares, roughly double the 30-day average.",
+]
+_COMPANIES = ["Apple", "Nvidia", "Tesla", "Microsoft", "Amazon", "AMD", "Palantir"]
+_BANKS = ["Goldman Sachs", "Morgan Stanley", "JPMorgan", "Citi"]
+
+
+def _page(rng, paragraphs):
+    """A scraped-article-like text of the given number of paragraphs."""
+    out = []
+    for _ in range(paragraphs):
+        out.append(
+            " ".join(
+                rng.choice(_PAGE_SENTENCES).format(
+                    co=rng.choice(_COMPANIES),
+                    bank=rng.choice(_BANKS),
+                    n=rng.randint(1, 90),
+                )
+                for _ in range(rng.randint(3, 7))
+            )
+        )
+    return "\n\n".join(out)
+
+
+def _source_files(limit=40):
+    """Python sources from the repo, the same material mutations diff."""
+    files = []
+    for sub in ("nlp_engine", "agent_core", "memory", "self_mutation_watcher"):
+        files.extend(sorted((BASE_DIR / sub).glob("*.py")))
+    texts = []
+    for path in files[:limit]:
+        try:
+            texts.append(path.read_text(encoding="utf-8"))
+        except OSError:
+            continue
+    return texts or ["def f(x):\n    return x + 1\n" * 20]
+
+
+def _mutate(rng, source, edits):
+    """source with a few lines edited, inserted or removed."""
+    lines = source.splitlines()
+    for _ in range(edits):
+        if not lines:
+            break
+        i = rng.randrange(len(lines))
+        kind = rng.random()
+        if kind < 0.5:
+            lines[i] = lines[i].replace("return", "return  # patched", 1) + " "
+        elif kind < 0.8:
+            indent = lines[i][: len(lines[i]) - len(lines[i].lstrip())]
+            lines.insert(
+                i, f"{indent}logger.debug('benchmark edit {rng.randint(0, 999)}')"
+            )
+        else:
+            del lines[i]
+    return "\n".join(lines)
+
+
+def build_payloads(mix, count, pool=64, seed=0):
+    """
+    Returns count (scenario, endpoint, body) requests drawn by the mix
+    weights ({"chat": 0.4, ...}). Each scenario draws from pool distinct
+    payloads, so repeated requests can hit the result cache like real traffic.
+    """
+    rng = random.Random(seed)
+    sources = _source_files()
+    pools = {
+        "chat": [("/chat", {"text": rng.choice(_CHAT_TURNS)}) for _ in range(pool)],
+        "scrape": [],
+        "diff": [],
+    }
+    for _ in range(pool):
+        page = _page(rng, rng.randint(2, 12))
+        endpoint = rng.choice(
+            ["/tokenize", "/encode", "/parse", "/pos_tag", "/batch_tokenize"]
+        )
+        body = (
+            {"texts": page.split("\n\n")}
+            if endpoint.startswith("/batch")
+            else {"text": page}
+        )
+        pools["scrape"].append((endpoint, body))
+        old = rng.choice(sources)
+        new = _mutate(rng, old, rng.randint(1, 6))
+        pools["diff"].append(("/diff", {"text1": old, "text2": new}))
+
+    weights = {name: float(w) for name, w in mix.items() if w and name in pools}
+    if not weights:
+        raise ValueError(f"Payload mix needs a positive weight for one of {SCENARIOS}")
+    names = list(weights)
+    picks = rng.choices(names, weights=[weights[n] for n in names], k=count)
+    return [(name, *rng.choice(pools[name])) for name in picks]
+
+
+def load_payloads(path):
+    """Requests recorded as JSON lines: {"endpoint", "body", "scenario"?}."""
+    out = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                out.append(
+                    (
+                        record.get("scenario", "custom"),
+                        record["endpoint"],
+                        record.get("body", {}),
+                    )
+                )
+    return out
+
+
+def parse_mix(text):
+    """Parses a --mix string such as chat=0.4,scrape=0.4,diff=0.2."""
+    mix = {}
+    for part in filter(None, (p.strip() for p in text.split(","))):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1.0)
+    return mix
+
+
+# ── transports ──────────────────────────────────────────────
+
+
+class InProcessTransport:
+    """Requests through the Flask test client of an NLPService in this process."""
+
+    name = "inprocess"
+
+    def __init__(self, service=None):
+        if service is None:
+            from nlp_engine.nlp_service import NLPService
+
+            service = NLPService(unix_socket="")
+        if service.process_pool:
+            # run() normally starts it; until then /parse etc. run inline
+            service.process_pool.start()
+        self.service = service
+        self.target = "NLPService (in-process)"
+        self.pid = os.getpid()
+        self._local = threading.local()
+
+    def post(self, endpoint, body, headers):
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.service.app.test_client()
+        response = client.post(endpoint, json=body, headers=headers)
+        payload = response.get_json(silent=True) if endpoint == "/chat" else None
+        return response.status_code, payload
+
+    def close(self):
+        if self.service.process_pool:
+            self.service.process_pool.shutdown(wait=False)
+
+
+class HTTPTransport:
+    """Requests to a running service over TCP or its Unix socket (keep-alive)."""
+
+    name = "http"
+
+    def __init__(self, base_url, pool_size=16, timeout=60, unix_socket=None, pid=None):
+        from nlp_engine.nlp_client import NLPClient
+
+        # No retries: a retried request would hide its own latency
+        self.client = NLPClient(
+            base_url,
+            timeout=timeout,
+            pool_size=pool_size,
+            max_retries=0,
+            unix_socket=unix_socket,
+        )
+        self.timeout = timeout
+        self.target = f"{self.client.base_url} ({self.client.transport})"
+        self.pid = pid
+
+    def post(self, endpoint, body, headers):
+        response = self.client.session.post(
+            self.client.base_url + endpoint,
+            json=body,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        payload = response.json() if endpoint == "/chat" and response.ok else None
+        return response.status_code, payload
+
+    def close(self):
+        self.client.session.close()
+
+
+# ── resources ───────────────────────────────────────────────
+
+
+def _proc_usage(pid):
+    """(cpu seconds, rss bytes) of pid and, with psutil, its children."""
+    if HAS_PSUTIL:
+        proc = psutil.Process(pid)
+        procs = [proc] + proc.children(recursive=True)
+        cpu = rss = 0
+        for p in procs:
+            try:
+                times = p.cpu_times()
+                cpu += times.user + times.system
+                rss += p.memory_info().rss
+            except psutil.Error:
+                continue
+        return cpu, rss
+    with open(f"/proc/{pid}/stat", "r") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    rss = int(fields[21]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu, rss
+
+
+class ResourceSampler:
+    """Samples CPU time and RSS of a process every interval seconds."""
+
+    def __init__(self, pid, interval=0.25):
+        self.pid = pid
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        try:
+            self.samples.append((time.perf_counter(), *_proc_usage(self.pid)))
+        except (OSError, ValueError, IndexError) as e:
+            logger.debug(f"[BENCHMARK] Resource sample of pid {self.pid} failed: {e}")
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        if self.pid:
+            self._sample()
+            self._thread = threading.Thread(
+                target=self._loop, name="bench-sampler", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._sample()
+        if len(self.samples) < 2:
+            return None
+        (t0, cpu0, _), (t1, cpu1, rss1) = self.samples[0], self.samples[-1]
+        rss = [s[2] for s in self.samples]
+        cpu_sec = cpu1 - cpu0
+        return {
+            "pid": self.pid,
+            "includes_children": HAS_PSUTIL,
+            "cpu_sec": round(cpu_sec, 3),
+            "cpu_percent": round(100.0 * cpu_sec / max(t1 - t0, 1e-9), 1),
+            "rss_start_mb": round(rss[0] / 2**20, 1),
+            "rss_peak_mb": round(max(rss) / 2**20, 1),
+            "rss_end_mb": round(rss1 / 2**20, 1),
+        }
+
+
+# ── runner ──────────────────────────────────────────────────
+
+
+def _summarize(latencies, errors, wall_sec):
+    ok = np.asarray(latencies, dtype=np.float64)
+    entry = {
+        "requests": len(latencies) + errors,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / wall_sec, 2) if wall_sec else 0.0,
+    }
+    for p in PERCENTILES:
+        entry[f"p{p}_ms"] = round(float(np.percentile(ok, p)), 3) if ok.size else None
+    entry["mean_ms"] = round(float(ok.mean()), 3) if ok.size else None
+    entry["max_ms"] = round(float(ok.max()), 3) if ok.size else None
+    return entry
+
+
+class BenchmarkRunner:
+    """
+    Closed-loop load generator: concurrency workers each send the next
+    queued request as soon as their previous one returns, until every
+    request is sent or duration_sec elapses (the queue then wraps).
+
+    Latency is measured per request around the transport call and grouped
+    by endpoint and scenario; non-2xx answers count as errors, not samples.
+    Chat turns keep one session per worker, as a real client would.
+    """
+
+    def __init__(
+        self,
+        transport,
+        payloads,
+        concurrency=8,
+        duration_sec=None,
+        warmup_requests=20,
+        no_cache=False,
+    ):
+        if not payloads:
+            raise ValueError("No payloads to send")
+        self.transport = transport
+        self.payloads = payloads
+        self.concurrency = max(1, int(concurrency))
+        self.duration_sec = duration_sec
+        self.warmup_requests = warmup_requests
+        self.headers = {"Cache-Control": "no-cache"} if no_cache else {}
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def _take(self, deadline):
+        with self._lock:
+            n = self._next
+            self._next += 1
+        if deadline is not None:
+            return None if time.perf_counter() > deadline else n % len(self.payloads)
+        return n if n < len(self.payloads) else None
+
+    def _send(self, endpoint, body, state):
+        if endpoint == "/chat":
+            body = dict(body, user_id=state["user_id"])
+            if state.get("session_id"):
+                body["session_id"] = state["session_id"]
+        status, payload = self.transport.post(endpoint, body, self.headers)
+        if payload and payload.get("session_id"):
+            state["session_id"] = payload["session_id"]
+        return status
+
+    def _worker(self, worker_id, deadline, samples):
+        state = {"user_id": f"bench-{worker_id}"}
+        while True:
+            n = self._take(deadline)
+            if n is None:
+                return
+            scenario, endpoint, body = self.payloads[n]
+            started = time.perf_counter()
+            try:
+                status = self._send(endpoint, body, state)
+            except Exception as e:
+                logger.debug(f"[BENCHMARK] {endpoint} failed: {e}")
+                status = None
+            elapsed = (time.perf_counter() - started) * 1000.0
+            samples.append((scenario, endpoint, status, elapsed))
+
+    def warm_up(self):
+        state = {"user_id": "bench-warmup"}
+        for _, endpoint, body in self.payloads[: self.warmup_requests]:
+            try:
+                self._send(endpoint, body, state)
+            except Exception as e:
+                logger.debug(f"[BENCHMARK] Warmup {endpoint} failed: {e}")
+
+    def run(self, name=None):
+        """Runs the load and returns the report dict (see format_report)."""
+        self.warm_up()
+        samples = []  # list.append is atomic; no lock needed per request
+        sampler = ResourceSampler(self.transport.pid).start()
+        self._next = 0
+        started = time.perf_counter()
+        deadline = started + self.duration_sec if self.duration_sec else None
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="bench"
+        ) as pool:
+            for future in [
+                pool.submit(self._worker, i, deadline, samples)
+                for i in range(self.concurrency)
+            ]:
+                future.result()
+        wall_sec = time.perf_counter() - started
+        resources = sampler.stop()
+
+        by_endpoint = defaultdict(lambda: ([], [0]))
+        by_scenario = defaultdict(lambda: ([], [0]))
+        for scenario, endpoint, status, elapsed in samples:
+            for key, groups in ((endpoint, by_endpoint), (scenario, by_scenario)):
+                latencies, errors = groups[key]
+                if status is not None and 200 <= status < 300:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+        all_ok = [ms for lat, _ in by_endpoint.values() for ms in lat]
+        all_errors = sum(err[0] for _, err in by_endpoint.values())
+        return {
+            "name": name or datetime.datetime.now().strftime("%Y%m%d-%H%M%S"),
+            "mode": self.transport.name,
+            "target": self.transport.target,
+            "started": datetime.datetime.now().isoformat(),
+            "config": {
+                "concurrency": self.concurrency,
+                "requests": len(samples),
+                "duration_sec": self.duration_sec,
+                "no_cache": bool(self.headers),
+                "warmup_requests": self.warmup_requests,
+            },
+            "wall_sec": round(wall_sec, 3),
+            "total": _summarize(all_ok, all_errors, wall_sec),
+            "endpoints": {
+                key: _summarize(lat, err[0], wall_sec)
+                for key, (lat, err) in sorted(by_endpoint.items())
+            },
+            "scenarios": {
+                key: _summarize(lat, err[0], wall_sec)
+                for key, (lat, err) in sorted(by_scenario.items())
+            },
+            "resources": resources,
+        }
+
+
+# ── reports ─────────────────────────────────────────────────
+
+_COMPARED = ("throughput_rps", "p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(base, new):
+    if base in (None, 0) or new is None:
+        return None
+    return round(100.0 * (new - base) / base, 1)
+
+
+def compare(base, new, threshold_pct=None):
+    """
+    Per-endpoint (and total) change of throughput and p50/p95/p99 from the
+    base report to the new one. A regression is a latency percentile up, or
+    throughput down, by more than threshold_pct.
+    """
+    if threshold_pct is None:
+        threshold_pct = BENCH_CFG.get("regression_pct", 10.0)
+    rows, regressions = {}, []
+    keys = ["total"] + sorted(set(base["endpoints"]) | set(new["endpoints"]))
+    for key in keys:
+        a = base["total"] if key == "total" else base["endpoints"].get(key, {})
+        b = new["total"] if key == "total" else new["endpoints"].get(key, {})
+        row = {}
+        for metric in _COMPARED:
+            change = _change(a.get(metric), b.get(metric))
+            row[metric] = {
+                "base": a.get(metric),
+                "new": b.get(metric),
+                "change_pct": change,
+            }
+            if change is None:
+                continue
+            worse = -change if metric == "throughput_rps" else change
+            if worse > threshold_pct:
+                regressions.append(f"{key} {metric} {change:+.1f}%")
+        rows[key] = row
+    resources = {}
+    if base.get("resources") and new.get("resources"):
+        for metric in ("cpu_percent", "rss_peak_mb"):
+            a, b = base["resources"].get(metric), new["resources"].get(metric)
+            resources[metric] = {"base": a, "new": b, "change_pct": _change(a, b)}
+    return {
+        "base": base["name"],
+        "new": new["name"],
+        "threshold_pct": threshold_pct,
+        "endpoints": rows,
+        "resources": resources,
+        "regressions": regressions,
+    }
+
+
+def format_report(report):
+    lines = [
+        f"{report['name']}  {report['mode']} -> {report['target']}  "
+        f"concurrency={report['config']['concurrency']}  wall={report['wall_sec']}s",
+        f"{'endpoint':<18}{'reqs':>7}{'err':>6}{'rps':>9}"
+        + "".join(f"{f'p{p}':>10}" for p in PERCENTILES),
+    ]
+    rows = [("TOTAL", report["total"])] + list(report["endpoints"].items())
+    rows += [(f"[{name}]", entry) for name, entry in report["scenarios"].items()]
+    for key, e in rows:
+        lines.append(
+            f"{key:<18}{e['requests']:>7}{e['errors']:>6}{e['throughput_rps']:>9.1f}"
+            + "".join(
+                f"{e[f'p{p}_ms']:>10.1f}" if e[f"p{p}_ms"] is not None else f"{'-':>10}"
+                for p in PERCENTILES
+            )
+        )
+    res = report.get("resources")
+    if res:
+        lines.append(
+            f"cpu {res['cpu_percent']}% ({res['cpu_sec']}s)  rss {res['rss_start_mb']} -> "
+            f"{res['rss_end_mb']} MB (peak {res['rss_peak_mb']})"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(diff):
+    lines = [
+        f"{diff['base']} -> {diff['new']}",
+        f"{'endpoint':<18}" + "".join(f"{m:>22}" for m in _COMPARED),
+    ]
+    for key, row in diff["endpoints"].items():
+        cells = []
+        for metric in _COMPARED:
+            c = row[metric]
+            change = (
+                f"{c['change_pct']:+.1f}%" if c["change_pct"] is not None else "n/a"
+            )
+            cells.append(f"{c['base'] or 0:>8.1f} > {c['new'] or 0:>6.1f} {change:>6}")
+        lines.append(f"{key:<18}" + "".join(f"{cell:>22}" for cell in cells))
+    for metric, c in diff["resources"].items():
+        lines.append(f"{metric}: {c['base']} -> {c['new']} ({c['change_pct']}%)")
+    lines.append(
+        "regressions: "
+        + (", ".join(diff["regressions"]) if diff["regressions"] else "none")
+    )
+    return "\n".join(lines)
+
+
+def save_report(report, path=None):
+    if path is None:
+        out_dir = str(BENCH_CFG.get("out_dir", "$ROOT/data/benchmarks"))
+        path = pathlib.Path(out_dir.replace("$ROOT", str(BASE_DIR))) / (
+            f"{report['name']}-{report['mode']}.json"
+        )
+    path = pathlib.Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_report(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def run_benchmark(
+    mode="inprocess",
+    url=None,
+    pid=None,
+    service=None,
+    payloads=None,
+    mix=None,
+    requests=None,
+    name=None,
+    **overrides,
+):
+    """
+    Builds the transport and payloads from the [nlp.benchmark] config
+    section (overridden by keyword) and returns the run's report.
+    """
+    opts = dict(BENCH_CFG, **overrides)
+    if payloads is None:
+        payloads = build_payloads(
+            mix or opts.get("mix", {"chat": 0.4, "scrape": 0.4, "diff": 0.2}),
+            requests or opts.get("requests", 500),
+            pool=opts.get("distinct_payloads", 64),
+            seed=opts.get("seed", 0),
+        )
+    concurrency = opts.get("concurrency", 8)
+    if mode == "http":
+        transport = HTTPTransport(
+            url or opts.get("url", "http://localhost:8001"),
+            pool_size=concurrency,
+            unix_socket=opts.get("unix_socket"),
+            pid=pid,
+        )
+    else:
+        transport = InProcessTransport(service)
+    try:
+        return BenchmarkRunner(
+            transport,
+            payloads,
+            concurrency=concurrency,
+            duration_sec=opts.get("duration_sec") or None,
+            warmup_requests=opts.get("warmup_requests", 20),
+            no_cache=opts.get("no_cache", False),
+        ).run(name)
+    finally:
+        if service is None:
+            transport.close()
+
+
+def _main():
+    parser = argparse.ArgumentParser(description="Benchmark the NLP service")
+    sub = parser.add_subparsers(dest="command", required=True)
+    run = sub.add_parser("run", help="drive the service and save a report")
+    run.add_argument("--mode", choices=("inprocess", "http"), default="inprocess")
+    run.add_argument("--url", help="service base URL (http mode)")
+    run.add_argument("--unix-socket", help='socket path, "auto" or omit for TCP')
+    run.add_argument("--pid", type=int, help="service pid to sample (http mode)")
+    run.add_argument("--concurrency", type=int)
+    run.add_argument("--requests", type=int)
+    run.add_argument("--duration", type=float, help="seconds; overrides --requests")
+    run.add_argument("--mix", help="e.g. chat=0.4,scrape=0.4,diff=0.2")
+    run.add_argument("--payloads", help="JSON lines of {endpoint, body} to replay")
+    run.add_argument("--no-cache", action="store_true", help="bypass result cache")
+    run.add_argument("--name", help="report name (default: timestamp)")
+    run.add_argument("--out", help="report path (default: [nlp.benchmark] out_dir)")
+    run.add_argument("--compare", help="baseline report to compare against")
+    cmp_ = sub.add_parser("compare", help="compare two saved reports")
+    cmp_.add_argument("base")
+    cmp_.add_argument("new")
+    cmp_.add_argument("--threshold", type=float, help="regression threshold (%%)")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        diff = compare(load_report(args.base), load_report(args.new), args.threshold)
+        print(format_comparison(diff))
+        return 1 if diff["regressions"] else 0
+
+    overrides = {
+        key: value
+        for key, value in (
+            ("concurrency", args.concurrency),
+            ("duration_sec", args.duration),
+            ("unix_socket", args.unix_socket),
+            ("no_cache", args.no_cache or None),
+        )
+        if value is not None
+    }
+    report = run_benchmark(
+        mode=args.mode,
+        url=args.url,
+        pid=args.pid,
+        payloads=load_payloads(args.payloads) if args.payloads else None,
+        mix=parse_mix(args.mix) if args.mix else None,
+        requests=args.requests,
+        name=args.name,
+        **overrides,
+    )
+    print(format_report(report))
+    print(f"report: {save_report(report, args.out)}")
+    if args.compare:
+        diff = compare(load_report(args.compare), report)
+        print(format_comparison(diff))
+        return 1 if diff["regressions"] else 0
+    return 0
+
+
+__all__ = [
+    "build_payloads",
+    "load_payloads",
+    "InProcessTransport",
+    "HTTPTransport",
+    "ResourceSampler",
+    "BenchmarkRunner",
+    "run_benchmark",
+    "compare",
+    "format_report",
+    "format_comparison",
+    "save_report",
+    "load_report",
+]
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
@@ -16,8 +16,11 @@
 # Import NLP environment globals
 from conda_envs.environments.nlp.globals import *
 
+from collections import Counter
 from datetime import datetime, timezone
 
+import numpy as np
+
 
 # For cross-environment communication, use lazy loading
 def lazy_import_memory():
@@ -69,6 +72,22 @@ from .semantic_score import reasoned_similarity
 
 __all__ = ["ChatSession"]
 
+CHAT_CFG = CFG.get("nlp", {}).get("chat_sessions", {})
+HISTORY_WINDOW = CHAT_CFG.get("history_window", 50)
+SUMMARY_TOPICS = 8
+
+_TOPIC_RE = re.compile(r"[a-z][a-z0-9$&'-]{3,}")
+_TOPIC_STOPWORDS = set(
+    "what that this with have about from your there would could should which "
+    "when where they them then than will just like into does been were some "
+    "more please tell know want need also".split()
+)
+
+
+def turn_topics(text):
+    """Content words of one user turn, for the rolling summary."""
+    return [w for w in _TOPIC_RE.findall(text.lower()) if w not in _TOPIC_STOPWORDS]
+
 
 class ChatSession:
     """
@@ -78,35 +97,116 @@ class ChatSession:
         (user_input: str, bot_response: str, meta: dict)
     where meta contains optional keys such as:
         - "explanation": str or None
+        - "continuity": cosine similarity to the previous user turn, or None
         - "feedback": any feedback provided by the user
+
+    self.turn_vectors: input embedding of each turn in self.history (None
+    when not known, e.g. after a replay), so each input is embedded once.
     """
 
-    def __init__(self, user_id=None):
+    def __init__(self, user_id=None, max_history=None):
         self.user_id = user_id or "anon"
-        self.history = []  # List of (user, bot, meta)
+        self.history = []  # List of (user, bot, meta), last max_history turns
+        self.turn_vectors = []  # Input embedding per history turn
+        self.max_history = max_history or HISTORY_WINDOW
         self.created = datetime.utcnow().isoformat()
         safe_created = self.created.replace(":", "-")
         self.session_id = f"chat_{self.user_id}_{safe_created}"
         self.memory_trace = []
+        self.turn_count = 0
+        self.summarized_turns = 0
+        self.summary_topics = Counter()
+        self.last_question = ""
+        self.last_active = time.time()
+        self.on_turn = None  # set by SessionStore to journal turns
+
+    def add_turn(self, user_input, bot_response, meta=None, vector=None):
+        """
+        Appends a turn, keeping only the last max_history turns. Older turns
+        are folded into the rolling summary instead of being kept verbatim.
+        """
+        turn = (user_input, bot_response, meta or {})
+        self.history.append(turn)
+        self.turn_vectors.append(vector)
+        self.turn_count += 1
+        self.last_active = time.time()
+        while len(self.history) > self.max_history:
+            old_user, _, _ = self.history.pop(0)
+            self.turn_vectors.pop(0)
+            self.summarized_turns += 1
+            self.summary_topics.update(turn_topics(old_user))
+            self.last_question = old_user[:120]
+        if self.on_turn:
+            self.on_turn(self, turn)
+        return turn
+
+    @property
+    def summary(self):
+        """One-line digest of the turns that fell out of the history window."""
+        if not self.summarized_turns:
+            return ""
+        topics = ", ".join(
+            t for t, _ in self.summary_topics.most_common(SUMMARY_TOPICS)
+        )
+        return (
+            f"{self.summarized_turns} earlier turns | topics: {topics or 'n/a'} | "
+            f"last: {self.last_question!r}"
+        )
+
+    def describe(self):
+        """Session metadata without the history itself."""
+        return {
+            "session_id": self.session_id,
+            "user_id": self.user_id,
+            "created": self.created,
+            "last_active": datetime.utcfromtimestamp(self.last_active).isoformat(),
+            "turn_count": self.turn_count,
+            "history_length": len(self.history),
+            "summarized_turns": self.summarized_turns,
+        }
+
+    def _previous_vector(self):
+        """Embedding of the last user turn, computed at most once per turn."""
+        if not self.history:
+            return None
+        vector = self.turn_vectors[-1]
+        if vector is None and embed_text:
+            vector = embed_text(self.history[-1][0])
+            self.turn_vectors[-1] = vector
+        return vector
+
+    def _continuity(self, vector):
+        """Cosine similarity of this turn's embedding to the previous turn's."""
+        previous = self._previous_vector()
+        if vector is None or previous is None:
+            return None
+        a = np.asarray(vector, dtype=np.float32).ravel()
+        b = np.asarray(previous, dtype=np.float32).ravel()
+        if a.shape != b.shape:
+            return None
+        norm = float(np.linalg.norm(a) * np.linalg.norm(b))
+        return float(np.dot(a, b) / norm) if norm else 0.0
 
     def process_input(self, user_input, context=None, feedback=None):
-        # Tokenize and embed
+        # Tokenize and embed once; the vector is reused for storage and continuity
         tokens = tokenize(user_input)
-        vector = embed_text(user_input)
-        package_embedding(
-            text=user_input,
-            vector=vector,
-            meta={
-                "origin": "chat_session",
-                "timestamp": datetime.utcnow().isoformat(),
-                "user_id": self.user_id,
-                "session_id": self.session_id,
-                "token_count": len(tokens),
-            },
-        )
-        inject_watermark(origin="chat_session")
+        vector = embed_text(user_input) if embed_text else None
+        if package_embedding and vector is not None:
+            package_embedding(
+                text=user_input,
+                vector=vector,
+                meta={
+                    "origin": "chat_session",
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "user_id": self.user_id,
+                    "session_id": self.session_id,
+                    "token_count": len(tokens),
+                },
+            )
+        if inject_watermark:
+            inject_watermark(origin="chat_session")
         # Call backend chat handler for response
-        bot_response = backend_chat(user_input)
+        bot_response = backend_chat(user_input, session_id=self.session_id)
         # Ensure output is always a string
         if isinstance(bot_response, dict):
             # Prefer explicit "response" key; fallback to first value if not present
@@ -117,30 +217,28 @@ class ChatSession:
                 bot_response = str(next(iter(bot_response.values()), ""))
         else:
             bot_response = str(bot_response)
-        # Optionally, reason about similarity to previous turns
+        # Similarity to the previous turn, from the cached embeddings
         explanation = None
-        if self.history:
-            prev_user, prev_bot, _ = self.history[-1]
-            sim = reasoned_similarity(prev_user, user_input)
-            explanation = sim.get("explanation")
-        # Log event
-        # Optionally, reason about similarity to previous turns
-        # 'explanation' holds reasoning or similarity explanation for the current turn, if available
-        explanation = None
-        if self.history:
-            prev_user, prev_bot, _ = self.history[-1]
-            sim = reasoned_similarity(prev_user, user_input)
+        continuity = self._continuity(vector)
+        if continuity is not None:
+            explanation = f"Turn continuity similarity: {continuity:.4f}"
+        elif self.history:
+            # No embedder available: fall back to the full similarity scorer
+            sim = reasoned_similarity(self.history[-1][0], user_input)
             explanation = sim.get("explanation")
         # Store in history
-        self.history.append(
-            (
-                user_input,
-                bot_response,
-                {"explanation": explanation, "feedback": feedback},
-            )
+        self.add_turn(
+            user_input,
+            bot_response,
+            {
+                "explanation": explanation,
+                "continuity": continuity,
+                "feedback": feedback,
+            },
+            vector=vector,
         )
         # Optionally inject feedback for learning
-        if feedback:
+        if feedback and inject_task:
             inject_task({"type": "feedback", "input": user_input, "feedback": feedback})
         return {
             "response": bot_response,
@@ -13,9 +13,12 @@
 # Import NLP environment globals
 from conda_envs.environments.nlp.globals import *
 
-from difflib import unified_diff
+import hashlib
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher, unified_diff
 import numpy as np
-from typing import Dict
+from typing import Dict, List
 
 
 # For cross-environment communication, use lazy loading
@@ -33,18 +36,18 @@ def lazy_import_utils():
 def lazy_import_nlp():
     """Lazy import NLP functionality to prevent circular dependencies"""
     try:
-        from nlp_engine.semantic_score import semantic_similarity
+        from nlp_engine.semantic_score import semantic_similarity, embed_texts
         from nlp_engine.transformer_core import encode
 
-        return semantic_similarity, encode
+        return semantic_similarity, encode, embed_texts
     except ImportError as e:
         logger.warning(f"NLP functions not available: {e}")
-        return lambda x, y: 0.0, lambda x: np.zeros(384)
+        return lambda x, y: 0.0, lambda x: np.zeros(384), lambda texts: None
 
 
 # Get functions lazily
 setup_module_logger = lazy_import_utils()
-semantic_similarity, encode_func = lazy_import_nlp()
+semantic_similarity, encode_func, embed_texts = lazy_import_nlp()
 
 # Initialize module-specific logger
 try:
@@ -54,36 +57,157 @@ except:
 
 ENGINE_NAME = "diff_engine"
 
+DIFF_CFG = CFG.get("nlp", {}).get("diff", {})
+# Texts up to this size are compared whole; larger ones hunk by hunk
+WHOLE_TEXT_MAX_CHARS = DIFF_CFG.get("whole_text_max_chars", 2000)
+CONTEXT_LINES = DIFF_CFG.get("context_lines", 3)
+CHUNK_MAX_LINES = DIFF_CFG.get("chunk_max_lines", 40)
+DELTA_CACHE_SIZE = DIFF_CFG.get("delta_cache_size", 2048)
+
+# encode_func vectors of hunk chunks keyed by content hash (LRU)
+_delta_cache = OrderedDict()
+_delta_cache_lock = threading.Lock()
+_delta_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _encode_cached(chunk: str):
+    key = hashlib.sha1(chunk.encode("utf-8")).hexdigest()
+    with _delta_cache_lock:
+        vec = _delta_cache.get(key)
+        if vec is not None:
+            _delta_cache.move_to_end(key)
+            _delta_cache_stats["hits"] += 1
+            return vec
+        _delta_cache_stats["misses"] += 1
+    vec = np.asarray(encode_func(chunk), dtype=np.float32)
+    with _delta_cache_lock:
+        _delta_cache[key] = vec
+        while len(_delta_cache) > DELTA_CACHE_SIZE:
+            _delta_cache.popitem(last=False)
+    return vec
+
+
+def delta_cache_stats() -> Dict:
+    with _delta_cache_lock:
+        return dict(_delta_cache_stats, size=len(_delta_cache))
+
+
+def _windows(lines: List[str]) -> List[str]:
+    """Splits a hunk side into chunks of at most CHUNK_MAX_LINES lines."""
+    chunks = [
+        "".join(lines[i : i + CHUNK_MAX_LINES])
+        for i in range(0, len(lines), CHUNK_MAX_LINES)
+    ]
+    return [c for c in chunks if c.strip()] or [""]
+
+
+def _side_vectors(lines: List[str]):
+    """(sentence embedding, encode_func vector) of one hunk side, chunk-averaged."""
+    chunks = _windows(lines)
+    sem = embed_texts(chunks)
+    if sem is not None:
+        sem = sem.mean(axis=0)
+        norm = float(np.linalg.norm(sem))
+        sem = sem / norm if norm else sem
+    raw = np.mean([_encode_cached(c) for c in chunks], axis=0)
+    return sem, raw
+
+
+def diff_hunks(old_lines: List[str], new_lines: List[str], debug: bool = False):
+    """
+    Scores each changed hunk (with CONTEXT_LINES of context) separately.
+
+    Chunk embeddings are cached by content hash in the semantic_score
+    chunk cache and the encode_func delta cache, so re-diffing a file after
+    a small edit only encodes the chunks that changed. Returns
+    (semantic_score, embedding_delta, hunks), where the file-level values
+    weight each hunk by its share of the file's lines and count unchanged
+    lines as identical. That dilutes a small rewrite in a large file; gate
+    on the worst hunk (min_hunk_score/max_hunk_delta in diff_texts) instead.
+    """
+    matcher = SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+    total = max(len(old_lines), len(new_lines), 1)
+    hunks = []
+    dissimilarity = 0.0
+    delta = 0.0
+    for group in matcher.get_grouped_opcodes(CONTEXT_LINES):
+        i1, i2 = group[0][1], group[-1][2]
+        j1, j2 = group[0][3], group[-1][4]
+        old_part, new_part = old_lines[i1:i2], new_lines[j1:j2]
+        old_sem, old_raw = _side_vectors(old_part)
+        new_sem, new_raw = _side_vectors(new_part)
+        if old_sem is not None and new_sem is not None:
+            score = max(0.0, min(1.0, float(np.dot(old_sem, new_sem))))
+        else:
+            score = semantic_similarity("".join(old_part), "".join(new_part))
+        if old_raw.shape == new_raw.shape:
+            hunk_delta = float(np.linalg.norm(old_raw - new_raw))
+        else:
+            hunk_delta = 0.0
+            if debug:
+                logger.warning(
+                    f"[{ENGINE_NAME}] Embedding shapes differ: {old_raw.shape} vs {new_raw.shape}"
+                )
+        weight = max(i2 - i1, j2 - j1) / total
+        dissimilarity += weight * (1.0 - score)
+        delta += weight * hunk_delta
+        hunks.append(
+            {
+                "old_start": i1 + 1,
+                "old_lines": i2 - i1,
+                "new_start": j1 + 1,
+                "new_lines": j2 - j1,
+                "semantic_score": round(score, 4),
+                "embedding_delta": round(hunk_delta, 4),
+            }
+        )
+    return max(0.0, 1.0 - dissimilarity), delta, hunks
+
 
 def diff_texts(old: str, new: str, debug: bool = False) -> Dict:
     """
     Computes unified diff, semantic similarity, and embedding delta
     between two strings. Used in mutation safety logic.
 
+    Texts longer than WHOLE_TEXT_MAX_CHARS are scored per hunk (see
+    diff_hunks) instead of as one truncated model input.
+
     Args:
         old (str): The original text.
         new (str): The new text to compare against the original.
         debug (bool, optional): If True, logs warnings on embedding delta failures. Defaults to False.
 
     Returns:
-        Dict: A dictionary containing diff lines, semantic score, and embedding delta.
+        Dict: A dictionary containing diff lines, semantic score, embedding delta,
+            the scoring mode ("whole" or "hunks"), per-hunk scores, and the
+            lowest hunk score / highest hunk delta (min_hunk_score,
+            max_hunk_delta; the file-level values in "whole" mode).
     """
     if not old and not new:
         return {
             "diff_lines": [],
             "semantic_score": 1.0,
             "embedding_delta": 0.0,
+            "min_hunk_score": 1.0,
+            "max_hunk_delta": 0.0,
+            "mode": "whole",
+            "hunks": [],
         }
 
-    lines = list(
-        unified_diff(
-            old.splitlines(keepends=True),
-            new.splitlines(keepends=True),
-            fromfile="old",
-            tofile="new",
-        )
-    )
-    if old or new:
+    old_lines = old.splitlines(keepends=True)
+    new_lines = new.splitlines(keepends=True)
+    lines = list(unified_diff(old_lines, new_lines, fromfile="old", tofile="new"))
+    mode = "hunks" if len(old) + len(new) > WHOLE_TEXT_MAX_CHARS else "whole"
+    hunks = []
+    if old == new:
+        sem_score, delta = 1.0, 0.0
+    elif mode == "hunks":
+        try:
+            sem_score, delta, hunks = diff_hunks(old_lines, new_lines, debug=debug)
+        except Exception as e:
+            logger.error(f"[{ENGINE_NAME}] Hunk scoring failed: {e}")
+            sem_score, delta, hunks = 0.0, 0.0, []
+    else:
         sem_score = semantic_similarity(old, new)
         try:
             vec_old = encode_func(old)
@@ -99,14 +223,21 @@ def diff_texts(old: str, new: str, debug: bool = False) -> Dict:
             logger.debug(f"[{ENGINE_NAME}] Embedding delta failed: {e}")
             if debug:
                 logger.warning(f"[{ENGINE_NAME}] Embedding delta failed: {e}")
+
+    if hunks:
+        min_score = min(h["semantic_score"] for h in hunks)
+        max_delta = max(h["embedding_delta"] for h in hunks)
     else:
-        sem_score = 1.0
-        delta = 0.0
+        min_score, max_delta = sem_score, delta
 
     return {
         "diff_lines": lines,
         "semantic_score": round(sem_score, 4),
         "embedding_delta": round(delta, 4),
+        "min_hunk_score": round(min_score, 4),
+        "max_hunk_delta": round(max_delta, 4),
+        "mode": mode,
+        "hunks": hunks,
     }
 
 
@@ -127,4 +258,6 @@ def diff_files(file_a: str, file_b: str) -> Dict:
             "diff_lines": [f"# ERROR: Could not diff files: {e}"],
             "semantic_score": 0.0,
             "embedding_delta": 0.0,
+            "min_hunk_score": 0.0,
+            "max_hunk_delta": 0.0,
         }
@@ -115,5 +115,24 @@ def nlp_internal_check():
         sys.exit(1)
 
 
+def attention_cache_check():
+    """Incremental (KV-cache) attention must match the full causal forward pass."""
+    try:
+        from nlp_engine.mini_attention import check_incremental_equivalence
+
+        result = check_incremental_equivalence()
+    except Exception as ex:
+        result = {"ok": False, "error": str(ex)}
+
+    if result.get("ok"):
+        print("Attention KV-Cache Check: ✅")
+        log_nlp_out(f"Attention KV-Cache Check: OK | {result}")
+    else:
+        print(f"Attention KV-Cache Check: FAILED | {result}", file=sys.stderr)
+        log_nlp_out(f"Attention KV-Cache Check: FAILED | {result}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     nlp_internal_check()
+    attention_cache_check()
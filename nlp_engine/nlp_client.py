@@ -10,10 +10,120 @@
 # GremlinGPT v1.0.3 :: NLP Client Library
 # Client library for interacting with the NLP Service API
 
+import os
 import json
+import stat
+import socket
+import asyncio
 import requests
-from typing import Optional, Dict, List, Any
+import numpy as np
+from typing import Optional, Dict, List, Any, Iterator, Tuple
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+from urllib.parse import urlparse
+
+from nlp_engine import vector_codec
+from nlp_engine.service_paths import DEFAULT_SOCKET_PATH, service_socket_path
+
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    aiohttp = None
+    HAS_AIOHTTP = False
+
+# Responses worth retrying: the service is restarting or overloaded
+RETRY_STATUSES = (429, 502, 503, 504)
+
+# POST endpoints that only compute, so a request the service may already have
+# handled can be sent again. Other POSTs (chat records a turn) are retried
+# only when the connection could not be made.
+IDEMPOTENT_ENDPOINTS = (
+    "tokenize",
+    "encode",
+    "similarity",
+    "parse",
+    "pos_tag",
+    "diff",
+    "attention",
+    "batch_tokenize",
+    "batch_parse",
+    "batch_encode",
+)
+
+LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+
+
+def resolve_socket(base_url: str, unix_socket: Optional[str] = "auto") -> Optional[str]:
+    """
+    Socket path to use for base_url, or None for TCP. "auto" picks the
+    service's socket (service_socket_path) when base_url points at this
+    host and the socket exists; None or "" forces TCP.
+    """
+    if not unix_socket:
+        return None
+    if unix_socket == "auto":
+        if urlparse(base_url).hostname not in LOCAL_HOSTS:
+            return None
+        unix_socket = service_socket_path()
+        if not unix_socket:
+            return None
+    try:
+        return unix_socket if stat.S_ISSOCK(os.stat(unix_socket).st_mode) else None
+    except OSError:
+        return None
+
+
+class UnixHTTPConnection(HTTPConnection):
+    """urllib3 connection that dials a Unix domain socket instead of TCP."""
+
+    def __init__(self, *args, socket_path: str = "", **kwargs):
+        self.socket_path = socket_path
+        super().__init__(*args, **kwargs)
+
+    def _new_conn(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if isinstance(self.timeout, (int, float)):
+            sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = UnixHTTPConnection
+
+    def __init__(self, socket_path: str, **kwargs):
+        super().__init__("localhost", socket_path=socket_path, **kwargs)
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """
+    requests adapter sending every request through one Unix-socket pool.
+    Mounted on the service's base URL, so URLs and Host headers are unchanged.
+    """
+
+    def __init__(self, socket_path: str, pool_size: int = 10, **kwargs):
+        self.socket_path = socket_path
+        self._pool = UnixHTTPConnectionPool(socket_path, maxsize=pool_size)
+        super().__init__(pool_connections=1, pool_maxsize=pool_size, **kwargs)
+
+    def get_connection(self, url, proxies=None):
+        return self._pool
+
+    def get_connection_with_tls_context(self, request, verify, proxies=None, cert=None):
+        return self._pool
+
+    def close(self):
+        self._pool.close()
+        super().close()
 
 
 class NLPClient:
@@ -22,17 +132,66 @@ class NLPClient:
     Provides convenient methods for all NLP service endpoints.
     """
 
-    def __init__(self, base_url: str = "http://localhost:8001", timeout: int = 30):
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8001",
+        timeout: int = 30,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        batch_size: int = 64,
+        unix_socket: Optional[str] = "auto",
+    ):
         """
         Initialize the NLP client.
 
         Args:
             base_url: Base URL of the NLP service
             timeout: Request timeout in seconds
+            pool_size: Keep-alive connections kept per host
+            max_retries: Retries for connection errors, plus read errors and
+                429/5xx responses on GETs and IDEMPOTENT_ENDPOINTS
+            backoff_factor: Exponential backoff base between retries (seconds)
+            batch_size: Texts per request for the batch_* methods
+            unix_socket: Socket path, "auto" to use the service's socket when
+                base_url is local and it exists, or None to force TCP
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.batch_size = batch_size
         self.session = requests.Session()
+        # urllib3 retries connect errors for any method; read errors and
+        # retry statuses only for allowed_methods
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+        idempotent_retry = retry.new(allowed_methods=frozenset(["GET", "POST"]))
+        self.socket_path = resolve_socket(self.base_url, unix_socket)
+        if self.socket_path:
+            adapter = UnixSocketAdapter(
+                self.socket_path, pool_size=pool_size, max_retries=retry
+            )
+            idempotent_adapter = UnixSocketAdapter(
+                self.socket_path, pool_size=pool_size, max_retries=idempotent_retry
+            )
+        else:
+            adapter = HTTPAdapter(
+                pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+            )
+            idempotent_adapter = HTTPAdapter(
+                pool_connections=pool_size,
+                pool_maxsize=pool_size,
+                max_retries=idempotent_retry,
+            )
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        # requests picks the adapter with the longest matching URL prefix
+        self.session.mount(self.base_url + "/", adapter)
+        for endpoint in IDEMPOTENT_ENDPOINTS:
+            self.session.mount(f"{self.base_url}/{endpoint}", idempotent_adapter)
         self.session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -40,6 +199,10 @@ class NLPClient:
             }
         )
 
+    @property
+    def transport(self) -> str:
+        return "unix" if self.socket_path else "tcp"
+
     def _make_request(
         self, endpoint: str, method: str = "GET", data: Optional[Dict] = None
     ) -> Dict[str, Any]:
@@ -76,6 +239,37 @@ class NLPClient:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON response from NLP service: {e}")
 
+    def _post_raw(
+        self, endpoint: str, data: Dict, accept: str, stream: bool = False
+    ) -> requests.Response:
+        """
+        POST returning the raw response, for non-JSON (binary/NDJSON) payloads.
+
+        Raises:
+            requests.RequestException: For network/HTTP errors
+        """
+        url = f"{self.base_url}/{endpoint}"
+        try:
+            response = self.session.post(
+                url,
+                json=data,
+                headers={"Accept": accept},
+                timeout=self.timeout,
+                stream=stream,
+            )
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            raise requests.RequestException(f"NLP service request failed: {e}")
+
+    def _decode_binary(self, response: requests.Response) -> np.ndarray:
+        shape_header = response.headers.get(vector_codec.SHAPE_HEADER)
+        if not shape_header:
+            raise ValueError("Binary vector response is missing its shape header")
+        return vector_codec.from_bytes(
+            response.content, vector_codec.parse_shape(shape_header)
+        )
+
     def health_check(self) -> Dict[str, Any]:
         """
         Check the health status of the NLP service.
@@ -115,7 +309,7 @@ class NLPClient:
         """
         return self._make_request("tokenize", "POST", {"text": text})
 
-    def encode(self, text: str) -> Dict[str, Any]:
+    def encode(self, text: str) -> np.ndarray:
         """
         Encode text to vector representation.
 
@@ -123,9 +317,108 @@ class NLPClient:
             text: Text to encode
 
         Returns:
-            Vector encoding with vector, dimension, and original text
+            float32 vector of shape (dimension,), sent as raw little-endian bytes
+        """
+        response = self._post_raw(
+            "encode", {"text": text, "format": "binary"}, vector_codec.MIME_BINARY
+        )
+        return self._decode_binary(response)
+
+    def _chunks(self, items: List[Any]) -> Iterator[List[Any]]:
+        for start in range(0, len(items), self.batch_size):
+            yield items[start : start + self.batch_size]
+
+    def encode_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Encode multiple texts, batch_size texts per request.
+
+        Args:
+            texts: Texts to encode
+
+        Returns:
+            float32 matrix of shape (len(texts), dimension)
+        """
+        matrices = []
+        for chunk in self._chunks(texts):
+            response = self._post_raw(
+                "batch_encode",
+                {"texts": chunk, "format": "binary"},
+                vector_codec.MIME_BINARY,
+            )
+            matrices.append(self._decode_binary(response))
+        if not matrices:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(matrices)
+
+    def _batch_results(self, endpoint: str, texts: List[str]) -> List[Dict]:
+        # Splits texts over the server's batch endpoint and renumbers results
+        results = []
+        for offset, chunk in zip(
+            range(0, len(texts), self.batch_size), self._chunks(texts)
+        ):
+            response = self._make_request(endpoint, "POST", {"texts": chunk})
+            for item in response.get("results", []):
+                item["index"] = item.get("index", 0) + offset
+                results.append(item)
+        return results
+
+    def batch_tokenize(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Tokenize many texts through /batch_tokenize.
+
+        Args:
+            texts: Texts to tokenize
+
+        Returns:
+            One result per text with index, tokens and count
+        """
+        return self._batch_results("batch_tokenize", texts)
+
+    def batch_parse(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse many texts through /batch_parse.
+
+        Args:
+            texts: Texts to parse
+
+        Returns:
+            One result per text with index and parsed structure
+        """
+        return self._batch_results("batch_parse", texts)
+
+    def batch_encode(self, texts: List[str]) -> np.ndarray:
+        """Alias of encode_batch for symmetry with the other batch_* methods."""
+        return self.encode_batch(texts)
+
+    def encode_stream(self, texts: List[str]) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Encode a large batch, yielding vectors as the service streams them.
+
+        Args:
+            texts: Texts to encode
+
+        Yields:
+            (index, float32 vector) pairs in input order
+
+        Raises:
+            ValueError: If the service reports an error for an item
         """
-        return self._make_request("encode", "POST", {"text": text})
+        response = self._post_raw(
+            "batch_encode",
+            {"texts": texts, "format": "ndjson"},
+            vector_codec.MIME_NDJSON,
+            stream=True,
+        )
+        with response:
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                if "error" in record:
+                    raise ValueError(
+                        f"Encoding failed for item {record.get('index')}: {record['error']}"
+                    )
+                yield record["index"], vector_codec.from_base64(record)
 
     def chat(
         self, text: str, user_id: Optional[str] = None, session_id: Optional[str] = None
@@ -247,6 +540,211 @@ class NLPClient:
         return False
 
 
+class AsyncNLPClient:
+    """
+    asyncio client for the NLP service on a pooled aiohttp session.
+    Lets agents running under an event loop fan out NLP calls without
+    blocking it. Use as `async with AsyncNLPClient() as client: ...`.
+    """
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8001",
+        timeout: int = 30,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.3,
+        batch_size: int = 64,
+        concurrency: int = 8,
+        unix_socket: Optional[str] = "auto",
+    ):
+        """
+        Initialize the async NLP client.
+
+        Args:
+            base_url: Base URL of the NLP service
+            timeout: Request timeout in seconds
+            pool_size: Maximum open connections
+            max_retries: Retries as for NLPClient
+            backoff_factor: Exponential backoff base between retries (seconds)
+            batch_size: Texts per request for the batch_* methods
+            concurrency: In-flight requests allowed by gather()
+            unix_socket: Socket path, "auto" or None, as for NLPClient
+        """
+        if not HAS_AIOHTTP:
+            raise ImportError("aiohttp is required for AsyncNLPClient")
+        self.base_url = base_url.rstrip("/")
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.pool_size = pool_size
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.socket_path = resolve_socket(self.base_url, unix_socket)
+        self._session = None
+
+    async def __aenter__(self):
+        self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            if self.socket_path:
+                connector = aiohttp.UnixConnector(
+                    path=self.socket_path, limit=self.pool_size
+                )
+            else:
+                connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"User-Agent": "GremlinGPT-NLP-Client/1.0.3"},
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: Optional[Dict] = None,
+        accept: str = vector_codec.MIME_JSON,
+    ) -> Tuple[bytes, Dict[str, str]]:
+        """
+        Performs a request with retries and returns (body, headers).
+        Requests that may already have reached the service are retried only
+        for GETs and IDEMPOTENT_ENDPOINTS; others only when connecting failed.
+
+        Raises:
+            aiohttp.ClientError: When all retries are exhausted
+        """
+        url = f"{self.base_url}/{endpoint}"
+        session = self._get_session()
+        idempotent = method.upper() == "GET" or endpoint in IDEMPOTENT_ENDPOINTS
+        if idempotent:
+            retryable = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+        else:
+            retryable = aiohttp.ClientConnectorError
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with session.request(
+                    method, url, json=data, headers={"Accept": accept}
+                ) as response:
+                    if (
+                        idempotent
+                        and response.status in RETRY_STATUSES
+                        and attempt < self.max_retries
+                    ):
+                        await asyncio.sleep(self.backoff_factor * (2**attempt))
+                        continue
+                    response.raise_for_status()
+                    return await response.read(), dict(response.headers)
+            except retryable:
+                if attempt >= self.max_retries:
+                    raise
+                await asyncio.sleep(self.backoff_factor * (2**attempt))
+
+    async def _json(
+        self, endpoint: str, method: str = "GET", data: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        body, _ = await self._request(endpoint, method, data)
+        try:
+            return json.loads(body)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON response from NLP service: {e}")
+
+    async def _binary(self, endpoint: str, data: Dict) -> np.ndarray:
+        body, headers = await self._request(
+            endpoint, "POST", {**data, "format": "binary"}, vector_codec.MIME_BINARY
+        )
+        shape_header = headers.get(vector_codec.SHAPE_HEADER)
+        if not shape_header:
+            raise ValueError("Binary vector response is missing its shape header")
+        return vector_codec.from_bytes(body, vector_codec.parse_shape(shape_header))
+
+    async def health_check(self) -> Dict[str, Any]:
+        return await self._json("health")
+
+    async def tokenize(self, text: str) -> Dict[str, Any]:
+        return await self._json("tokenize", "POST", {"text": text})
+
+    async def encode(self, text: str) -> np.ndarray:
+        return await self._binary("encode", {"text": text})
+
+    async def parse(self, text: str) -> Dict[str, Any]:
+        return await self._json("parse", "POST", {"text": text})
+
+    async def pos_tag(self, text: str) -> Dict[str, Any]:
+        return await self._json("pos_tag", "POST", {"text": text})
+
+    async def similarity(self, text1: str, text2: str) -> Dict[str, Any]:
+        return await self._json("similarity", "POST", {"text1": text1, "text2": text2})
+
+    async def diff(self, text1: str, text2: str) -> Dict[str, Any]:
+        return await self._json("diff", "POST", {"text1": text1, "text2": text2})
+
+    async def chat(
+        self, text: str, user_id: Optional[str] = None, session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        data = {"text": text}
+        if user_id:
+            data["user_id"] = user_id
+        if session_id:
+            data["session_id"] = session_id
+        return await self._json("chat", "POST", data)
+
+    def _chunks(self, items: List[Any]) -> List[List[Any]]:
+        return [
+            items[start : start + self.batch_size]
+            for start in range(0, len(items), self.batch_size)
+        ]
+
+    async def encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Encodes texts in batch_size chunks, sent concurrently."""
+        matrices = await self.gather(
+            [self._binary("batch_encode", {"texts": c}) for c in self._chunks(texts)]
+        )
+        if not matrices:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(matrices)
+
+    async def _batch_results(self, endpoint: str, texts: List[str]) -> List[Dict]:
+        chunks = self._chunks(texts)
+        responses = await self.gather(
+            [self._json(endpoint, "POST", {"texts": c}) for c in chunks]
+        )
+        results = []
+        for offset, response in zip(range(0, len(texts), self.batch_size), responses):
+            for item in response.get("results", []):
+                item["index"] = item.get("index", 0) + offset
+                results.append(item)
+        return results
+
+    async def batch_tokenize(self, texts: List[str]) -> List[Dict[str, Any]]:
+        return await self._batch_results("batch_tokenize", texts)
+
+    async def batch_parse(self, texts: List[str]) -> List[Dict[str, Any]]:
+        return await self._batch_results("batch_parse", texts)
+
+    async def gather(self, coroutines: List[Any]) -> List[Any]:
+        """
+        Runs coroutines with at most `concurrency` in flight, preserving order.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(coro):
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(bounded(c) for c in coroutines))
+
+
 # Convenience functions for quick access
 def create_client(base_url: str = "http://localhost:8001") -> NLPClient:
     """Create a new NLP client instance."""
@@ -260,11 +758,10 @@ def quick_tokenize(text: str, base_url: str = "http://localhost:8001") -> List[s
     return result.get("tokens", [])
 
 
-def quick_encode(text: str, base_url: str = "http://localhost:8001") -> List[float]:
+def quick_encode(text: str, base_url: str = "http://localhost:8001") -> np.ndarray:
     """Quickly encode text and return just the vector."""
     client = NLPClient(base_url)
-    result = client.encode(text)
-    return result.get("vector", [])
+    return client.encode(text)
 
 
 def quick_chat(text: str, base_url: str = "http://localhost:8001") -> str:
@@ -274,8 +771,67 @@ def quick_chat(text: str, base_url: str = "http://localhost:8001") -> str:
     return result.get("response", "")
 
 
+def benchmark_transports(
+    base_url: str = "http://localhost:8001",
+    unix_socket: Optional[str] = "auto",
+    iterations: int = 200,
+    warmup: int = 10,
+) -> Dict[str, Any]:
+    """
+    Compares per-request latency over TCP and the Unix socket for small
+    /tokenize and /similarity payloads against a running service.
+    Returns milliseconds (mean/p50/p95) per transport and endpoint.
+    """
+    import time
+
+    calls = {
+        "tokenize": lambda c: c.tokenize("Buy AAPL on the dip"),
+        "similarity": lambda c: c.similarity("stock rally", "market rally"),
+    }
+    clients = {"tcp": NLPClient(base_url, unix_socket=None)}
+    socket_path = resolve_socket(base_url, unix_socket)
+    if socket_path:
+        clients["unix"] = NLPClient(base_url, unix_socket=socket_path)
+
+    report = {"iterations": iterations, "socket": socket_path, "results": {}}
+    for transport, client in clients.items():
+        report["results"][transport] = {}
+        for name, call in calls.items():
+            for _ in range(warmup):
+                call(client)
+            samples = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                call(client)
+                samples.append((time.perf_counter() - start) * 1000.0)
+            samples.sort()
+            report["results"][transport][name] = {
+                "mean_ms": round(sum(samples) / len(samples), 3),
+                "p50_ms": round(samples[len(samples) // 2], 3),
+                "p95_ms": round(samples[int(len(samples) * 0.95) - 1], 3),
+            }
+        client.session.close()
+
+    if "unix" in report["results"]:
+        report["speedup_p50"] = {
+            name: round(
+                report["results"]["tcp"][name]["p50_ms"]
+                / max(report["results"]["unix"][name]["p50_ms"], 1e-9),
+                2,
+            )
+            for name in calls
+        }
+    return report
+
+
 # Example usage
 if __name__ == "__main__":
+    import sys
+
+    if "--bench" in sys.argv:
+        print(json.dumps(benchmark_transports(), indent=2))
+        sys.exit(0)
+
     # Create client
     client = NLPClient()
 
@@ -289,7 +845,7 @@ if __name__ == "__main__":
 
     # Health check
     health = client.health_check()
-    print(f"Service Status: {health.get('status')}")
+    print(f"Service Status: {health.get('status')} (transport: {client.transport})")
 
     # Tokenization
     text = "Hello, this is a test of the GremlinGPT NLP service!"
@@ -298,7 +854,7 @@ if __name__ == "__main__":
 
     # Encoding
     encoding = client.encode(text)
-    print(f"Vector dimension: {encoding.get('dimension')}")
+    print(f"Vector dimension: {encoding.shape[0]}")
 
     # Chat
     chat_response = client.chat(
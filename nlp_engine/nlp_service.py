@@ -34,6 +34,8 @@ from conda_envs.environments.nlp.globals import (
 import sys
 import os
 import json
+import stat
+import socket
 import traceback
 
 try:
@@ -85,23 +87,51 @@ except ImportError:
 from datetime import datetime
 
 try:
-    from flask import Flask, request, jsonify
+    from flask import Flask, request, jsonify, Response, stream_with_context
 
     HAS_FLASK = True
 except ImportError:
     HAS_FLASK = False
-    Flask = request = jsonify = None
+    Flask = request = jsonify = Response = stream_with_context = None
+
+# Binary/base64/NDJSON vector transport (needs numpy)
+try:
+    from nlp_engine import vector_codec
+except ImportError:
+    vector_codec = None
+
+# Worker processes for the CPU-bound endpoints (parse, pos_tag, diff)
+try:
+    from nlp_engine.process_pool import PoolBusy, make_process_pool
+except ImportError:
+    make_process_pool = None
+
+    class PoolBusy(Exception):
+        pass
+
+
+# LRU (+ disk spill) cache for the idempotent endpoints
+try:
+    from nlp_engine.result_cache import make_result_cache
+except ImportError:
+    make_result_cache = None
+
 
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+from nlp_engine.pipeline import PipelineEngine
+from nlp_engine.session_store import make_session_store
+from nlp_engine.service_paths import service_socket_path
 
 # Import all NLP components
 try:
-    from .tokenizer import Tokenizer, tokenize
+    from .tokenizer import Tokenizer, tokenize, tokenize_batch
     from .transformer_core import TransformerCore, encode
     from .mini_attention import MiniMultiHeadAttention
     from .chat_session import ChatSession
-    from .parser import parse_nlp
+    from .parser import parse_nlp, parse_nlp_batch
     from .semantic_score import reasoned_similarity
     from .pos_tagger import get_pos_tags
     from .diff_engine import diff_texts
@@ -109,12 +139,12 @@ except ImportError as e:
     logger.warning(f"Some NLP components not available for relative import: {e}")
     # Try absolute imports as fallback
     try:
-        from nlp_engine.tokenizer import Tokenizer, tokenize
+        from nlp_engine.tokenizer import Tokenizer, tokenize, tokenize_batch
         from nlp_engine.transformer_core import TransformerCore, encode
         from nlp_engine.mini_attention import MiniMultiHeadAttention
         from nlp_engine.chat_session import ChatSession
         from nlp_engine.semantic_score import reasoned_similarity
-        from nlp_engine.parser import parse_nlp
+        from nlp_engine.parser import parse_nlp, parse_nlp_batch
         from nlp_engine.pos_tagger import get_pos_tags
         from nlp_engine.diff_engine import diff_texts
     except ImportError as e2:
@@ -332,6 +362,13 @@ except ImportError as e:
             tokens = re.findall(r"\w+|[^\w\s]", text.lower())
             return tokens
 
+        def tokenize_batch(texts, return_offsets=False, **kwargs):
+            """Robust fallback batch tokenization"""
+            results = [tokenize(text) for text in texts]
+            if return_offsets:
+                return [{"ids": tokens, "offsets": []} for tokens in results]
+            return results
+
         def encode(text):
             """Robust fallback encoding function"""
             if not text:
@@ -419,6 +456,10 @@ except ImportError as e:
                 "confidence": 0.6 if financial_hits or code_entities else 0.3,
             }
 
+        def parse_nlp_batch(texts, batch_size=None, n_process=None):
+            """Robust fallback batch parsing"""
+            return [parse_nlp(text) for text in texts]
+
         def get_pos_tags(text):
             """Robust fallback POS tagging"""
             if not text:
@@ -554,6 +595,34 @@ except ImportError as e:
             }
 
 
+# Shared spaCy Doc for the step pipeline; without it parse/pos_tag run standalone
+try:
+    from nlp_engine.parser import make_doc, doc_pos_tags, parse_doc
+except ImportError:
+    make_doc = doc_pos_tags = parse_doc = None
+
+# Side-effect-free model calls for the warmup (no memory, log or watermark writes)
+try:
+    from nlp_engine.parser import parse_text
+    from nlp_engine.pos_tagger import tag_text
+    from nlp_engine.semantic_score import semantic_similarity
+except ImportError:
+    parse_text = tag_text = semantic_similarity = None
+
+PIPELINE_WORKERS = CFG.get("nlp", {}).get("pipeline_workers", 4)
+
+# Steps /pipeline accepts; the other graph nodes are shared intermediates
+PIPELINE_STEPS = ("tokenize", "encode", "parse", "pos_tag", "similarity")
+
+# Startup warmup: representative inputs through every model and endpoint
+WARMUP_CFG = CFG.get("nlp", {}).get("warmup", {})
+WARMUP_TEXTS = WARMUP_CFG.get("texts") or [
+    "Warm up the tokenizer, encoder and parser.",
+    "Apple shares rose 3% after earnings beat expectations while the Fed held rates.",
+]
+# Endpoints the warmup may POST: they only compute, so nothing is recorded
+WARMUP_ROUTES = ("/tokenize", "/encode", "/diff")
+
 # ========================================================================================
 # LAZY LOADING UTILITY PATTERN
 # ========================================================================================
@@ -630,6 +699,10 @@ embed_text, package_embedding = lazy_import_memory()
 (log_event,) = lazy_import_history()
 (inject_task,) = lazy_import_orchestrator()
 
+# Local callers (backend, agents, FSM) reach the service over this Unix
+# socket (the path NLPClient dials); TCP stays available for everything else.
+SERVICE_SOCKET = service_socket_path(CFG.get("nlp", {}).get("service_socket"))
+
 
 class NLPService:
     """
@@ -637,13 +710,21 @@ class NLPService:
     Provides REST API endpoints for other services to interact with.
     """
 
-    def __init__(self, port=8001):
+    def __init__(self, port=8001, unix_socket=None):
         if not HAS_FLASK:
             raise ImportError(
                 "Flask is required for NLP Service. Please install flask: pip install flask"
             )
 
         self.port = port
+        self.unix_socket = SERVICE_SOCKET if unix_socket is None else unix_socket
+        self._unix_server = None
+        self.process_pool = self._make_process_pool()
+        self.result_cache = make_result_cache() if make_result_cache else None
+        self.pipeline = self._build_pipeline()
+        self.pipeline_executor = ThreadPoolExecutor(
+            max_workers=PIPELINE_WORKERS, thread_name_prefix="nlp-pipeline"
+        )
         self.app = Flask(__name__)
         self.app.config["JSON_SORT_KEYS"] = False
 
@@ -657,13 +738,14 @@ class NLPService:
             embed_dim=384, num_heads=8, scale=True, seed=42
         )
 
-        # Session management
-        self.chat_sessions = {}
+        # Session management (LRU/TTL bounded, replayed from the append log)
+        self.chat_sessions = make_session_store(ChatSession)
 
         # Service status
         self.start_time = datetime.now()
         self.request_count = 0
         self.health_status = "initializing"
+        self.warmup = {"state": "pending", "components": {}}
 
         # Setup routes
         self._setup_routes()
@@ -678,10 +760,12 @@ class NLPService:
 
         @self.app.route("/health", methods=["GET"])
         def health_check():
-            """Health check endpoint"""
-            return jsonify(
+            """Health check endpoint; 503 "warming" until the warmup is done"""
+            warmup = self.warmup  # one snapshot; warm_up replaces, never mutates
+            warming = warmup["state"] == "running"
+            response = jsonify(
                 {
-                    "status": self.health_status,
+                    "status": "warming" if warming else self.health_status,
                     "uptime": str(datetime.now() - self.start_time),
                     "request_count": self.request_count,
                     "components": {
@@ -691,9 +775,14 @@ class NLPService:
                         ),
                         "attention": "available" if self.attention else "unavailable",
                     },
+                    "warmup": warmup,
                     "timestamp": datetime.now().isoformat(),
                 }
             )
+            if warming:
+                response.status_code = 503
+                response.headers["Retry-After"] = "1"
+            return response
 
         @self.app.route("/tokenize", methods=["POST"])
         def tokenize_text():
@@ -706,7 +795,7 @@ class NLPService:
                 if not text:
                     return jsonify({"error": "No text provided"}), 400
 
-                tokens = tokenize(text)
+                tokens = self._cached("tokenize", [text], lambda: tokenize(text))
 
                 return jsonify(
                     {"tokens": tokens, "count": len(tokens), "original_text": text}
@@ -727,7 +816,24 @@ class NLPService:
                 if not text:
                     return jsonify({"error": "No text provided"}), 400
 
-                vector = encode(text)
+                vector = self._cached("encode", [text], lambda: encode(text))
+                fmt = self._vector_format(data)
+
+                if fmt == "binary":
+                    payload, shape = vector_codec.to_bytes(vector)
+                    return Response(
+                        payload,
+                        mimetype=vector_codec.MIME_BINARY,
+                        headers=vector_codec.binary_headers(shape),
+                    )
+                if fmt == "base64":
+                    return jsonify(
+                        {
+                            **vector_codec.to_base64(vector),
+                            "dimension": len(vector),
+                            "original_text": text,
+                        }
+                    )
 
                 return jsonify(
                     {
@@ -759,11 +865,7 @@ class NLPService:
                     return jsonify({"error": "No text provided"}), 400
 
                 # Get or create chat session
-                if session_id and session_id in self.chat_sessions:
-                    session = self.chat_sessions[session_id]
-                else:
-                    session = ChatSession(user_id=user_id)
-                    self.chat_sessions[session.session_id] = session
+                session = self.chat_sessions.get_or_create(session_id, user_id)
 
                 # Process input through chat session
                 response = session.process_input(text)
@@ -792,7 +894,11 @@ class NLPService:
                 if not text1 or not text2:
                     return jsonify({"error": "Both text1 and text2 required"}), 400
 
-                similarity = reasoned_similarity(text1, text2)
+                similarity = self._cached(
+                    "similarity",
+                    [text1, text2],
+                    lambda: reasoned_similarity(text1, text2),
+                )
 
                 return jsonify(
                     {"similarity": similarity, "text1": text1, "text2": text2}
@@ -813,10 +919,14 @@ class NLPService:
                 if not text:
                     return jsonify({"error": "No text provided"}), 400
 
-                parsed = parse_nlp(text)
+                parsed = self._cached(
+                    "parse", [text], lambda: self._offload("parse", parse_nlp, text)
+                )
 
                 return jsonify({"parsed": parsed, "original_text": text})
 
+            except PoolBusy as e:
+                return self._busy_response(e)
             except Exception as e:
                 logger.error(f"[NLP_SERVICE] Parsing error: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -832,10 +942,16 @@ class NLPService:
                 if not text:
                     return jsonify({"error": "No text provided"}), 400
 
-                tags = get_pos_tags(text)
+                tags = self._cached(
+                    "pos_tag",
+                    [text],
+                    lambda: self._offload("pos_tag", get_pos_tags, text),
+                )
 
                 return jsonify({"tags": tags, "original_text": text})
 
+            except PoolBusy as e:
+                return self._busy_response(e)
             except Exception as e:
                 logger.error(f"[NLP_SERVICE] POS tagging error: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -852,10 +968,16 @@ class NLPService:
                 if not text1 or not text2:
                     return jsonify({"error": "Both text1 and text2 required"}), 400
 
-                diff = diff_texts(text1, text2)
+                diff = self._cached(
+                    "diff",
+                    [text1, text2],
+                    lambda: self._offload("diff", diff_texts, text1, text2),
+                )
 
                 return jsonify({"diff": diff, "text1": text1, "text2": text2})
 
+            except PoolBusy as e:
+                return self._busy_response(e)
             except Exception as e:
                 logger.error(f"[NLP_SERVICE] Diff error: {e}")
                 return jsonify({"error": str(e)}), 500
@@ -996,18 +1118,30 @@ class NLPService:
                 if not isinstance(texts, list):
                     return jsonify({"error": "texts must be a list"}), 400
 
+                return_offsets = bool(data.get("return_offsets", False))
+                try:
+                    batch = tokenize_batch(texts, return_offsets=return_offsets)
+                except Exception as e:
+                    logger.warning(
+                        f"[NLP_SERVICE] Batch tokenizer failed, tokenizing one by one: {e}"
+                    )
+                    batch = [None] * len(texts)
+
                 results = []
-                for i, text in enumerate(texts):
+                for i, (text, item) in enumerate(zip(texts, batch)):
                     try:
-                        tokens = tokenize(text)
-                        results.append(
-                            {
-                                "index": i,
-                                "tokens": tokens,
-                                "count": len(tokens),
-                                "original_text": text,
-                            }
-                        )
+                        if item is None:
+                            item = tokenize(text)
+                        tokens = item["ids"] if return_offsets else item
+                        result = {
+                            "index": i,
+                            "tokens": tokens,
+                            "count": len(tokens),
+                            "original_text": text,
+                        }
+                        if return_offsets:
+                            result["offsets"] = item.get("offsets", [])
+                        results.append(result)
                     except Exception as e:
                         results.append(
                             {"index": i, "error": str(e), "original_text": text}
@@ -1025,6 +1159,42 @@ class NLPService:
                 logger.error(f"[NLP_SERVICE] Batch tokenization error: {e}")
                 return jsonify({"error": str(e)}), 500
 
+        @self.app.route("/batch_parse", methods=["POST"])
+        def batch_parse():
+            """Parse multiple texts in one spaCy pipe pass"""
+            self.request_count += 1
+            try:
+                data = request.get_json()
+                texts = data.get("texts", [])
+
+                if not texts:
+                    return jsonify({"error": "No texts provided"}), 400
+
+                if not isinstance(texts, list):
+                    return jsonify({"error": "texts must be a list"}), 400
+
+                parsed = parse_nlp_batch(
+                    texts,
+                    batch_size=data.get("batch_size"),
+                    n_process=data.get("n_process"),
+                )
+                results = [
+                    {"index": i, "parsed": p, "original_text": text}
+                    for i, (text, p) in enumerate(zip(texts, parsed))
+                ]
+
+                return jsonify(
+                    {
+                        "results": results,
+                        "total_processed": len(texts),
+                        "successful": len(results),
+                    }
+                )
+
+            except Exception as e:
+                logger.error(f"[NLP_SERVICE] Batch parsing error: {e}")
+                return jsonify({"error": str(e)}), 500
+
         @self.app.route("/batch_encode", methods=["POST"])
         def batch_encode():
             """Encode multiple texts to vectors at once"""
@@ -1039,6 +1209,38 @@ class NLPService:
                 if not isinstance(texts, list):
                     return jsonify({"error": "texts must be a list"}), 400
 
+                fmt = self._vector_format(data)
+
+                if fmt == "ndjson":
+                    # Stream one base64 record per text as soon as it is encoded
+                    def generate():
+                        for i, text in enumerate(texts):
+                            try:
+                                yield vector_codec.ndjson_line(i, encode(text))
+                            except Exception as e:
+                                yield json.dumps({"index": i, "error": str(e)}) + "\n"
+
+                    return Response(
+                        stream_with_context(generate()),
+                        mimetype=vector_codec.MIME_NDJSON,
+                    )
+
+                if fmt in ("binary", "base64"):
+                    matrix = vector_codec.as_matrix([encode(text) for text in texts])
+                    if fmt == "binary":
+                        return Response(
+                            matrix.tobytes(),
+                            mimetype=vector_codec.MIME_BINARY,
+                            headers=vector_codec.binary_headers(matrix.shape),
+                        )
+                    return jsonify(
+                        {
+                            **vector_codec.to_base64(matrix),
+                            "total_processed": len(texts),
+                            "successful": len(texts),
+                        }
+                    )
+
                 results = []
                 for i, text in enumerate(texts):
                     try:
@@ -1084,47 +1286,40 @@ class NLPService:
                 if not text:
                     return jsonify({"error": "No text provided"}), 400
 
-                analysis = {}
-
-                # Tokenization
-                try:
-                    tokens = tokenize(text)
-                    analysis["tokenization"] = {"tokens": tokens, "count": len(tokens)}
-                except Exception as e:
-                    analysis["tokenization"] = {"error": str(e)}
-
-                # POS tagging
-                try:
-                    pos_tags = get_pos_tags(text)
-                    analysis["pos_tagging"] = {"tags": pos_tags, "count": len(pos_tags)}
-                except Exception as e:
-                    analysis["pos_tagging"] = {"error": str(e)}
-
-                # Parsing
-                try:
-                    parsed = parse_nlp(text)
-                    analysis["parsing"] = parsed
-                except Exception as e:
-                    analysis["parsing"] = {"error": str(e)}
-
-                # Vector encoding (optional)
+                targets = ["tokenize", "pos_tag", "parse"]
                 if include_vector:
-                    try:
-                        vector = encode(text)
-                        analysis["encoding"] = {
-                            "vector": (
-                                vector.tolist()
-                                if HAS_NUMPY and hasattr(vector, "tolist")
-                                else vector
-                            ),
-                            "dimension": len(vector),
-                        }
-                    except Exception as e:
-                        analysis["encoding"] = {"error": str(e)}
+                    targets.append("encode")
+                run = self.pipeline.run(
+                    targets, {"text": text}, executor=self.pipeline_executor
+                )
+                results, errors = run["results"], run["errors"]
+
+                def section(step, build):
+                    if step in results:
+                        return build(results[step])
+                    return {"error": errors.get(step, "not executed")}
+
+                analysis = {
+                    "tokenization": section(
+                        "tokenize",
+                        lambda tokens: {"tokens": tokens, "count": len(tokens)},
+                    ),
+                    "pos_tagging": section(
+                        "pos_tag", lambda tags: {"tags": tags, "count": len(tags)}
+                    ),
+                    "parsing": section("parse", lambda parsed: parsed),
+                }
+                if include_vector:
+                    analysis["encoding"] = section(
+                        "encode",
+                        lambda vector: {"vector": vector, "dimension": len(vector)},
+                    )
 
                 return jsonify(
                     {
                         "analysis": analysis,
+                        "timings_ms": run["timings_ms"],
+                        "wall_ms": run["wall_ms"],
                         "original_text": text,
                         "timestamp": datetime.now().isoformat(),
                     }
@@ -1139,20 +1334,27 @@ class NLPService:
             """Get information about a specific chat session"""
             self.request_count += 1
             try:
-                if session_id not in self.chat_sessions:
+                session = self.chat_sessions.get(session_id)
+                if session is None:
                     return jsonify({"error": "Session not found"}), 404
 
-                session = self.chat_sessions[session_id]
-                return jsonify(
-                    {
+                info = (
+                    session.describe()
+                    if hasattr(session, "describe")
+                    else {
                         "session_id": session_id,
                         "user_id": getattr(session, "user_id", "unknown"),
+                    }
+                )
+                return jsonify(
+                    {
+                        **info,
+                        "summary": getattr(session, "summary", ""),
                         "history": (
                             session.get_history()
                             if hasattr(session, "get_history")
                             else []
                         ),
-                        "created": "unknown",  # Add timestamp tracking in future
                     }
                 )
 
@@ -1165,10 +1367,9 @@ class NLPService:
             """Delete a specific chat session"""
             self.request_count += 1
             try:
-                if session_id not in self.chat_sessions:
+                if not self.chat_sessions.delete(session_id):
                     return jsonify({"error": "Session not found"}), 404
 
-                del self.chat_sessions[session_id]
                 return jsonify(
                     {
                         "message": f"Session {session_id} deleted successfully",
@@ -1185,19 +1386,7 @@ class NLPService:
             """List all active chat sessions"""
             self.request_count += 1
             try:
-                sessions = []
-                for session_id, session in self.chat_sessions.items():
-                    sessions.append(
-                        {
-                            "session_id": session_id,
-                            "user_id": getattr(session, "user_id", "unknown"),
-                            "history_length": (
-                                len(session.get_history())
-                                if hasattr(session, "get_history")
-                                else 0
-                            ),
-                        }
-                    )
+                sessions = self.chat_sessions.list()
 
                 return jsonify({"sessions": sessions, "total_count": len(sessions)})
 
@@ -1220,36 +1409,31 @@ class NLPService:
                 if not isinstance(steps, list):
                     return jsonify({"error": "steps must be a list"}), 400
 
-                results = {}
+                inputs = {"text": text}
+                if "reference_text" in data:
+                    inputs["reference_text"] = data["reference_text"]
+                targets = [step for step in steps if step in PIPELINE_STEPS]
+                run = self.pipeline.run(
+                    targets, inputs, executor=self.pipeline_executor
+                )
 
+                results = {}
                 for step in steps:
-                    try:
-                        if step == "tokenize":
-                            results["tokenize"] = tokenize(text)
-                        elif step == "encode":
-                            vector = encode(text)
-                            results["encode"] = (
-                                vector.tolist()
-                                if HAS_NUMPY and hasattr(vector, "tolist")
-                                else vector
-                            )
-                        elif step == "parse":
-                            results["parse"] = parse_nlp(text)
-                        elif step == "pos_tag":
-                            results["pos_tag"] = get_pos_tags(text)
-                        elif step == "similarity" and "reference_text" in data:
-                            results["similarity"] = reasoned_similarity(
-                                text, data["reference_text"]
-                            )
-                        else:
-                            results[step] = {"error": f"Unknown step: {step}"}
-                    except Exception as e:
-                        results[step] = {"error": str(e)}
+                    if step not in PIPELINE_STEPS:
+                        results[step] = {"error": f"Unknown step: {step}"}
+                    elif step in run["results"]:
+                        results[step] = run["results"][step]
+                    else:
+                        results[step] = {
+                            "error": run["errors"].get(step, "not executed")
+                        }
 
                 return jsonify(
                     {
                         "pipeline_results": results,
                         "steps_executed": list(results.keys()),
+                        "timings_ms": run["timings_ms"],
+                        "wall_ms": run["wall_ms"],
                         "original_text": text,
                     }
                 )
@@ -1266,9 +1450,12 @@ class NLPService:
                     "service": "NLP Engine",
                     "status": self.health_status,
                     "port": self.port,
+                    "unix_socket": self.unix_socket if self._unix_server else None,
                     "uptime": str(datetime.now() - self.start_time),
                     "requests_served": self.request_count,
                     "active_sessions": len(self.chat_sessions),
+                    "sessions": self.chat_sessions.stats(),
+                    "warmup": self.warmup,
                     "components": {
                         "tokenizer": {
                             "status": "available" if self.tokenizer else "unavailable",
@@ -1300,7 +1487,18 @@ class NLPService:
                                 if self.attention
                                 else None
                             ),
+                            "telemetry": (
+                                self.attention.telemetry.stats()
+                                if getattr(self.attention, "telemetry", None)
+                                else None
+                            ),
                         },
+                        "process_pool": (
+                            self.process_pool.stats() if self.process_pool else None
+                        ),
+                        "result_cache": (
+                            self.result_cache.stats() if self.result_cache else None
+                        ),
                     },
                     "endpoints": [
                         "/health",
@@ -1331,8 +1529,8 @@ class NLPService:
                     "endpoints": {
                         "/health": {
                             "method": "GET",
-                            "description": "Service health check",
-                            "response": "Service status, uptime, and component availability",
+                            "description": "Service health check (503 while warming up)",
+                            "response": "Service status, uptime, component availability and warmup timings",
                         },
                         "/status": {
                             "method": "GET",
@@ -1352,7 +1550,10 @@ class NLPService:
                         "/encode": {
                             "method": "POST",
                             "description": "Encode text to vector representation",
-                            "body": {"text": "string"},
+                            "body": {
+                                "text": "string",
+                                "format": "json|binary|base64 (optional, or Accept header)",
+                            },
                             "response": {
                                 "vector": ["array"],
                                 "dimension": "number",
@@ -1420,7 +1621,24 @@ class NLPService:
                         "/batch_tokenize": {
                             "method": "POST",
                             "description": "Tokenize multiple texts at once",
-                            "body": {"texts": ["array of strings"]},
+                            "body": {
+                                "texts": ["array of strings"],
+                                "return_offsets": "boolean (optional)",
+                            },
+                            "response": {
+                                "results": ["array"],
+                                "total_processed": "number",
+                                "successful": "number",
+                            },
+                        },
+                        "/batch_parse": {
+                            "method": "POST",
+                            "description": "Parse multiple texts in one spaCy pipe pass",
+                            "body": {
+                                "texts": ["array of strings"],
+                                "batch_size": "number (optional)",
+                                "n_process": "number (optional)",
+                            },
                             "response": {
                                 "results": ["array"],
                                 "total_processed": "number",
@@ -1430,7 +1648,10 @@ class NLPService:
                         "/batch_encode": {
                             "method": "POST",
                             "description": "Encode multiple texts to vectors at once",
-                            "body": {"texts": ["array of strings"]},
+                            "body": {
+                                "texts": ["array of strings"],
+                                "format": "json|binary|base64|ndjson (optional, or Accept header)",
+                            },
                             "response": {
                                 "results": ["array"],
                                 "total_processed": "number",
@@ -1446,6 +1667,8 @@ class NLPService:
                             },
                             "response": {
                                 "analysis": "object",
+                                "timings_ms": "object (per step)",
+                                "wall_ms": "number",
                                 "original_text": "string",
                                 "timestamp": "string",
                             },
@@ -1477,7 +1700,7 @@ class NLPService:
                         },
                         "/pipeline": {
                             "method": "POST",
-                            "description": "Execute a custom NLP pipeline with configurable steps",
+                            "description": "Execute NLP steps (tokenize, encode, parse, pos_tag, similarity) as a dependency graph, sharing intermediates and running independent steps concurrently",
                             "body": {
                                 "text": "string",
                                 "steps": ["array"],
@@ -1486,6 +1709,8 @@ class NLPService:
                             "response": {
                                 "pipeline_results": "object",
                                 "steps_executed": ["array"],
+                                "timings_ms": "object (per step)",
+                                "wall_ms": "number",
                                 "original_text": "string",
                             },
                         },
@@ -1498,6 +1723,91 @@ class NLPService:
                 }
             )
 
+    def _vector_format(self, data):
+        """
+        Response format for vector endpoints: the body's "format" field or the
+        Accept header; plain JSON when the codec (numpy) is unavailable.
+        """
+        if not (vector_codec and HAS_NUMPY):
+            return "json"
+        return vector_codec.negotiate_format(
+            request.headers.get("Accept"), (data or {}).get("format")
+        )
+
+    def _make_process_pool(self):
+        # Only endpoints backed by the real modules; the fallbacks above run inline
+        pooled = [
+            endpoint
+            for endpoint, function in (
+                ("parse", parse_nlp),
+                ("pos_tag", get_pos_tags),
+                ("diff", diff_texts),
+            )
+            if function.__module__ != __name__
+        ]
+        if not (make_process_pool and pooled):
+            return None
+        return make_process_pool(endpoints=pooled)
+
+    def _build_pipeline(self):
+        """
+        Step graph behind /pipeline and /analyze. Token ids, the spaCy Doc
+        and the embedding are computed once per request and shared by the
+        steps that need them; independent branches run concurrently.
+        """
+
+        def encode_step(embedding):
+            return (
+                embedding.tolist()
+                if HAS_NUMPY and hasattr(embedding, "tolist")
+                else embedding
+            )
+
+        engine = PipelineEngine(max_workers=PIPELINE_WORKERS)
+        engine.add("tokens", tokenize, ("text",))
+        engine.add("embedding", encode, ("text",))
+        engine.add("tokenize", lambda tokens: tokens, ("tokens",))
+        engine.add("encode", encode_step, ("embedding",))
+        engine.add(
+            "similarity",
+            lambda text, reference_text: reasoned_similarity(text, reference_text),
+            ("text", "reference_text"),
+        )
+        if make_doc:
+            engine.add("doc", make_doc, ("text",))
+            engine.add("parse", parse_doc, ("text", "doc", "tokens"))
+            engine.add("pos_tag", doc_pos_tags, ("doc",))
+        else:
+            engine.add("parse", parse_nlp, ("text",))
+            engine.add("pos_tag", get_pos_tags, ("text",))
+        return engine
+
+    def _cached(self, endpoint, args, compute):
+        """
+        Serves endpoint(args) from the result cache, computing on a miss.
+        "Cache-Control: no-cache" on the request bypasses the lookup.
+        """
+        if self.result_cache is None:
+            return compute()
+        if "no-cache" in request.headers.get("Cache-Control", ""):
+            return compute()
+        return self.result_cache.get_or_compute(endpoint, args, compute)
+
+    def _offload(self, endpoint, function, *args):
+        """
+        Runs a CPU-bound endpoint function in the process pool when there is
+        one; in the request thread otherwise (or while the pool warms up).
+        """
+        if self.process_pool is None:
+            return function(*args)
+        return self.process_pool.run(endpoint, *args)
+
+    def _busy_response(self, error):
+        response = jsonify({"error": str(error), "retry": True})
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+        return response
+
     def _perform_health_check(self):
         """Perform internal health check of all components"""
         try:
@@ -1554,16 +1864,188 @@ class NLPService:
                     },
                 )
 
-    def run(self, debug=False, threaded=True):
+    def _warmup_steps(self):
+        """(component, callable) pairs run by warm_up, models first."""
+        texts = list(WARMUP_TEXTS)
+        long_text = " ".join(texts * 16)  # exercises long-sequence kernels
+        short, other = texts[0], texts[-1]
+
+        def attention():
+            if HAS_NUMPY:
+                self.attention.forward(
+                    np.random.normal(0, 1, (16, self.attention.embed_dim))
+                )
+
+        # Only side-effect-free calls: a restart must not embed the warmup
+        # texts into memory or write them to the event log
+        steps = [
+            ("tokenizer", lambda: (tokenize_batch(texts), tokenize(long_text))),
+            ("transformer", lambda: [encode(t) for t in texts + [long_text]]),
+            ("attention", attention),
+        ]
+        if semantic_similarity:
+            steps.append(("similarity", lambda: semantic_similarity(short, other)))
+        if parse_text:
+            steps.append(("parser", lambda: parse_text(long_text)))
+        if tag_text:
+            steps.append(("pos_tag", lambda: tag_text(other)))
+        steps.append(("diff", lambda: diff_texts(short, other)))
+        if self.process_pool:
+            # Joins the start() run() already kicked off; returns once workers are warm
+            steps.append(("process_pool", self.process_pool.start))
+        if WARMUP_CFG.get("endpoints", True):
+            bodies = {
+                "/tokenize": {"text": short},
+                "/encode": {"text": short},
+                "/diff": {"text1": short, "text2": other},
+            }
+            client = self.app.test_client()
+            for route in WARMUP_ROUTES:
+                body = bodies[route]
+                steps.append(
+                    (
+                        route,
+                        lambda route=route, body=body: client.post(
+                            route, json=body, headers={"Cache-Control": "no-cache"}
+                        ),
+                    )
+                )
+        return steps
+
+    def warm_up(self, iterations=None):
+        """
+        Runs representative inputs through each model and endpoint so the
+        first real requests do not pay for lazy loading and kernel setup.
+        /health answers 503 "warming" meanwhile. Per-component durations
+        (ms, first pass and total) land in self.warmup and the event log.
+
+        self.warmup is replaced by a new dict after every component and never
+        mutated, so /health and /status can serialize it while this runs.
+        """
+        iterations = max(1, int(iterations or WARMUP_CFG.get("iterations", 2)))
+        warmup_requests = 0
+        started = time.perf_counter()
+        state = {"state": "running", "started": datetime.now().isoformat()}
+        components = {}
+        self.warmup = dict(state, components={})
+        for name, step in self._warmup_steps():
+            timings = []
+            error = None
+            for _ in range(iterations):
+                t0 = time.perf_counter()
+                if name.startswith("/"):
+                    warmup_requests += 1
+                try:
+                    step()
+                except Exception as e:
+                    error = str(e)
+                    break
+                finally:
+                    timings.append((time.perf_counter() - t0) * 1000.0)
+            entry = {
+                "first_ms": round(timings[0], 3),
+                "total_ms": round(sum(timings), 3),
+                "ok": error is None,
+            }
+            if error:
+                entry["error"] = error
+                logger.warning(f"[NLP_SERVICE] Warmup of {name} failed: {error}")
+            components[name] = entry
+            self.warmup = dict(state, components=dict(components))
+        # Warmup traffic through the test client is not real traffic
+        self.request_count = max(0, self.request_count - warmup_requests)
+        warmup = dict(
+            state,
+            state="done",
+            finished=datetime.now().isoformat(),
+            total_ms=round((time.perf_counter() - started) * 1000.0, 3),
+            components=components,
+        )
+        self.warmup = warmup
+        logger.info(
+            f"[NLP_SERVICE] Warmup finished in {warmup['total_ms'] / 1000.0:.1f}s: "
+            + ", ".join(
+                f"{name}={c['total_ms']:.0f}ms" for name, c in components.items()
+            )
+        )
+        if log_event:
+            log_event("nlp_service", "warmup", warmup)
+        return warmup
+
+    def _start_unix_socket(self, threaded=True):
+        """
+        Serves the same app on self.unix_socket from a background thread.
+        A stale socket file is replaced; a live one (another instance) is left
+        alone and the service stays TCP-only.
+        """
+        path = self.unix_socket
+        if not path:
+            return None
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                logger.warning(f"[NLP_SERVICE] {path} exists and is not a socket")
+                return None
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+                logger.warning(f"[NLP_SERVICE] Unix socket {path} already in use")
+                return None
+            except OSError:
+                os.unlink(path)
+            finally:
+                probe.close()
+
+        try:
+            from werkzeug.serving import make_server
+
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            server = make_server(f"unix://{path}", 0, self.app, threaded=threaded)
+            os.chmod(path, 0o660)
+        except Exception as e:
+            logger.error(f"[NLP_SERVICE] Could not listen on {path}: {e}")
+            return None
+
+        threading.Thread(
+            target=server.serve_forever, name="nlp-unix-socket", daemon=True
+        ).start()
+        self._unix_server = server
+        logger.info(f"[NLP_SERVICE] Also listening on unix://{path}")
+        return server
+
+    def _stop_unix_socket(self):
+        if self._unix_server is None:
+            return
+        self._unix_server.shutdown()
+        self._unix_server.server_close()
+        self._unix_server = None
+        try:
+            os.unlink(self.unix_socket)
+        except OSError:
+            pass
+
+    def run(self, host="0.0.0.0", debug=False, threaded=True):
         """Run the NLP service"""
         logger.info(f"[NLP_SERVICE] Starting NLP Service on port {self.port}")
         logger.info(
             f"[NLP_SERVICE] Service endpoints available at http://localhost:{self.port}"
         )
+        self._start_unix_socket(threaded=threaded)
+        if self.process_pool:
+            threading.Thread(
+                target=self.process_pool.start, name="nlp-pool-start", daemon=True
+            ).start()
+        if WARMUP_CFG.get("enabled", True):
+            # Marked before the thread starts so /health never reports a cold service
+            self.warmup = {"state": "running", "components": {}}
+            threading.Thread(
+                target=self.warm_up, name="nlp-warmup", daemon=True
+            ).start()
+        else:
+            self.warmup = {"state": "disabled", "components": {}}
 
         try:
             self.app.run(
-                host="0.0.0.0",
+                host=host,
                 port=self.port,
                 debug=debug,
                 threaded=threaded,
@@ -1573,6 +2055,10 @@ class NLPService:
             logger.error(f"[NLP_SERVICE] Failed to start service: {e}")
             self.health_status = "failed"
             raise
+        finally:
+            self._stop_unix_socket()
+            if self.process_pool:
+                self.process_pool.shutdown(wait=False)
 
 
 def main():
@@ -1594,6 +2080,12 @@ def main():
         default="0.0.0.0",
         help="Host to bind the service to (default: 0.0.0.0)",
     )
+    parser.add_argument(
+        "--unix-socket",
+        type=str,
+        default=None,
+        help="Also serve on this Unix socket (default: NLP_SOCKET, nlp.service_socket or data/run/nlp_service.sock; '' to disable)",
+    )
 
     # Handle legacy positional argument for port (for backward compatibility)
     if len(sys.argv) > 1 and sys.argv[1].isdigit():
@@ -1611,7 +2103,7 @@ def main():
     logger.info(f"[NLP_SERVICE] Starting NLP Service on {host}:{port} (debug={debug})")
 
     # Create and run service
-    service = NLPService(port=port)
+    service = NLPService(port=port, unix_socket=args.unix_socket)
 
     try:
         service.run(host=host, debug=debug, threaded=True)
@@ -16,11 +16,12 @@ from conda_envs.environments.nlp.globals import *
 
 import spacy
 import ast
+import threading
 from datetime import datetime
 
 # Use relative imports within NLP environment
-from .tokenizer import tokenize
-from .pos_tagger import get_pos_tags
+from .tokenizer import tokenize_batch
+from .service_paths import resolve_root_path
 
 
 # For cross-environment communication (memory), use lazy loading
@@ -63,8 +64,17 @@ except:
 WATERMARK = "source:GremlinGPT"
 ORIGIN = "nlp_parser"
 
-# Load SpaCy English model
+PARSER_CFG = CFG.get("nlp", {})
+PIPE_BATCH_SIZE = PARSER_CFG.get("parser_batch_size", 64)
+PIPE_N_PROCESS = PARSER_CFG.get("parser_n_process", 1)
+# Components parse_nlp never reads (tags, entities and the dependency parse are kept)
+PIPE_DISABLE = PARSER_CFG.get("parser_disable", ["lemmatizer", "attribute_ruler"])
+
+# Load SpaCy English model with unused components pruned
 nlp = spacy.load("en_core_web_sm")
+for _pipe in PIPE_DISABLE:
+    if _pipe in nlp.pipe_names:
+        nlp.disable_pipe(_pipe)
 
 # === Financial Ontology Dictionary ===
 FIN_KEYWORDS = {
@@ -88,15 +98,122 @@ def extract_code_entities(code_str):
         return []
 
 
-def detect_financial_terms(text):
+def _resolve_ontology_path(path):
+    # $ROOT is the repository root (config/ lives there), not BASE_DIR
+    return resolve_root_path(path)
+
+
+class FinancialTermMatcher:
+    """
+    Precompiled multi-pattern matcher over the financial ontology.
+    All terms are folded into one case-insensitive alternation (longest first,
+    word-bounded, flexible inner whitespace, optional plural "s"), so a text is
+    scanned once no matter how many terms exist. The ontology is reloaded from its JSON file
+    whenever the file's mtime changes (checked at most every reload_interval s).
+    """
+
+    def __init__(self, ontology=None, path=None, reload_interval=5.0):
+        self.path = _resolve_ontology_path(path) if path else None
+        self.reload_interval = reload_interval
+        self._mtime = None
+        self._checked = 0.0
+        self._missing = False
+        self._lock = threading.Lock()
+        self._build(ontology or FIN_KEYWORDS)
+        if self.path:
+            self.maybe_reload(force=True)
+
+    @staticmethod
+    def _norm(term):
+        return " ".join(term.lower().split())
+
+    def _build(self, ontology):
+        categories = {}
+        for category, terms in ontology.items():
+            for term in terms:
+                categories.setdefault(self._norm(term), []).append((term, category))
+        alternatives = sorted(categories, key=len, reverse=True)
+        pattern = "|".join(
+            r"\s+".join(re.escape(word) for word in term.split())
+            for term in alternatives
+        )
+        regex = (
+            re.compile(rf"(?<!\w)(?P<term>{pattern})(?:'?s)?(?!\w)", re.IGNORECASE)
+            if pattern
+            else None
+        )
+        # One store, so a concurrent finditer never pairs the old regex with
+        # the new categories
+        self._compiled = (regex, categories)
+        self.ontology = ontology
+
+    def load(self, path=None):
+        """Loads the ontology ({category: [terms]}) from JSON and recompiles."""
+        path = _resolve_ontology_path(path) if path else self.path
+        with open(path, "r") as f:
+            ontology = json.load(f)
+        with self._lock:
+            self._build(ontology)
+            self.path = path
+            self._mtime = os.path.getmtime(path)
+        logger.info(f"[PARSER] Financial ontology loaded: {path}")
+
+    def maybe_reload(self, force=False):
+        if not self.path:
+            return False
+        now = time.monotonic()
+        if not force and now - self._checked < self.reload_interval:
+            return False
+        self._checked = now
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError as e:
+            if not self._missing:
+                self._missing = True
+                logger.warning(
+                    f"[PARSER] Financial ontology unavailable, using built-in terms: {e}"
+                )
+            return False
+        self._missing = False
+        if force or mtime != self._mtime:
+            try:
+                self.load()
+                return True
+            except Exception as e:
+                logger.warning(f"[PARSER] Financial ontology reload failed: {e}")
+        return False
+
+    def finditer(self, text):
+        """Yields (term, category, start, end) for every match in one pass."""
+        self.maybe_reload()
+        regex, categories = self._compiled
+        if not regex or not text:
+            return
+        for match in regex.finditer(text):
+            for term, category in categories[self._norm(match.group("term"))]:
+                yield term, category, match.start(), match.end()
+
+
+FINANCIAL_MATCHER = FinancialTermMatcher(
+    path=PARSER_CFG.get(
+        "financial_ontology_file", "$ROOT/config/financial_ontology.json"
+    )
+)
+
+
+def detect_financial_terms(text, with_offsets=False):
     """
     Scan input text for financial signal keywords.
+    Returns unique (term, category) pairs, or every match as
+    (term, category, start, end) when with_offsets is True.
     """
+    hits = FINANCIAL_MATCHER.finditer(text)
+    if with_offsets:
+        return list(hits)
     found = []
-    for category, terms in FIN_KEYWORDS.items():
-        for term in terms:
-            if term.lower() in text.lower():
-                found.append((term, category))
+    for term, category, _, _ in hits:
+        if (term, category) not in found:
+            found.append((term, category))
     return found
 
 
@@ -112,15 +229,12 @@ def classify_intent(text, code_entities, financial_hits):
         return "general"
 
 
-def parse_nlp(text):
+def _parse_doc(text, doc, tokens):
     """
-    Main NLP parsing pipeline. Extracts syntactic, semantic, and domain-specific intelligence.
-    Returns structured dictionary with full trace.
+    Builds the parse record for one text from its spaCy Doc and HF token ids.
+    POS tags, entities and dependencies all come from the same Doc.
     """
-    tokens = tokenize(text)
-    pos_tags = get_pos_tags(text)
-
-    doc = nlp(text)
+    pos_tags = doc_pos_tags(doc)
     entities = [(ent.text, ent.label_) for ent in doc.ents]
     dependencies = [(token.text, token.dep_, token.head.text) for token in doc]
 
@@ -131,33 +245,6 @@ def parse_nlp(text):
     financial_hits = detect_financial_terms(text)
     route = classify_intent(text, code_entities, financial_hits)
 
-    # Log and embed structured trace
-    summary = (
-        f"Intent: {route} | Tokens: {len(tokens)} | "
-        f"Entities: {len(entities)} | Finance Matches: {len(financial_hits)} | "
-        f"Code Constructs: {len(code_entities)}"
-    )
-
-    if embed_text and package_embedding and inject_watermark:
-        vector = embed_text(summary)
-
-        package_embedding(
-            text=summary,
-            vector=vector,
-            meta={
-                "origin": ORIGIN,
-                "timestamp": datetime.utcnow().isoformat(),
-                "route": route,
-                "tokens": len(tokens),
-                "entities": len(entities),
-                "financial_hits": financial_hits,
-                "code": bool(code_entities),
-                "watermark": WATERMARK,
-            },
-        )
-
-        inject_watermark(origin=ORIGIN)
-
     return {
         "route": route,
         "tokens": tokens,
@@ -167,3 +254,115 @@ def parse_nlp(text):
         "code_entities": code_entities,
         "financial_hits": financial_hits,
     }
+
+
+def _embed_parse_summary(results):
+    # Log and embed one structured trace per call, not per text
+    if not (results and embed_text and package_embedding and inject_watermark):
+        return
+
+    routes = [r["route"] for r in results]
+    token_count = sum(len(r["tokens"]) for r in results)
+    entity_count = sum(len(r["entities"]) for r in results)
+    financial_hits = [hit for r in results for hit in r["financial_hits"]]
+    code_count = sum(len(r["code_entities"]) for r in results)
+
+    if len(results) == 1:
+        summary = (
+            f"Intent: {routes[0]} | Tokens: {token_count} | "
+            f"Entities: {entity_count} | Finance Matches: {len(financial_hits)} | "
+            f"Code Constructs: {code_count}"
+        )
+    else:
+        summary = (
+            f"Batch: {len(results)} texts | Intents: {sorted(set(routes))} | "
+            f"Tokens: {token_count} | Entities: {entity_count} | "
+            f"Finance Matches: {len(financial_hits)} | Code Constructs: {code_count}"
+        )
+
+    vector = embed_text(summary)
+    package_embedding(
+        text=summary,
+        vector=vector,
+        meta={
+            "origin": ORIGIN,
+            "timestamp": datetime.utcnow().isoformat(),
+            "route": routes[0] if len(routes) == 1 else routes,
+            "tokens": token_count,
+            "entities": entity_count,
+            "financial_hits": financial_hits,
+            "code": code_count > 0,
+            "batch_size": len(results),
+            "watermark": WATERMARK,
+        },
+    )
+
+    inject_watermark(origin=ORIGIN)
+
+
+def parse_records(texts, batch_size=None, n_process=None):
+    """
+    Parses many texts with a single nlp.pipe pass and one fast-tokenizer call.
+    Returns a list of parse records in input order, without touching memory.
+    """
+    texts = [t if isinstance(t, str) else str(t) for t in texts]
+    if not texts:
+        return []
+
+    token_ids = tokenize_batch(texts)
+    docs = nlp.pipe(
+        texts,
+        batch_size=batch_size or PIPE_BATCH_SIZE,
+        n_process=n_process or PIPE_N_PROCESS,
+    )
+    return [
+        _parse_doc(text, doc, tokens)
+        for text, doc, tokens in zip(texts, docs, token_ids)
+    ]
+
+
+def parse_text(text):
+    """parse_nlp without the memory trace (process-pool workers run this)."""
+    return parse_records([text])[0]
+
+
+def record_parse(result):
+    """Embeds the trace of one parse_text result (in the owning process)."""
+    _embed_parse_summary([result])
+
+
+def parse_nlp_batch(texts, batch_size=None, n_process=None):
+    """
+    parse_records, plus one structured memory trace for the whole batch.
+    """
+    results = parse_records(texts, batch_size=batch_size, n_process=n_process)
+    _embed_parse_summary(results)
+    return results
+
+
+def make_doc(text):
+    """Runs the shared spaCy pipeline on one text."""
+    return nlp(text)
+
+
+def doc_pos_tags(doc):
+    """Penn Treebank (token, tag) pairs from a parsed Doc."""
+    return [(token.text, token.tag_) for token in doc]
+
+
+def parse_doc(text, doc, tokens):
+    """
+    parse_nlp for callers that already hold the Doc and token ids
+    (the service's step pipeline shares them across steps).
+    """
+    result = _parse_doc(text, doc, tokens)
+    _embed_parse_summary([result])
+    return result
+
+
+def parse_nlp(text):
+    """
+    Main NLP parsing pipeline. Extracts syntactic, semantic, and domain-specific intelligence.
+    Returns structured dictionary with full trace.
+    """
+    return parse_nlp_batch([text])[0]
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/pipeline.py :: Module Integrity Directive
+# Dependency-graph executor for multi-step NLP requests.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class PipelineStep:
+    """A node: fn is called with its dependencies' values as keyword arguments."""
+
+    __slots__ = ("name", "fn", "deps")
+
+    def __init__(self, name, fn, deps=()):
+        self.name = name
+        self.fn = fn
+        self.deps = tuple(deps)
+
+
+def _timed(fn, kwargs):
+    start = time.perf_counter()
+    try:
+        value, error = fn(**kwargs), None
+    except Exception as e:
+        value, error = None, e
+    return value, error, (time.perf_counter() - start) * 1000.0
+
+
+class PipelineEngine:
+    """
+    Runs the steps needed for a set of targets over a dependency graph.
+
+    Each intermediate (token ids, spaCy Doc, embedding, ...) is computed once
+    per run and handed to every step that depends on it; steps whose
+    dependencies are satisfied run concurrently on the executor. A failed
+    step fails its dependents without stopping unrelated branches.
+    """
+
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self.steps = {}
+
+    def add(self, name, fn, deps=()):
+        self.steps[name] = PipelineStep(name, fn, deps)
+        return self
+
+    def plan(self, targets, inputs=()):
+        """
+        Returns (needed, unresolved): the steps required for targets, and
+        {target: reason} for targets that are unknown or miss an input.
+        """
+        needed, unresolved = set(), {}
+
+        def visit(name, trail):
+            if name in inputs or name in needed:
+                return None
+            step = self.steps.get(name)
+            if step is None:
+                return (
+                    f"Unknown step: {name}" if not trail else f"Missing input: {name}"
+                )
+            if name in trail:
+                return f"Dependency cycle at {name}"
+            for dep in step.deps:
+                reason = visit(dep, trail + (name,))
+                if reason:
+                    return reason
+            needed.add(name)
+            return None
+
+        for target in targets:
+            reason = visit(target, ())
+            if reason:
+                unresolved[target] = reason
+        return needed, unresolved
+
+    def run(self, targets, inputs, executor=None):
+        """
+        Executes the graph for targets given inputs ({name: value}).
+
+        Returns a dict with "results" (target -> value), "errors"
+        (step -> message), "timings_ms" (step -> duration) and "wall_ms".
+        """
+        started = time.perf_counter()
+        needed, unresolved = self.plan(targets, inputs)
+        values = dict(inputs)
+        errors = dict(unresolved)
+        timings = {}
+        waiting = {
+            name: {dep for dep in self.steps[name].deps if dep not in inputs}
+            for name in needed
+        }
+        dependents = {}
+        for name in needed:
+            for dep in self.steps[name].deps:
+                dependents.setdefault(dep, []).append(name)
+
+        def fail(name, message):
+            errors[name] = message
+            for child in dependents.get(name, []):
+                if child in waiting:
+                    del waiting[child]
+                    fail(child, f"{name} failed")
+
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        running = {}
+        try:
+            while waiting or running:
+                for name in [n for n, deps in waiting.items() if not deps]:
+                    del waiting[name]
+                    step = self.steps[name]
+                    kwargs = {dep: values[dep] for dep in step.deps}
+                    running[executor.submit(_timed, step.fn, kwargs)] = name
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    value, error, elapsed = future.result()
+                    timings[name] = round(elapsed, 3)
+                    if error is not None:
+                        fail(name, str(error))
+                        continue
+                    values[name] = value
+                    for child in dependents.get(name, []):
+                        if child in waiting:
+                            waiting[child].discard(name)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+
+        return {
+            "results": {
+                t: values[t] for t in targets if t in values and t not in inputs
+            },
+            "errors": errors,
+            "timings_ms": timings,
+            "wall_ms": round((time.perf_counter() - started) * 1000.0, 3),
+        }
+
+
+__all__ = ["PipelineStep", "PipelineEngine"]
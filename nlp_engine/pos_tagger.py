@@ -79,10 +79,9 @@ else:
 # ─────────────────────────────────────────────────────────────
 
 
-def get_pos_tags(text):
+def tag_text(text):
     """
-    Performs part-of-speech tagging on input text.
-    Logs metadata and embeds summary in vector memory.
+    Performs part-of-speech tagging on input text, without touching memory.
     """
     if not HAS_NLTK:
         logger.warning("NLTK not available, returning basic POS tags")
@@ -106,32 +105,44 @@ def get_pos_tags(text):
         return tags
 
     try:
-        tokens = word_tokenize(text)
-        tags = pos_tag(tokens)
-
-        summary = f"POS tagging: {len(tokens)} tokens | Example: {tags[:3]}"
-
-        # Use utility function for conditional execution with memory functions
-        def store_embedding():
-            vector = embed_text(summary)
-            package_embedding(
-                text=summary,
-                vector=vector,
-                meta={
-                    "origin": ORIGIN,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "token_count": len(tokens),
-                    "watermark": WATERMARK,
-                },
-            )
-            inject_watermark(origin=ORIGIN)
-
-        conditional_execute(
-            (embed_text, package_embedding, inject_watermark), store_embedding
-        )
-
-        return tags
-
+        return pos_tag(word_tokenize(text))
     except Exception as e:
         logger.error(f"[POS_TAGGER] Failed to tag input: {e}")
         return []
+
+
+def record_pos_tags(tags):
+    """Embeds a summary of tag_text's result in vector memory."""
+    if not (HAS_NLTK and tags):
+        return
+
+    summary = f"POS tagging: {len(tags)} tokens | Example: {tags[:3]}"
+
+    # Use utility function for conditional execution with memory functions
+    def store_embedding():
+        vector = embed_text(summary)
+        package_embedding(
+            text=summary,
+            vector=vector,
+            meta={
+                "origin": ORIGIN,
+                "timestamp": datetime.utcnow().isoformat(),
+                "token_count": len(tags),
+                "watermark": WATERMARK,
+            },
+        )
+        inject_watermark(origin=ORIGIN)
+
+    conditional_execute(
+        (embed_text, package_embedding, inject_watermark), store_embedding
+    )
+
+
+def get_pos_tags(text):
+    """
+    Performs part-of-speech tagging on input text.
+    Logs metadata and embeds summary in vector memory.
+    """
+    tags = tag_text(text)
+    record_pos_tags(tags)
+    return tags
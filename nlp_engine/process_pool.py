@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/process_pool.py :: Module Integrity Directive
+# Process-pool execution for the CPU-bound NLP service endpoints.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import importlib
+import multiprocessing
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+POOL_CFG = CFG.get("nlp", {}).get("process_pool", {})
+
+# Endpoint -> (module, function) executed in the workers. These only
+# compute: every worker has its own copy of the memory index, so memory
+# and log writes must not happen there.
+TASKS = {
+    "parse": ("nlp_engine.parser", "parse_text"),
+    "pos_tag": ("nlp_engine.pos_tagger", "tag_text"),
+    "diff": ("nlp_engine.diff_engine", "diff_texts"),
+}
+
+# Endpoint -> (module, function) called in the parent with the task's result,
+# for the memory side effects of the full parse_nlp/get_pos_tags calls
+RECORDERS = {
+    "parse": ("nlp_engine.parser", "record_parse"),
+    "pos_tag": ("nlp_engine.pos_tagger", "record_pos_tags"),
+}
+
+
+def _warm_parse(module):
+    module.nlp("Warm up the parser.")
+
+
+def _warm_pos_tag(module):
+    if module.HAS_NLTK:
+        module.pos_tag(module.word_tokenize("Warm up the tagger."))
+
+
+def _warm_diff(module):
+    module.semantic_similarity("warm up", "warmed up")
+    module.encode_func("warm up")
+
+
+# Loads each endpoint's models without the memory/log side effects of a real call
+WARMUPS = {
+    "parse": _warm_parse,
+    "pos_tag": _warm_pos_tag,
+    "diff": _warm_diff,
+}
+
+# Per-worker-process state, filled by _init_worker
+_worker_tasks = {}
+
+
+def _load_task(endpoint, table=TASKS):
+    module_name, function_name = table[endpoint]
+    module = importlib.import_module(module_name)
+    return module, getattr(module, function_name)
+
+
+def _init_worker(endpoints, warmup):
+    for endpoint in endpoints:
+        module, function = _load_task(endpoint)
+        _worker_tasks[endpoint] = function
+        if warmup:
+            try:
+                WARMUPS[endpoint](module)
+            except Exception as e:
+                logger.warning(f"[PROCESS_POOL] Warmup failed for {endpoint}: {e}")
+
+
+def _run_task(endpoint, args):
+    return _worker_tasks[endpoint](*args)
+
+
+def _ready():
+    return os.getpid()
+
+
+class PoolBusy(Exception):
+    """An endpoint is at its concurrency limit and the wait timed out."""
+
+
+class NLPProcessPool:
+    """
+    Runs parse/pos_tag/diff calls in worker processes so they scale with
+    cores instead of serializing on the GIL.
+
+    Workers import and warm the endpoint models once, in the initializer,
+    and only compute; the memory trace of each call is recorded here, in
+    the process that owns the memory index.
+    Each endpoint has its own concurrency limit; callers over the limit
+    wait up to queue_timeout and then get PoolBusy. If the pool breaks
+    (a worker died), it is rebuilt and the call runs in-process.
+    """
+
+    def __init__(
+        self,
+        workers=None,
+        endpoints=None,
+        limits=None,
+        queue_timeout=5.0,
+        task_timeout=60.0,
+        start_method="spawn",
+        warmup=True,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.endpoints = tuple(endpoints or TASKS)
+        self.queue_timeout = queue_timeout
+        self.task_timeout = task_timeout
+        self.start_method = start_method
+        self.warmup = warmup
+        limits = limits or {}
+        self.limits = {ep: int(limits.get(ep, self.workers)) for ep in self.endpoints}
+        self._slots = {
+            ep: threading.BoundedSemaphore(limit) for ep, limit in self.limits.items()
+        }
+        self._inline = {}
+        self._recorders = {}
+        self._executor = None
+        self._lock = threading.Lock()
+        self.counters = Counter()
+
+    def start(self):
+        """
+        Starts the workers and waits until every one has warmed up. Calls
+        run in-process until then.
+        """
+        with self._lock:
+            if self._executor is not None:
+                return self
+            started = time.perf_counter()
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(self.endpoints, self.warmup),
+            )
+            try:
+                pids = {
+                    f.result()
+                    for f in [executor.submit(_ready) for _ in range(self.workers)]
+                }
+            except BrokenProcessPool as e:
+                executor.shutdown(wait=False, cancel_futures=True)
+                logger.error(
+                    f"[PROCESS_POOL] Workers failed to start, running inline: {e}"
+                )
+                return self
+            self._executor = executor
+            logger.info(
+                f"[PROCESS_POOL] {len(pids)} workers ready for {', '.join(self.endpoints)} "
+                f"in {time.perf_counter() - started:.1f}s"
+            )
+        return self
+
+    def _run_inline(self, endpoint, args):
+        if endpoint not in self._inline:
+            self._inline[endpoint] = _load_task(endpoint)[1]
+        return self._inline[endpoint](*args)
+
+    def _record(self, endpoint, result):
+        if endpoint not in RECORDERS:
+            return
+        if endpoint not in self._recorders:
+            self._recorders[endpoint] = _load_task(endpoint, RECORDERS)[1]
+        try:
+            self._recorders[endpoint](result)
+        except Exception as e:
+            logger.warning(f"[PROCESS_POOL] Recording {endpoint} failed: {e}")
+
+    def _restart(self, broken):
+        with self._lock:
+            if self._executor is not broken:
+                return  # another caller already replaced it
+            self._executor = None
+        broken.shutdown(wait=False, cancel_futures=True)
+        self.counters["restarts"] += 1
+        threading.Thread(
+            target=self.start, name="nlp-pool-restart", daemon=True
+        ).start()
+
+    def run(self, endpoint, *args):
+        """
+        Runs the endpoint's function with args in a worker and returns its
+        result, after recording it to memory in this process.
+
+        Raises:
+            PoolBusy: If the endpoint's limit stays saturated for queue_timeout
+        """
+        result = self._compute(endpoint, args)
+        self._record(endpoint, result)
+        return result
+
+    def _compute(self, endpoint, args):
+        slot = self._slots.get(endpoint)
+        if slot is None:
+            return self._run_inline(endpoint, args)
+        if not slot.acquire(timeout=self.queue_timeout):
+            self.counters[f"{endpoint}.rejected"] += 1
+            raise PoolBusy(f"{endpoint} is at its limit of {self.limits[endpoint]}")
+        try:
+            executor = self._executor
+            if executor is None:
+                self.counters[f"{endpoint}.inline"] += 1
+                return self._run_inline(endpoint, args)
+            try:
+                result = executor.submit(_run_task, endpoint, args).result(
+                    timeout=self.task_timeout
+                )
+            except BrokenProcessPool as e:
+                logger.error(f"[PROCESS_POOL] Worker pool broke on {endpoint}: {e}")
+                self._restart(executor)
+                self.counters[f"{endpoint}.inline"] += 1
+                return self._run_inline(endpoint, args)
+            self.counters[f"{endpoint}.pooled"] += 1
+            return result
+        finally:
+            slot.release()
+
+    def stats(self):
+        return {
+            "running": self._executor is not None,
+            "workers": self.workers,
+            "start_method": self.start_method,
+            "limits": dict(self.limits),
+            "counters": dict(self.counters),
+        }
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def make_process_pool(**overrides):
+    """
+    Builds a pool from the [nlp.process_pool] config section, or returns
+    None when it is disabled.
+    """
+    opts = dict(POOL_CFG, **overrides)
+    if not opts.get("enabled", True):
+        return None
+    return NLPProcessPool(
+        workers=opts.get("workers") or None,
+        endpoints=opts.get("endpoints"),
+        limits=opts.get("limits"),
+        queue_timeout=opts.get("queue_timeout_sec", 5.0),
+        task_timeout=opts.get("task_timeout_sec", 60.0),
+        start_method=opts.get("start_method", "spawn"),
+        warmup=opts.get("warmup", True),
+    )
+
+
+__all__ = [
+    "TASKS",
+    "RECORDERS",
+    "PoolBusy",
+    "NLPProcessPool",
+    "make_process_pool",
+]
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/result_cache.py :: Module Integrity Directive
+# Response cache for the idempotent NLP service endpoints.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import hashlib
+import pickle
+import shutil
+import sys
+import threading
+from collections import Counter, OrderedDict
+
+from .service_paths import resolve_root_path
+
+RESULT_CACHE_CFG = CFG.get("nlp", {}).get("result_cache", {})
+
+# Attributes of the loaded NLP modules that decide what the cached endpoints
+# return: model identities, pipeline settings and the live financial ontology
+MODEL_STATE = {
+    "nlp_engine.tokenizer": ("MODEL", "tokenizer.name_or_path", "IS_FAST"),
+    "nlp_engine.transformer_core": ("model.name_or_path", "DEVICE"),
+    "nlp_engine.semantic_score": ("MODEL_MAP", "SENTENCE_CHUNK_WORDS"),
+    "nlp_engine.parser": (
+        "nlp.meta.name",
+        "nlp.meta.version",
+        "nlp.pipe_names",
+        "FINANCIAL_MATCHER.ontology",
+    ),
+    "nlp_engine.diff_engine": ("WHOLE_TEXT_MAX_CHARS", "CONTEXT_LINES"),
+}
+
+# Called before reading MODEL_STATE so hot-reloadable state is current
+MODEL_REFRESH = {
+    "nlp_engine.parser": ("FINANCIAL_MATCHER.maybe_reload",),
+}
+
+
+def _lookup(obj, dotted):
+    for name in dotted.split("."):
+        if obj is None:
+            return None
+        obj = obj.get(name) if isinstance(obj, dict) else getattr(obj, name, None)
+    return obj
+
+
+def loaded_model_state():
+    """
+    {module: {attribute: value}} of MODEL_STATE for the NLP modules this
+    process has imported (modules not loaded yet contribute nothing).
+    """
+    state = {}
+    for module_name, attributes in MODEL_STATE.items():
+        module = sys.modules.get(module_name)
+        if module is None:
+            continue
+        for dotted in MODEL_REFRESH.get(module_name, ()):
+            refresh = _lookup(module, dotted)
+            if callable(refresh):
+                refresh()
+        state[module_name] = {dotted: _lookup(module, dotted) for dotted in attributes}
+    return state
+
+
+def model_fingerprint(state=None):
+    """
+    Short hash of the loaded model state (loaded_model_state() by default);
+    cached results are only valid under the fingerprint they were computed
+    with.
+    """
+    state = loaded_model_state() if state is None else state
+    material = json.dumps(state, sort_keys=True, default=str)
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()[:12]
+
+
+class ResultCache:
+    """
+    LRU cache of endpoint results keyed by (endpoint, model fingerprint,
+    input hash).
+
+    Entries evicted from memory are pickled into spill_dir/<fingerprint>/
+    when spilling is on, up to spill_max_mb (oldest files go first); the
+    pickling and file I/O happen outside the cache lock. The fingerprint
+    of the loaded models is recomputed at most every reload_interval
+    seconds; a new one drops memory and old spill directories, so results
+    from a previous model setup (or ontology) are never served.
+    """
+
+    def __init__(
+        self,
+        max_entries=4096,
+        spill_dir=None,
+        spill_max_mb=256,
+        reload_interval=5.0,
+    ):
+        self.max_entries = max_entries
+        self.spill_root = resolve_root_path(spill_dir) if spill_dir else None
+        self.spill_max_bytes = int(spill_max_mb * 1024 * 1024)
+        self.reload_interval = reload_interval
+        self._memory = OrderedDict()
+        self._spilled = OrderedDict()  # key -> file size, oldest first
+        self._spill_bytes = 0
+        self._lock = threading.Lock()
+        self._checked = 0.0
+        self.counters = Counter()
+        self.version = None
+        self.maybe_invalidate(force=True)
+
+    def maybe_invalidate(self, force=False):
+        """Recomputes the fingerprint of the loaded models; drops stale results."""
+        now = time.monotonic()
+        if not force and now - self._checked < self.reload_interval:
+            return False
+        self._checked = now
+        version = model_fingerprint()
+        if version == self.version:
+            return False
+        with self._lock:
+            if self.version is not None:
+                logger.info(
+                    f"[RESULT_CACHE] Model state changed ({self.version} -> {version}), "
+                    f"dropping {len(self._memory)} cached results"
+                )
+                self.counters["invalidations"] += 1
+            self.version = version
+            self._memory.clear()
+            self._load_spill_index()
+        return True
+
+    @property
+    def _spill_dir(self):
+        return self.spill_root / self.version if self.spill_root else None
+
+    def _load_spill_index(self):
+        self._spilled.clear()
+        self._spill_bytes = 0
+        if not self.spill_root:
+            return
+        self.spill_root.mkdir(parents=True, exist_ok=True)
+        for child in self.spill_root.iterdir():
+            if child.is_dir() and child.name != self.version:
+                shutil.rmtree(child, ignore_errors=True)
+        self._spill_dir.mkdir(exist_ok=True)
+        for entry in sorted(self._spill_dir.glob("*.pkl"), key=os.path.getmtime):
+            size = entry.stat().st_size
+            self._spilled[entry.stem] = size
+            self._spill_bytes += size
+
+    def _key(self, endpoint, args):
+        material = json.dumps(
+            [endpoint, self.version, args], sort_keys=True, default=str
+        )
+        return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+    def _spill(self, version, evicted):
+        """
+        Pickles evicted (key, value) pairs into the spill directory of
+        version. Called without the lock; only the bookkeeping takes it.
+        """
+        if not evicted:
+            return
+        spill_dir = self.spill_root / version
+        written = []
+        for key, value in evicted:
+            try:
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception:
+                continue
+            if len(payload) > self.spill_max_bytes:
+                continue
+            try:
+                (spill_dir / f"{key}.pkl").write_bytes(payload)
+            except OSError as e:
+                logger.warning(f"[RESULT_CACHE] Spill write failed: {e}")
+                continue
+            written.append((key, len(payload)))
+        with self._lock:
+            if version != self.version:
+                # Invalidated meanwhile: these files belong to a dropped setup
+                stale = [key for key, _ in written]
+            else:
+                stale = []
+                for key, size in written:
+                    self._spill_bytes += size - self._spilled.pop(key, 0)
+                    self._spilled[key] = size
+                    self.counters["spilled"] += 1
+                while self._spill_bytes > self.spill_max_bytes and self._spilled:
+                    old_key, size = self._spilled.popitem(last=False)
+                    self._spill_bytes -= size
+                    stale.append(old_key)
+        for key in stale:
+            (spill_dir / f"{key}.pkl").unlink(missing_ok=True)
+
+    def _claim_spilled(self, key):
+        """Removes key from the spill index (lock held); returns its file."""
+        if key not in self._spilled:
+            return None
+        self._spill_bytes -= self._spilled.pop(key)
+        return self._spill_dir / f"{key}.pkl"
+
+    @staticmethod
+    def _read_spilled(path):
+        try:
+            value = pickle.loads(path.read_bytes())
+        except Exception:
+            value = None
+        path.unlink(missing_ok=True)
+        return value
+
+    def _store(self, version, key, value):
+        """Caches value (lock held); returns the entries evicted for spilling."""
+        evicted = []
+        if version != self.version:
+            return evicted
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            old = self._memory.popitem(last=False)
+            if self.spill_root:
+                evicted.append(old)
+        return evicted
+
+    def get_or_compute(self, endpoint, args, compute):
+        """
+        Returns the cached result for endpoint(args), calling compute() and
+        caching its result on a miss. args must be JSON-serializable.
+        """
+        self.maybe_invalidate()
+        with self._lock:
+            version = self.version
+            key = self._key(endpoint, args)
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.counters[f"{endpoint}.hits"] += 1
+                return self._memory[key]
+            path = self._claim_spilled(key)
+
+        value = self._read_spilled(path) if path else None
+        if value is not None:
+            with self._lock:
+                self.counters[f"{endpoint}.hits"] += 1
+                self.counters[f"{endpoint}.disk_hits"] += 1
+                evicted = self._store(version, key, value)
+            self._spill(version, evicted)
+            return value
+
+        with self._lock:
+            self.counters[f"{endpoint}.misses"] += 1
+        value = compute()
+        with self._lock:
+            evicted = self._store(version, key, value)
+        self._spill(version, evicted)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            spill_dir, keys = self._spill_dir, list(self._spilled)
+            self._spilled.clear()
+            self._spill_bytes = 0
+        for key in keys:
+            (spill_dir / f"{key}.pkl").unlink(missing_ok=True)
+
+    def stats(self):
+        with self._lock:
+            endpoints = {}
+            for name, count in self.counters.items():
+                if "." in name:
+                    endpoint, field = name.split(".", 1)
+                    endpoints.setdefault(endpoint, Counter())[field] = count
+            for counts in endpoints.values():
+                lookups = counts["hits"] + counts["misses"]
+                counts["hit_ratio"] = (
+                    round(counts["hits"] / lookups, 4) if lookups else 0.0
+                )
+            hits = sum(c["hits"] for c in endpoints.values())
+            misses = sum(c["misses"] for c in endpoints.values())
+            return {
+                "model_version": self.version,
+                "entries": len(self._memory),
+                "max_entries": self.max_entries,
+                "spilled_entries": len(self._spilled),
+                "spilled_mb": round(self._spill_bytes / (1024 * 1024), 2),
+                "hit_ratio": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+                "invalidations": self.counters["invalidations"],
+                "endpoints": {name: dict(c) for name, c in endpoints.items()},
+            }
+
+
+def make_result_cache(**overrides):
+    """
+    Builds a cache from the [nlp.result_cache] config section, or returns
+    None when it is disabled.
+    """
+    opts = dict(RESULT_CACHE_CFG, **overrides)
+    if not opts.get("enabled", True):
+        return None
+    return ResultCache(
+        max_entries=opts.get("max_entries", 4096),
+        spill_dir=(
+            opts.get("spill_dir", "$ROOT/data/cache/nlp_results")
+            if opts.get("spill", True)
+            else None
+        ),
+        spill_max_mb=opts.get("spill_max_mb", 256),
+        reload_interval=opts.get("reload_interval_sec", 5.0),
+    )
+
+
+__all__ = [
+    "MODEL_STATE",
+    "loaded_model_state",
+    "model_fingerprint",
+    "ResultCache",
+    "make_result_cache",
+]
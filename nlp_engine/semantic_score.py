@@ -15,6 +15,9 @@
 from conda_envs.environments.nlp.globals import *
 
 import re
+import hashlib
+from collections import OrderedDict
+from threading import Lock
 import numpy as np
 import langdetect
 import torch
@@ -23,10 +26,9 @@ from utils.logging_config import setup_module_logger
 # Initialize module-specific logger
 logger = setup_module_logger("nlp_engine", "semantic_score")
 from environments.nlp import CFG
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import SentenceTransformer
 from utils.nltk_setup import setup_nltk_data
-import nltk
-from nltk.tokenize import word_tokenize
+from nlp_engine.tokenizer import word_tokens
 from memory.log_history import log_event
 
 try:
@@ -76,6 +78,16 @@ MULTILINGUAL_MODEL = "distiluse-base-multilingual-cased"
 
 _model_cache = {}
 
+# Sentence/chunk embedding cache, keyed by (model_name, sha1(chunk)).
+# Repeated comparisons against the same reference text reuse its vectors.
+SENTENCE_CHUNK_WORDS = CFG["nlp"].get("sentence_chunk_words", 128)
+EMBEDDING_CACHE_SIZE = CFG["nlp"].get("embedding_cache_size", 4096)
+ENCODE_BATCH_SIZE = CFG["nlp"].get("max_nlp_batch_size", 256)
+
+_embedding_cache = OrderedDict()
+_embedding_cache_lock = Lock()
+_embedding_cache_stats = {"hits": 0, "misses": 0}
+
 
 def _get_lang(text):
     try:
@@ -84,15 +96,17 @@ def _get_lang(text):
         return "en"
 
 
+def _get_model_name(lang_code):
+    # Use multilingual for any non-english language
+    return MODEL_MAP.get(lang_code, None) or MULTILINGUAL_MODEL
+
+
 def _get_model(lang_code):
     """
     Loads or reuses a transformer for the requested language.
     Defaults to multilingual for non-English.
     """
-    model_name = MODEL_MAP.get(lang_code, None)
-    if not model_name:
-        # Use multilingual for any non-english language
-        model_name = MULTILINGUAL_MODEL
+    model_name = _get_model_name(lang_code)
     if model_name not in _model_cache:
         try:
             logger.info(f"[{ENGINE_NAME}] Loading model: {model_name}")
@@ -134,7 +148,7 @@ def split_sentences(text: str):
 def tokenize(text: str):
     try:
         cleaned = clean_text(text)
-        tokens = word_tokenize(cleaned)
+        tokens = word_tokens(cleaned)
         logger.debug(f"[{ENGINE_NAME}] Tokenized {len(tokens)} tokens.")
         return tokens
     except Exception as e:
@@ -142,6 +156,106 @@ def tokenize(text: str):
         return []
 
 
+def chunk_sentences(text: str, max_words=None):
+    """
+    Splits text into sentences, then breaks any sentence longer than
+    max_words into word windows so long documents stay under model limits.
+    """
+    max_words = max_words or SENTENCE_CHUNK_WORDS
+    chunks = []
+    for sent in split_sentences(text):
+        words = sent.split()
+        if not words:
+            continue
+        for i in range(0, len(words), max_words):
+            chunks.append(" ".join(words[i : i + max_words]))
+    return chunks or [text]
+
+
+def _chunk_key(model_name, chunk):
+    return (model_name, hashlib.sha1(chunk.encode("utf-8")).hexdigest())
+
+
+def encode_chunks(model, model_name, chunks):
+    """
+    Encodes chunks in a single batched model call, reusing cached vectors.
+    Returns a float32 (n_chunks, dim) matrix of L2-normalized embeddings.
+    """
+    keys = [_chunk_key(model_name, c) for c in chunks]
+    vectors = [None] * len(chunks)
+    pending = {}
+    with _embedding_cache_lock:
+        for i, key in enumerate(keys):
+            vec = _embedding_cache.get(key)
+            if vec is not None:
+                _embedding_cache.move_to_end(key)
+                vectors[i] = vec
+                _embedding_cache_stats["hits"] += 1
+            else:
+                pending.setdefault(key, []).append(i)
+                _embedding_cache_stats["misses"] += 1
+
+    if pending:
+        todo = list(pending)
+        texts = [chunks[pending[key][0]] for key in todo]
+        encoded = model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+        ).astype(np.float32, copy=False)
+        with _embedding_cache_lock:
+            for key, vec in zip(todo, encoded):
+                for i in pending[key]:
+                    vectors[i] = vec
+                _embedding_cache[key] = vec
+                _embedding_cache.move_to_end(key)
+            while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+
+    return np.vstack(vectors)
+
+
+def embed_texts(texts, lang="en"):
+    """
+    L2-normalized sentence embeddings for texts through the shared chunk
+    cache, or None when no model is available for lang.
+    """
+    model = _get_model(lang)
+    if not model:
+        return None
+    return encode_chunks(model, _get_model_name(lang), list(texts))
+
+
+def embedding_cache_stats():
+    with _embedding_cache_lock:
+        return dict(_embedding_cache_stats, size=len(_embedding_cache))
+
+
+def clear_embedding_cache():
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+        _embedding_cache_stats.update(hits=0, misses=0)
+
+
+def _sentence_level_score(model, model_name, text_a, text_b):
+    """
+    Encodes the chunks of both texts in one pass, computes the cosine matrix
+    once and returns the mean of the best matches along both axes.
+    """
+    chunks_a = chunk_sentences(text_a)
+    chunks_b = chunk_sentences(text_b)
+    embs = encode_chunks(model, model_name, chunks_a + chunks_b)
+    sims = embs[: len(chunks_a)] @ embs[len(chunks_a) :].T
+    sim_avg = (sims.max(axis=1).mean() + sims.max(axis=0).mean()) / 2.0
+    return float(np.clip(sim_avg, 0.0, 1.0))
+
+
+def _whole_text_score(model, model_name, text_a, text_b):
+    emb_a, emb_b = encode_chunks(model, model_name, [text_a, text_b])
+    return max(0.0, min(1.0, float(np.dot(emb_a, emb_b))))
+
+
 def semantic_similarity(
     a: str, b: str, dynamic_language=True, sentence_level=False
 ) -> float:
@@ -165,29 +279,18 @@ def semantic_similarity(
                 f"[{ENGINE_NAME}] No valid model loaded for lang={lang}; returning 0.0"
             )
             return 0.0
+        model_name = _get_model_name(lang)
 
-        # Sentence-level similarity (average all combinations)
+        # Sentence-level similarity (mean of best matches in both directions)
         if sentence_level:
-            sents_a = split_sentences(text_a)
-            sents_b = split_sentences(text_b)
-            embs_a = model.encode(sents_a, convert_to_tensor=True)
-            embs_b = model.encode(sents_b, convert_to_tensor=True)
-            sims = util.cos_sim(embs_a, embs_b)
-            # Return the mean of all max pairwise similarities
-            max_per_a = np.max(sims.cpu().numpy(), axis=1)
-            max_per_b = np.max(sims.cpu().numpy(), axis=0)
-            sim_avg = (np.mean(max_per_a) + np.mean(max_per_b)) / 2.0
-            sim_clamped = float(np.clip(sim_avg, 0.0, 1.0))
+            sim_clamped = _sentence_level_score(model, model_name, text_a, text_b)
             logger.debug(
                 f"[{ENGINE_NAME}] Sentence-level similarity: {sim_clamped:.4f}"
             )
             return sim_clamped
 
         # Whole-text similarity
-        emb_a = model.encode(text_a, convert_to_tensor=True)
-        emb_b = model.encode(text_b, convert_to_tensor=True)
-        sim = util.cos_sim(emb_a, emb_b).item()
-        sim_clamped = max(0.0, min(1.0, float(sim)))
+        sim_clamped = _whole_text_score(model, model_name, text_a, text_b)
         logger.debug(
             f"[{ENGINE_NAME}] Semantic similarity: {sim_clamped:.4f} (lang: {lang})"
         )
@@ -235,25 +338,15 @@ def reasoned_similarity(
             result["score"] = 0.0
             result["explanation"] = f"No valid model loaded for lang={lang}."
             return result
+        model_name = _get_model_name(lang)
         if sentence_level:
-            sents_a = split_sentences(text_a)
-            sents_b = split_sentences(text_b)
-            embs_a = model.encode(sents_a, convert_to_tensor=True)
-            embs_b = model.encode(sents_b, convert_to_tensor=True)
-            sims = util.cos_sim(embs_a, embs_b)
-            max_per_a = np.max(sims.cpu().numpy(), axis=1)
-            max_per_b = np.max(sims.cpu().numpy(), axis=0)
-            sim_avg = (np.mean(max_per_a) + np.mean(max_per_b)) / 2.0
-            sim_clamped = float(np.clip(sim_avg, 0.0, 1.0))
+            sim_clamped = _sentence_level_score(model, model_name, text_a, text_b)
             result["score"] = sim_clamped
             result["explanation"] = (
                 f"Sentence-level similarity: {sim_clamped:.4f} (lang: {lang})"
             )
         else:
-            emb_a = model.encode(text_a, convert_to_tensor=True)
-            emb_b = model.encode(text_b, convert_to_tensor=True)
-            sim = util.cos_sim(emb_a, emb_b).item()
-            sim_clamped = max(0.0, min(1.0, float(sim)))
+            sim_clamped = _whole_text_score(model, model_name, text_a, text_b)
             result["score"] = sim_clamped
             result["explanation"] = (
                 f"Whole-text similarity: {sim_clamped:.4f} (lang: {lang})"
@@ -309,6 +402,11 @@ __all__ = [
     "most_similar",
     "clean_text",
     "split_sentences",
+    "chunk_sentences",
+    "encode_chunks",
+    "embed_texts",
+    "embedding_cache_stats",
+    "clear_embedding_cache",
     "tokenize",
     "reasoned_similarity",
 ]
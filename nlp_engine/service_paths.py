@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/service_paths.py :: Module Integrity Directive
+# Filesystem locations shared by the NLP service and client.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+import os
+import pathlib
+
+# Repository root: what "$ROOT" means in config/config.toml
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+DEFAULT_SOCKET_PATH = str(REPO_ROOT / "data" / "run" / "nlp_service.sock")
+
+
+def resolve_root_path(path_str):
+    """Expands $ROOT and anchors relative paths at the repository root."""
+    path = pathlib.Path(str(path_str).replace("$ROOT", str(REPO_ROOT)))
+    return path if path.is_absolute() else REPO_ROOT / path
+
+
+def service_socket_path(configured=None):
+    """
+    The Unix socket the service listens on and local clients dial.
+    NLP_SOCKET wins over the configured value (nlp.service_socket), which
+    wins over DEFAULT_SOCKET_PATH. Returns "" when set to "" (TCP only).
+    """
+    value = os.environ.get("NLP_SOCKET")
+    if value is None:
+        value = DEFAULT_SOCKET_PATH if configured is None else configured
+    return str(resolve_root_path(value)) if value else ""
+
+
+__all__ = [
+    "REPO_ROOT",
+    "DEFAULT_SOCKET_PATH",
+    "resolve_root_path",
+    "service_socket_path",
+]
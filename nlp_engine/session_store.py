@@ -0,0 +1,337 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/session_store.py :: Module Integrity Directive
+# Bounded, persistent store for chat sessions served by the NLP service.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import threading
+from collections import Counter, OrderedDict
+
+SESSION_CFG = CFG.get("nlp", {}).get("chat_sessions", {})
+
+# Append-log record kinds (one JSON object per line, short keys)
+OP_OPEN = "o"  # session created
+OP_TURN = "t"  # one (user, bot, meta) turn
+OP_CLOSE = "x"  # deleted or evicted
+OP_SNAP = "s"  # compacted session state: summary counters, no turns
+
+
+def _resolve(path):
+    return pathlib.Path(str(path).replace("$ROOT", str(BASE_DIR)))
+
+
+class SessionStore:
+    """
+    LRU + TTL bounded map of session_id -> ChatSession.
+
+    At most max_sessions are kept; the least recently used is evicted when a
+    new one is created, and sessions idle for ttl_sec expire. Each session
+    keeps its own history window and summary (see ChatSession.add_turn).
+
+    With a log_path, opens, turns and closes are appended to a JSON-lines
+    log that is replayed on startup. When the log holds more than
+    compact_ratio records per live record it is rewritten as one snapshot
+    plus the windowed turns of each live session.
+    """
+
+    def __init__(
+        self,
+        factory,
+        max_sessions=1000,
+        ttl_sec=86400,
+        log_path=None,
+        compact_ratio=4.0,
+        compact_min_records=1000,
+        fsync=False,
+    ):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.ttl_sec = ttl_sec
+        self.log_path = _resolve(log_path) if log_path else None
+        self.compact_ratio = compact_ratio
+        self.compact_min_records = compact_min_records
+        self.fsync = fsync
+        self._sessions = OrderedDict()
+        self._lock = threading.RLock()
+        self._log = None
+        self._records = 0
+        self.counters = Counter()
+        if self.log_path:
+            self._replay()
+            self._open_log()
+
+    # ── persistence ─────────────────────────────────────────
+
+    def _open_log(self):
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._log = open(self.log_path, "a", encoding="utf-8")
+
+    def _append(self, record):
+        if self._log is None:
+            return
+        self._log.write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+        self._log.flush()
+        if self.fsync:
+            os.fsync(self._log.fileno())
+        self._records += 1
+
+    def _journal_turn(self, session, turn):
+        user_input, bot_response, meta = turn
+        with self._lock:
+            self._append(
+                {
+                    "op": OP_TURN,
+                    "id": session.session_id,
+                    "u": user_input,
+                    "b": bot_response,
+                    "m": meta,
+                    "ts": session.last_active,
+                }
+            )
+            self._maybe_compact()
+
+    def _new_session(self, user_id, session_id=None, created=None):
+        session = self.factory(user_id=user_id)
+        if session_id:
+            session.session_id = session_id
+        if created:
+            session.created = created
+        return session
+
+    def _replay(self):
+        if not self.log_path.exists():
+            return
+        sessions = OrderedDict()
+        with open(self.log_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn last line after a crash
+                self._records += 1
+                op, sid = record.get("op"), record.get("id")
+                if op in (OP_OPEN, OP_SNAP):
+                    session = self._new_session(
+                        record.get("uid"), sid, record.get("created")
+                    )
+                    if op == OP_SNAP and hasattr(session, "summary_topics"):
+                        session.turn_count = record.get("turns", 0)
+                        session.summarized_turns = record.get("summarized", 0)
+                        session.summary_topics = Counter(record.get("topics", {}))
+                        session.last_question = record.get("last_q", "")
+                    session.last_active = record.get("ts", time.time())
+                    sessions[sid] = session
+                elif op == OP_TURN and sid in sessions:
+                    session = sessions[sid]
+                    if hasattr(session, "add_turn"):
+                        session.add_turn(record["u"], record["b"], record.get("m"))
+                        session.last_active = record.get("ts", session.last_active)
+                    sessions.move_to_end(sid)
+                elif op == OP_CLOSE:
+                    sessions.pop(sid, None)
+
+        now = time.time()
+        for sid, session in sorted(sessions.items(), key=lambda kv: kv[1].last_active):
+            if self.ttl_sec and now - session.last_active > self.ttl_sec:
+                continue
+            self._attach(session)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        logger.info(
+            f"[SESSIONS] Restored {len(self._sessions)} chat sessions from {self.log_path}"
+        )
+
+    def _snapshot_records(self, session):
+        record = {
+            "op": OP_SNAP,
+            "id": session.session_id,
+            "uid": getattr(session, "user_id", None),
+            "created": getattr(session, "created", None),
+            "ts": getattr(session, "last_active", time.time()),
+        }
+        if hasattr(session, "summary_topics"):
+            record.update(
+                turns=session.turn_count - len(session.history),
+                summarized=session.summarized_turns,
+                topics=dict(session.summary_topics),
+                last_q=session.last_question,
+            )
+        yield record
+        if hasattr(session, "add_turn"):
+            for user_input, bot_response, meta in session.history:
+                yield {
+                    "op": OP_TURN,
+                    "id": session.session_id,
+                    "u": user_input,
+                    "b": bot_response,
+                    "m": meta,
+                    "ts": record["ts"],
+                }
+
+    def _maybe_compact(self):
+        live = sum(1 + len(getattr(s, "history", ())) for s in self._sessions.values())
+        if self._records < max(self.compact_min_records, self.compact_ratio * live):
+            return
+        self.compact()
+
+    def compact(self):
+        """Rewrites the log to just the live sessions (atomic replace)."""
+        if not self.log_path:
+            return
+        with self._lock:
+            tmp_path = self.log_path.with_suffix(self.log_path.suffix + ".tmp")
+            records = 0
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for session in self._sessions.values():
+                    for record in self._snapshot_records(session):
+                        f.write(
+                            json.dumps(record, separators=(",", ":"), default=str)
+                            + "\n"
+                        )
+                        records += 1
+                f.flush()
+                os.fsync(f.fileno())
+            if self._log:
+                self._log.close()
+            os.replace(tmp_path, self.log_path)
+            self._records = records
+            self._open_log()
+            self.counters["compactions"] += 1
+
+    # ── session map ─────────────────────────────────────────
+
+    def _attach(self, session):
+        self._sessions[session.session_id] = session
+        if hasattr(session, "add_turn"):
+            session.on_turn = self._journal_turn
+
+    def _evict(self, session_id, reason):
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return None
+        session.on_turn = None
+        self._append({"op": OP_CLOSE, "id": session_id, "ts": time.time()})
+        self.counters[reason] += 1
+        return session
+
+    def _expired(self, session, now):
+        return (
+            self.ttl_sec and now - getattr(session, "last_active", now) > self.ttl_sec
+        )
+
+    def expire(self):
+        """Drops every session idle for longer than ttl_sec."""
+        now = time.time()
+        with self._lock:
+            for sid in [s for s, v in self._sessions.items() if self._expired(v, now)]:
+                self._evict(sid, "expired")
+
+    def get(self, session_id):
+        """Returns the live session (marking it recently used) or None."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if self._expired(session, time.time()):
+                self._evict(session_id, "expired")
+                return None
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def create(self, user_id):
+        with self._lock:
+            self.expire()
+            while len(self._sessions) >= self.max_sessions:
+                self._evict(next(iter(self._sessions)), "evicted")
+            session = self._new_session(user_id)
+            if hasattr(session, "last_active"):
+                session.last_active = time.time()
+            self._attach(session)
+            self._append(
+                {
+                    "op": OP_OPEN,
+                    "id": session.session_id,
+                    "uid": user_id,
+                    "created": getattr(session, "created", None),
+                    "ts": time.time(),
+                }
+            )
+            self.counters["created"] += 1
+            return session
+
+    def get_or_create(self, session_id, user_id):
+        return (session_id and self.get(session_id)) or self.create(user_id)
+
+    def delete(self, session_id):
+        with self._lock:
+            return self._evict(session_id, "deleted") is not None
+
+    def list(self):
+        """Session metadata, most recently used first; histories are not copied."""
+        with self._lock:
+            sessions = list(reversed(self._sessions.values()))
+        return [
+            (
+                session.describe()
+                if hasattr(session, "describe")
+                else {
+                    "session_id": session.session_id,
+                    "user_id": getattr(session, "user_id", "unknown"),
+                    "history_length": len(getattr(session, "history", ())),
+                }
+            )
+            for session in sessions
+        ]
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._sessions
+
+    def stats(self):
+        with self._lock:
+            return {
+                "active": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "ttl_sec": self.ttl_sec,
+                "log_records": self._records if self.log_path else None,
+                "counters": dict(self.counters),
+            }
+
+    def close(self):
+        with self._lock:
+            if self._log:
+                self._log.close()
+                self._log = None
+
+
+def make_session_store(factory, **overrides):
+    """Builds a store from the [nlp.chat_sessions] config section."""
+    opts = dict(SESSION_CFG, **overrides)
+    return SessionStore(
+        factory,
+        max_sessions=opts.get("max_sessions", 1000),
+        ttl_sec=opts.get("ttl_sec", 86400),
+        log_path=(
+            opts.get("log_path", "$ROOT/data/nlp/chat_sessions.jsonl")
+            if opts.get("persist", True)
+            else None
+        ),
+        compact_ratio=opts.get("compact_ratio", 4.0),
+        compact_min_records=opts.get("compact_min_records", 1000),
+        fsync=opts.get("fsync", False),
+    )
+
+
+__all__ = ["SessionStore", "make_session_store"]
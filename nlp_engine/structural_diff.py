@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/structural_diff.py :: Module Integrity Directive
+# AST-fingerprint first stage for code diffs; semantic scoring only where needed.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import ast
+import copy
+import hashlib
+import io
+import textwrap
+import threading
+import tokenize as pytokenize
+from collections import Counter
+from difflib import SequenceMatcher, unified_diff
+
+STRUCTURAL_CFG = CFG.get("nlp", {}).get("structural_diff", {})
+ENGINE_NAME = "structural_diff"
+MODULE_UNIT = "<module>"
+
+# Change classes, cheapest first; only STRUCTURAL units reach the scorer
+UNCHANGED = "unchanged"
+WHITESPACE = "whitespace"
+COMMENT = "comment"
+LOCAL = "local"
+STRUCTURAL = "structural"
+
+_SKIP_TOKENS = {
+    pytokenize.NL,
+    pytokenize.NEWLINE,
+    pytokenize.INDENT,
+    pytokenize.DEDENT,
+    pytokenize.ENCODING,
+    pytokenize.ENDMARKER,
+}
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+_ms_per_char = None  # running estimate of scorer cost, for the time-saved report
+
+
+def _digest(value):
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:16]
+
+
+def _bound_names(node):
+    """
+    Names a function binds itself: parameters and local store targets
+    (assignments, loop/with/except targets, comprehension variables).
+    global/nonlocal names and anything only read are excluded.
+    """
+    bound, shared = set(), set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.arg):
+            bound.add(child.arg)
+        elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            bound.add(child.id)
+        elif isinstance(child, ast.ExceptHandler) and child.name:
+            bound.add(child.name)
+        elif isinstance(child, (ast.Global, ast.Nonlocal)):
+            shared.update(child.names)
+    return bound - shared
+
+
+class _Anonymize(ast.NodeTransformer):
+    """
+    Renames a function's own bound names to positional placeholders, so a
+    consistent rename of locals/parameters hashes alike. Called and global
+    names, attributes, keywords and constant values are left as they are.
+    """
+
+    def __init__(self, bound):
+        self.bound = bound
+        self.aliases = {}
+
+    def _alias(self, name):
+        if name not in self.bound:
+            return name
+        if name not in self.aliases:
+            self.aliases[name] = f"_{len(self.aliases)}"
+        return self.aliases[name]
+
+    def visit_Name(self, node):
+        node.id = self._alias(node.id)
+        return node
+
+    def visit_arg(self, node):
+        node = self.generic_visit(node)
+        node.arg = self._alias(node.arg)
+        return node
+
+    def visit_ExceptHandler(self, node):
+        if node.name:
+            node.name = self._alias(node.name)
+        return self.generic_visit(node)
+
+
+def _strip_docstrings(node):
+    for child in ast.walk(node):
+        body = getattr(child, "body", None)
+        if (
+            isinstance(
+                child, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+            )
+            and body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(getattr(body[0], "value", None), ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            child.body = body[1:] or [ast.Pass()]
+    return node
+
+
+def _dump(node):
+    return ast.dump(node, annotate_fields=False, include_attributes=False)
+
+
+class CodeUnit:
+    """
+    One function, class (without its methods) or the module-level code.
+    Tokens and AST hashes are computed on first use, i.e. only for units
+    whose source lines differ.
+    """
+
+    __slots__ = ("name", "kind", "node", "lines", "_tokens", "_hashes")
+
+    def __init__(self, name, kind, node):
+        self.name = name
+        self.kind = kind
+        self.node = node
+        self.lines = []
+        self._tokens = None
+        self._hashes = None
+
+    @property
+    def text(self):
+        return "".join(self.lines)
+
+    def _tokenize(self):
+        if self._tokens is None:
+            code, comments = [], []
+            source = textwrap.dedent(self.text)
+            try:
+                for tok in pytokenize.generate_tokens(io.StringIO(source).readline):
+                    if tok.type == pytokenize.COMMENT:
+                        comments.append(tok.string.rstrip())
+                    elif tok.type not in _SKIP_TOKENS:
+                        code.append(tok.string)
+            except (pytokenize.TokenError, IndentationError):
+                code = [line.strip() for line in self.lines if line.strip()]
+            self._tokens = (code, comments)
+        return self._tokens
+
+    @property
+    def code(self):
+        """Significant tokens, without layout and comments."""
+        return self._tokenize()[0]
+
+    @property
+    def comments(self):
+        return self._tokenize()[1]
+
+    def _hash(self, index):
+        if self._hashes is None:
+            bare = _strip_docstrings(copy.deepcopy(self.node))
+            ast_hash = _digest(_dump(bare))
+            if self.kind == "function":
+                anonymous = _Anonymize(_bound_names(bare)).visit(copy.deepcopy(bare))
+                shape = _digest(_dump(anonymous))
+            else:
+                # Class and module names are visible to other units
+                shape = ast_hash
+            self._hashes = (_digest(_dump(self.node)), ast_hash, shape)
+        return self._hashes[index]
+
+    @property
+    def docs(self):
+        """Hash of the tree including docstrings."""
+        return self._hash(0)
+
+    @property
+    def ast(self):
+        """Hash of the tree without docstrings."""
+        return self._hash(1)
+
+    @property
+    def shape(self):
+        """Docstring-free tree hash with a function's own locals renamed."""
+        return self._hash(2)
+
+
+def _own_node(node):
+    """A class node without its methods, which are units of their own."""
+    if not isinstance(node, ast.ClassDef):
+        return node
+    own = copy.copy(node)
+    own.body = [
+        stmt
+        for stmt in node.body
+        if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef))
+    ] or [ast.Pass()]
+    return own
+
+
+def fingerprint_units(source):
+    """
+    Splits Python source into CodeUnits keyed by qualified name: top-level
+    functions and classes, methods ("Class.method") and MODULE_UNIT for
+    everything else. Each unit owns its source lines (decorators included,
+    methods excluded from their class) and carries normalized hashes.
+
+    Raises:
+        SyntaxError: If source does not parse
+    """
+    tree = ast.parse(source)
+    lines = source.splitlines(keepends=True)
+    owner = [MODULE_UNIT] * (len(lines) + 2)
+    module = ast.Module(
+        body=[
+            stmt
+            for stmt in tree.body
+            if not isinstance(
+                stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+            )
+        ],
+        type_ignores=[],
+    )
+    units = {MODULE_UNIT: CodeUnit(MODULE_UNIT, "module", module)}
+
+    def add(node, prefix):
+        name = f"{prefix}{node.name}"
+        while name in units:  # redefinitions keep their own unit
+            name += "'"
+        kind = "class" if isinstance(node, ast.ClassDef) else "function"
+        units[name] = CodeUnit(name, kind, _own_node(node))
+        start = min([d.lineno for d in node.decorator_list] + [node.lineno])
+        for lineno in range(start, node.end_lineno + 1):
+            owner[lineno] = name
+        return name
+
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            add(node, "")
+        elif isinstance(node, ast.ClassDef):
+            cls = add(node, "")
+            for stmt in node.body:
+                if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    add(stmt, f"{cls}.")
+
+    for lineno, line in enumerate(lines, 1):
+        units[owner[lineno]].lines.append(line)
+    return units
+
+
+def classify(old_unit, new_unit):
+    """Change class of one unit between two versions (None = absent)."""
+    if old_unit is None or new_unit is None:
+        return STRUCTURAL
+    if old_unit.lines == new_unit.lines:
+        return UNCHANGED
+    if old_unit.code == new_unit.code:
+        if old_unit.comments != new_unit.comments:
+            return COMMENT
+        return WHITESPACE
+    if old_unit.ast == new_unit.ast:
+        # Same tree, different tokens: a docstring or pure formatting
+        return COMMENT if old_unit.docs != new_unit.docs else WHITESPACE
+    if old_unit.shape == new_unit.shape:
+        return LOCAL
+    return STRUCTURAL
+
+
+def classify_changes(old, new):
+    """{unit name: change class} for every unit in either version."""
+    old_units, new_units = fingerprint_units(old), fingerprint_units(new)
+    return {
+        name: classify(old_units.get(name), new_units.get(name))
+        for name in list(old_units) + [n for n in new_units if n not in old_units]
+    }
+
+
+def _default_scorer():
+    from nlp_engine.diff_engine import diff_texts
+
+    return diff_texts
+
+
+def structural_diff(old, new, scorer=None):
+    """
+    Diffs two versions of a Python file unit by unit.
+
+    Whitespace, comment and local (a consistent rename of a function's own
+    parameters and local variables) changes are decided from the
+    fingerprints. Any other change (called names, attributes, constant
+    values) makes a unit structural, as does adding or removing it; only
+    structural units go to scorer(old_text, new_text), which returns a
+    dict with "semantic_score" and "embedding_delta" (diff_texts by
+    default). File-level values weight each unit by its share of lines,
+    which dilutes one rewritten unit in a large file; min_unit_score and
+    max_unit_delta are the worst structural or local unit (an added or
+    removed unit scores 0.0), and are what safety gates should read.
+    Falls back to scoring the whole text when either side does not parse.
+
+    Returns the diff_texts keys plus "min_unit_score", "max_unit_delta",
+    "mode", "units" and "timing", where timing.estimated_saved_ms compares
+    against scoring the whole file.
+    """
+    global _ms_per_char
+    scorer = scorer or _default_scorer()
+    started = time.perf_counter()
+    try:
+        old_units, new_units = fingerprint_units(old), fingerprint_units(new)
+    except (SyntaxError, ValueError) as e:
+        logger.debug(f"[{ENGINE_NAME}] Falling back to full diff: {e}")
+        result = dict(_with_unit_extremes(scorer(old, new)), mode="full")
+        with _stats_lock:
+            _stats["fallbacks"] += 1
+        return result
+    fingerprint_ms = (time.perf_counter() - started) * 1000.0
+
+    total = max(len(old.splitlines()), len(new.splitlines()), 1)
+    names = list(old_units) + [n for n in new_units if n not in old_units]
+    units, changes = [], Counter()
+    dissimilarity = delta = semantic_ms = 0.0
+    min_score, max_delta = 1.0, 0.0
+    scored_chars = 0
+    for name in names:
+        old_unit, new_unit = old_units.get(name), new_units.get(name)
+        change = classify(old_unit, new_unit)
+        changes[change] += 1
+        if change == UNCHANGED:
+            continue
+        old_text = old_unit.text if old_unit else ""
+        new_text = new_unit.text if new_unit else ""
+        entry = {
+            "name": name,
+            "kind": (new_unit or old_unit).kind,
+            "change": change,
+        }
+        if change == STRUCTURAL:
+            t0 = time.perf_counter()
+            scored = scorer(old_text, new_text)
+            semantic_ms += (time.perf_counter() - t0) * 1000.0
+            scored_chars += len(old_text) + len(new_text)
+            score = float(scored.get("semantic_score", 0.0))
+            unit_delta = float(scored.get("embedding_delta", 0.0))
+        elif change == LOCAL:
+            score = SequenceMatcher(
+                None, old_unit.code, new_unit.code, autojunk=False
+            ).ratio()
+            unit_delta = 0.0
+        else:
+            score, unit_delta = 1.0, 0.0
+        weight = (
+            max(
+                len(old_unit.lines if old_unit else ()),
+                len(new_unit.lines if new_unit else ()),
+            )
+            / total
+        )
+        dissimilarity += weight * (1.0 - score)
+        delta += weight * unit_delta
+        if change in (STRUCTURAL, LOCAL):
+            min_score = min(min_score, score if old_unit and new_unit else 0.0)
+            max_delta = max(max_delta, unit_delta)
+        entry.update(
+            semantic_score=round(score, 4), embedding_delta=round(unit_delta, 4)
+        )
+        units.append(entry)
+
+    with _stats_lock:
+        if scored_chars:
+            rate = semantic_ms / scored_chars
+            _ms_per_char = (
+                rate if _ms_per_char is None else 0.8 * _ms_per_char + 0.2 * rate
+            )
+        full_ms = (
+            _ms_per_char * (len(old) + len(new)) if _ms_per_char is not None else None
+        )
+        saved_ms = (
+            max(0.0, full_ms - semantic_ms - fingerprint_ms)
+            if full_ms is not None
+            else None
+        )
+        _stats["runs"] += 1
+        _stats["units"] += len(names)
+        _stats["units_scored"] += changes[STRUCTURAL]
+        _stats["saved_ms"] += saved_ms or 0.0
+
+    if changes[STRUCTURAL] or changes[LOCAL]:
+        logger.debug(
+            f"[{ENGINE_NAME}] {changes[STRUCTURAL]}/{len(names)} units scored, "
+            f"~{saved_ms or 0:.0f}ms saved"
+        )
+    return {
+        "diff_lines": list(
+            unified_diff(
+                old.splitlines(keepends=True),
+                new.splitlines(keepends=True),
+                fromfile="old",
+                tofile="new",
+            )
+        ),
+        "semantic_score": round(max(0.0, 1.0 - dissimilarity), 4),
+        "embedding_delta": round(delta, 4),
+        "min_unit_score": round(min_score, 4),
+        "max_unit_delta": round(max_delta, 4),
+        "mode": "structural",
+        "units": units,
+        "changes": dict(changes),
+        "timing": {
+            "fingerprint_ms": round(fingerprint_ms, 3),
+            "semantic_ms": round(semantic_ms, 3),
+            "estimated_full_ms": round(full_ms, 3) if full_ms is not None else None,
+            "estimated_saved_ms": round(saved_ms, 3) if saved_ms is not None else None,
+        },
+    }
+
+
+def _with_unit_extremes(result):
+    """
+    A whole-text scorer result with min_unit_score/max_unit_delta added:
+    the worst hunk when the scorer reports hunks (diff_texts), else the
+    file-level values.
+    """
+    result = dict(result)
+    result.setdefault(
+        "min_unit_score",
+        result.get("min_hunk_score", result.get("semantic_score", 0.0)),
+    )
+    result.setdefault(
+        "max_unit_delta",
+        result.get("max_hunk_delta", result.get("embedding_delta", 0.0)),
+    )
+    return result
+
+
+def diff_code(path, old, new, scorer=None):
+    """
+    Mutation-safety diff: structural_diff for Python files (unless disabled
+    in [nlp.structural_diff]), the plain scorer for everything else.
+    """
+    scorer = scorer or _default_scorer()
+    if str(path).endswith(".py") and STRUCTURAL_CFG.get("enabled", True):
+        return structural_diff(old, new, scorer)
+    return _with_unit_extremes(scorer(old, new))
+
+
+def structural_stats():
+    """Process-wide counters: runs, units seen/scored and estimated ms saved."""
+    with _stats_lock:
+        return dict(_stats, saved_ms=round(_stats["saved_ms"], 3))
+
+
+__all__ = [
+    "UNCHANGED",
+    "WHITESPACE",
+    "COMMENT",
+    "LOCAL",
+    "STRUCTURAL",
+    "CodeUnit",
+    "fingerprint_units",
+    "classify",
+    "classify_changes",
+    "structural_diff",
+    "diff_code",
+    "structural_stats",
+]
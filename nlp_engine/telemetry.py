@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/telemetry.py :: Module Integrity Directive
+# Sampled, rate-limited telemetry for hot NLP code paths.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+# Import NLP environment globals
+from conda_envs.environments.nlp.globals import *
+
+import queue
+import random
+import threading
+from collections import Counter
+from datetime import datetime
+
+WATERMARK = "source:GremlinGPT"
+
+TELEMETRY_CFG = CFG.get("nlp", {}).get("telemetry", {})
+
+
+class TelemetrySink:
+    """Receives sampled events off the hot path. Subclasses override emit()."""
+
+    def emit(self, module, event, info):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class NullSink(TelemetrySink):
+    """Discards events; counters are still kept by the dispatcher."""
+
+    def emit(self, module, event, info):
+        pass
+
+
+class LogSink(TelemetrySink):
+    """Writes events to the history log only."""
+
+    def emit(self, module, event, info):
+        try:
+            from memory.log_history import log_event
+
+            log_event(module, event, info)
+        except ImportError as e:
+            logger.warning(f"[TELEMETRY] History log not available: {e}")
+
+
+class MemorySink(TelemetrySink):
+    """
+    Full system integration: history log, memory embedding of a summary line
+    and (optionally) a feedback trigger for self-training.
+    """
+
+    def __init__(self, inject_feedback=False):
+        self.inject_feedback = inject_feedback
+
+    def emit(self, module, event, info):
+        try:
+            from memory.log_history import log_event
+            from memory.vector_store.embedder import package_embedding, embed_text
+        except ImportError as e:
+            logger.warning(f"[TELEMETRY] Memory functions not available: {e}")
+            return
+
+        log_event(module, event, info)
+        summary = info.get("summary") or f"{module}::{event}"
+        package_embedding(text=summary, vector=embed_text(summary), meta=info)
+
+        if self.inject_feedback:
+            try:
+                from self_training.feedback_loop import inject_feedback
+
+                inject_feedback()
+            except ImportError as e:
+                logger.warning(f"[TELEMETRY] Training functions not available: {e}")
+
+
+class Telemetry:
+    """
+    Counter/event stream for instrumented code.
+
+    record() always bumps an in-process counter. A sample_rate fraction of
+    calls, further capped by a token bucket of max_events_per_sec, is turned
+    into an event and queued for a background thread that delivers it to the
+    sink. A full queue drops the event instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        module,
+        sink=None,
+        sample_rate=0.01,
+        max_events_per_sec=1.0,
+        queue_size=1024,
+    ):
+        self.module = module
+        self.sink = sink or NullSink()
+        self.sample_rate = float(sample_rate)
+        self.max_events_per_sec = float(max_events_per_sec)
+        self.counters = Counter()
+        self._lock = threading.Lock()
+        self._tokens = self.max_events_per_sec
+        self._last_refill = time.monotonic()
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._worker = None
+
+    def _allow(self):
+        if self.sample_rate <= 0.0 or random.random() >= self.sample_rate:
+            return False
+        if self.max_events_per_sec <= 0.0:
+            return True
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_events_per_sec,
+            self._tokens + (now - self._last_refill) * self.max_events_per_sec,
+        )
+        self._last_refill = now
+        if self._tokens < 1.0:
+            self.counters["rate_limited"] += 1
+            return False
+        self._tokens -= 1.0
+        return True
+
+    def record(self, event, info_fn=None):
+        """
+        Count an event and maybe emit it. info_fn is only called for sampled
+        events, so building the payload costs nothing on the common path.
+        """
+        with self._lock:
+            self.counters[event] += 1
+            if not self._allow():
+                return False
+        info = info_fn() if info_fn else {}
+        info.setdefault("origin", self.module)
+        info.setdefault("event", event)
+        info.setdefault("watermark", WATERMARK)
+        info.setdefault("timestamp", datetime.utcnow().isoformat())
+        try:
+            self._queue.put_nowait((event, info))
+        except queue.Full:
+            with self._lock:
+                self.counters["dropped"] += 1
+            return False
+        self._ensure_worker()
+        return True
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._drain, name=f"telemetry-{self.module}", daemon=True
+            )
+            self._worker.start()
+
+    def _drain(self):
+        while True:
+            event, info = self._queue.get()
+            try:
+                self.sink.emit(self.module, event, info)
+            except Exception as e:
+                logger.error(f"[TELEMETRY] Sink failed for {self.module}::{event}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout=None):
+        """Blocks until queued events are delivered (or timeout expires)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "module": self.module,
+                "counters": dict(self.counters),
+                "queued": self._queue.qsize(),
+                "sample_rate": self.sample_rate,
+                "max_events_per_sec": self.max_events_per_sec,
+            }
+
+
+SINKS = {
+    "null": NullSink,
+    "log": LogSink,
+    "memory": MemorySink,
+}
+
+
+def make_telemetry(module, **overrides):
+    """Builds a Telemetry dispatcher from the [nlp.telemetry] config section."""
+    opts = dict(TELEMETRY_CFG, **overrides)
+    sink = opts.get("sink", "log")
+    if isinstance(sink, str):
+        sink_cls = SINKS.get(sink, LogSink)
+        sink = (
+            sink_cls(inject_feedback=opts.get("inject_feedback", False))
+            if sink_cls is MemorySink
+            else sink_cls()
+        )
+    return Telemetry(
+        module,
+        sink=sink,
+        sample_rate=opts.get("sample_rate", 0.01),
+        max_events_per_sec=opts.get("max_events_per_sec", 1.0),
+        queue_size=opts.get("queue_size", 1024),
+    )
+
+
+__all__ = [
+    "TelemetrySink",
+    "NullSink",
+    "LogSink",
+    "MemorySink",
+    "Telemetry",
+    "make_telemetry",
+]
@@ -54,22 +54,29 @@ except ImportError:
 WATERMARK = "source:GremlinGPT"
 ORIGIN = "tokenizer"
 MODEL = CFG["nlp"].get("tokenizer_model", "bert-base-uncased")
+BATCH_SIZE = CFG["nlp"].get("max_nlp_batch_size", 256)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7F]+")
 
 
 try:
-    tokenizer = AutoTokenizer.from_pretrained(MODEL)
+    # use_fast selects the Rust tokenizer, which batches natively and reports offsets
+    tokenizer = AutoTokenizer.from_pretrained(MODEL, use_fast=True)
     logger.success(f"[TOKENIZER] Loaded: {MODEL}")
 except Exception as e:
     logger.warning(f"[TOKENIZER] Failed to load {MODEL}. Falling back to nltk: {e}")
     tokenizer = None
 
+IS_FAST = bool(getattr(tokenizer, "is_fast", False))
+
 
 def clean_text(text):
     """
     Normalizes whitespace and removes non-ASCII characters.
     """
-    text = re.sub(r"\s+", " ", text)
-    text = re.sub(r"[^\x00-\x7F]+", "", text)
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _NON_ASCII_RE.sub("", text)
     return text.strip()
 
 
@@ -108,6 +115,92 @@ def tokenize(text, max_length=512, add_special_tokens=True):
     return text.split()
 
 
+def tokenize_batch(
+    texts, max_length=512, add_special_tokens=True, return_offsets=False
+):
+    """
+    Tokenize many texts with fast-tokenizer batch calls of up to
+    max_nlp_batch_size texts each.
+    Returns a list of token id lists (or word tokens on fallback). With
+    return_offsets, each item is {"ids": [...], "offsets": [(start, end), ...]}
+    where offsets index into clean_text(text).
+    """
+    # Empty or non-str items get [] like tokenize(), not a bare [CLS, SEP]
+    raw = [t if isinstance(t, str) else "" for t in texts]
+    live = [i for i, t in enumerate(raw) if t]
+    cleaned = [clean_text(raw[i]) for i in live]
+    encoded_live = None
+
+    if tokenizer and cleaned:
+        try:
+            encoded_live = []
+            for start in range(0, len(cleaned), BATCH_SIZE):
+                encoded = tokenizer(
+                    cleaned[start : start + BATCH_SIZE],
+                    max_length=max_length,
+                    truncation=True,
+                    add_special_tokens=add_special_tokens,
+                    return_offsets_mapping=return_offsets and IS_FAST,
+                )
+                if return_offsets:
+                    offsets = encoded.get("offset_mapping") or [
+                        [] for _ in encoded["input_ids"]
+                    ]
+                    encoded_live.extend(
+                        {"ids": ids, "offsets": [tuple(o) for o in offs]}
+                        for ids, offs in zip(encoded["input_ids"], offsets)
+                    )
+                else:
+                    encoded_live.extend(encoded["input_ids"])
+        except Exception as e:
+            logger.warning(f"[TOKENIZER] HF batch tokenization failed: {e}")
+            encoded_live = None
+
+    if encoded_live is None:
+        encoded_live = [tokenize(t, max_length, add_special_tokens) for t in cleaned]
+        if return_offsets:
+            encoded_live = [{"ids": ids, "offsets": []} for ids in encoded_live]
+
+    results = [{"ids": [], "offsets": []} if return_offsets else [] for _ in raw]
+    for i, result in zip(live, encoded_live):
+        results[i] = result
+    return results
+
+
+def count_tokens_batch(texts, max_length=512, add_special_tokens=True):
+    """Token counts for many texts, from one tokenize_batch call."""
+    return [len(t) for t in tokenize_batch(texts, max_length, add_special_tokens)]
+
+
+def count_tokens(text, max_length=512, add_special_tokens=True):
+    return count_tokens_batch([text], max_length, add_special_tokens)[0]
+
+
+def word_tokens(text, return_offsets=False):
+    """
+    Word-level tokens using the fast tokenizer's Rust pre-tokenizer
+    (whitespace + punctuation split), falling back to NLTK word_tokenize.
+    """
+    if not text or not isinstance(text, str):
+        return []
+    pre_tokenizer = (
+        getattr(tokenizer.backend_tokenizer, "pre_tokenizer", None) if IS_FAST else None
+    )
+    if pre_tokenizer is not None:
+        try:
+            pieces = pre_tokenizer.pre_tokenize_str(text)
+            if return_offsets:
+                return [(word, tuple(span)) for word, span in pieces]
+            return [word for word, _ in pieces]
+        except Exception as e:
+            logger.warning(f"[TOKENIZER] Pre-tokenization failed: {e}")
+    if word_tokenize:
+        words = word_tokenize(text)
+    else:
+        words = text.split()
+    return [(w, None) for w in words] if return_offsets else words
+
+
 class Tokenizer:
     """
     Tokenizer class for compatibility with nlp_check.py
@@ -121,6 +214,18 @@ class Tokenizer:
         """Tokenize text using the configured tokenizer"""
         return tokenize(text, max_length, add_special_tokens)
 
+    def tokenize_batch(self, texts, **kwargs):
+        """Tokenize many texts in batched fast-tokenizer calls"""
+        return tokenize_batch(texts, **kwargs)
+
+    def count_tokens(self, text, **kwargs):
+        """Token count for text"""
+        return count_tokens(text, **kwargs)
+
+    def word_tokens(self, text, **kwargs):
+        """Word-level tokens (optionally with character offsets)"""
+        return word_tokens(text, **kwargs)
+
     def encode(self, text, **kwargs):
         """Encode text to token IDs"""
         return self.tokenize(text, **kwargs)
@@ -138,4 +243,13 @@ class Tokenizer:
 
 
 # Export for backward compatibility
-__all__ = ["tokenize", "clean_text", "Tokenizer", "tokenizer"]
+__all__ = [
+    "tokenize",
+    "tokenize_batch",
+    "count_tokens",
+    "count_tokens_batch",
+    "word_tokens",
+    "clean_text",
+    "Tokenizer",
+    "tokenizer",
+]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# ─────────────────────────────────────────────────────────────
+# ⚠️ GremlinGPT Fair Use Only | Commercial Use Requires License
+# Built under the GremlinGPT Dual License v1.0
+# © 2025 StatikFintechLLC / AscendAI Project
+# Contact: ascend.gremlin@gmail.com
+# ─────────────────────────────────────────────────────────────
+
+# GremlinGPT v1.0.3 :: nlp_engine/vector_codec.py :: Module Integrity Directive
+# Wire formats for embedding vectors shared by the NLP service and client.
+# This script is a component of the GremlinGPT system, under Alpha expansion.
+
+import base64
+import json
+
+import numpy as np
+
+# Vectors travel as little-endian float32, row-major, with the shape in a header
+WIRE_DTYPE = np.dtype("<f4")
+DTYPE_NAME = "float32-le"
+
+MIME_JSON = "application/json"
+MIME_BINARY = "application/octet-stream"
+MIME_NDJSON = "application/x-ndjson"
+
+SHAPE_HEADER = "X-Vector-Shape"
+DTYPE_HEADER = "X-Vector-Dtype"
+
+FORMATS = ("json", "binary", "base64", "ndjson")
+
+
+def negotiate_format(accept=None, requested=None, default="json"):
+    """
+    Picks a vector response format from an explicit "format" field or the
+    Accept header. Unknown values fall back to default.
+    """
+    if requested in FORMATS:
+        return requested
+    accept = (accept or "").lower()
+    if MIME_BINARY in accept:
+        return "binary"
+    if MIME_NDJSON in accept:
+        return "ndjson"
+    return default
+
+
+def as_matrix(vectors):
+    """Stacks vectors into a contiguous little-endian float32 array."""
+    return np.ascontiguousarray(np.asarray(vectors), dtype=WIRE_DTYPE)
+
+
+def format_shape(shape):
+    return ",".join(str(int(d)) for d in shape)
+
+
+def parse_shape(value):
+    return tuple(int(d) for d in value.split(",") if d.strip())
+
+
+def to_bytes(vectors):
+    """Returns (payload, shape) for a vector or matrix."""
+    matrix = as_matrix(vectors)
+    return matrix.tobytes(), matrix.shape
+
+
+def from_bytes(payload, shape):
+    """Decodes a payload produced by to_bytes into a native float32 array."""
+    array = np.frombuffer(payload, dtype=WIRE_DTYPE)
+    return array.reshape(shape).astype(np.float32, copy=False)
+
+
+def to_base64(vectors):
+    payload, shape = to_bytes(vectors)
+    return {
+        "vector_b64": base64.b64encode(payload).decode("ascii"),
+        "shape": list(shape),
+        "dtype": DTYPE_NAME,
+    }
+
+
+def from_base64(obj):
+    return from_bytes(base64.b64decode(obj["vector_b64"]), tuple(obj["shape"]))
+
+
+def binary_headers(shape):
+    return {SHAPE_HEADER: format_shape(shape), DTYPE_HEADER: DTYPE_NAME}
+
+
+def ndjson_line(index, vector, **extra):
+    """One NDJSON record carrying a base64 vector."""
+    return json.dumps({"index": index, **to_base64(vector), **extra}) + "\n"
+
+
+__all__ = [
+    "WIRE_DTYPE",
+    "DTYPE_NAME",
+    "MIME_JSON",
+    "MIME_BINARY",
+    "MIME_NDJSON",
+    "SHAPE_HEADER",
+    "DTYPE_HEADER",
+    "FORMATS",
+    "negotiate_format",
+    "as_matrix",
+    "format_shape",
+    "parse_shape",
+    "to_bytes",
+    "from_bytes",
+    "to_base64",
+    "from_base64",
+    "binary_headers",
+    "ndjson_line",
+]
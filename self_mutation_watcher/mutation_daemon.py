@@ -32,6 +32,7 @@ from self_mutation_watcher.watcher import (
 from agents.planner_agent import enqueue_next
 from memory.vector_store.embedder import embed_text, package_embedding
 from nlp_engine.semantic_score import semantic_similarity
+from nlp_engine.structural_diff import diff_code
 from backend.utils.git_ops import archive_json_log
 from agent_core.task_queue import enqueue_task
 from environments import orchestrator as G
@@ -156,6 +157,10 @@ def auto_push():
         logger.warning(f"[WATCHER] Git push error: {e}")
 
 
+def _semantic_only(old, new):
+    return {"semantic_score": semantic_similarity(old, new), "embedding_delta": 0.0}
+
+
 def analyze_mutation_diff():
     for path in WATCH_PATHS:
         try:
@@ -165,11 +170,19 @@ def analyze_mutation_diff():
 
             if current != previous:
                 diff = generate_diff(previous, current)
-                score = semantic_similarity(previous, current)
+                # Only structurally changed units pay for semantic scoring
+                result = diff_code(path, previous, current, scorer=_semantic_only)
+                score = result["semantic_score"]
+                # Gates read the worst unit: the file-level score is
+                # line-weighted and barely moves when one function is rewritten
+                gate_score = result["min_unit_score"]
                 lineage_id = str(uuid.uuid4())
 
                 logger.info(
-                    f"[WATCHER] Semantic similarity for {path}: {round(score, 4)}"
+                    f"[WATCHER] Semantic similarity for {path}: {round(score, 4)} "
+                    f"(worst unit {round(gate_score, 4)}) "
+                    f"| changes={result.get('changes', result.get('mode'))} "
+                    f"| saved_ms={result.get('timing', {}).get('estimated_saved_ms')}"
                 )
 
                 vector = embed_text(diff)
@@ -181,6 +194,7 @@ def analyze_mutation_diff():
                         "type": "code_diff",
                         "file": path,
                         "semantic_score": round(score, 4),
+                        "min_unit_score": round(gate_score, 4),
                         "lineage_id": lineage_id,
                         "timestamp": datetime.utcnow().isoformat(),
                         "watermark": "source:GremlinGPT",
@@ -189,7 +203,7 @@ def analyze_mutation_diff():
 
                 log_to_dataset(previous, current, score, path, lineage_id)
 
-                if score < 0.6:
+                if gate_score < 0.6:
                     enqueue_task(
                         {
                             "type": "self_train",
@@ -202,11 +216,11 @@ def analyze_mutation_diff():
                     )
                     logger.warning(
                         f"[WATCHER] mutation_event=significant | "
-                        f"action=self_train | file={path} | score={round(score, 4)}"
+                        f"action=self_train | file={path} | score={round(gate_score, 4)}"
                     )
 
-                if score < 0.4:
-                    rollback_file(path, previous, lineage_id, score)
+                if gate_score < 0.4:
+                    rollback_file(path, previous, lineage_id, gate_score)
 
         except Exception as e:
             logger.error(f"[WATCHER] Semantic diff scoring failed for {path}: {e}")
@@ -26,7 +26,7 @@ from datetime import datetime
 from pathlib import Path
 from agent_core.task_queue import enqueue_task
 from self_training.feedback_loop import inject_feedback
-from nlp_engine.tokenizer import tokenize
+from nlp_engine.tokenizer import tokenize_batch
 from memory.vector_store.embedder import embed_text, package_embedding, inject_watermark
 from memory.log_history import log_event
 
@@ -59,6 +59,7 @@ def generate_datasets(
     """
     entries = []
     hashes = set()
+    candidates = []
     root = Path(root_dir)
     now = datetime.utcnow().isoformat()
     for path in root.rglob("*"):
@@ -71,28 +72,7 @@ def generate_datasets(
                 if any(keyword in line.upper() for keyword in KEYWORDS):
                     cleaned = line.strip()
                     if min_len < len(cleaned) < max_len:
-                        tokens = tokenize(cleaned)
-                        meta = {
-                            "watermark": WATERMARK,
-                            "length": len(cleaned),
-                            "lineage_id": LINEAGE_TAG,
-                            "type": path.suffix or "text",
-                            "token_count": len(tokens),
-                            "source_file": str(path),
-                            "line": i + 1,
-                            "timestamp": now,
-                        }
-                        entry = {
-                            "input": cleaned,
-                            "output": "TBD",
-                            "tokens": tokens,
-                            "meta": meta,
-                        }
-                        h = hash_entry(entry) if dedup else None
-                        if not dedup or h not in hashes:
-                            entries.append(entry)
-                            if dedup:
-                                hashes.add(h)
+                        candidates.append((cleaned, path, i))
         except Exception as e:
             log_event(
                 "dataset",
@@ -101,6 +81,31 @@ def generate_datasets(
                 status="fail",
             )
 
+    # Tokenize every matching line in batched fast-tokenizer calls
+    token_lists = tokenize_batch([c[0] for c in candidates])
+    for (cleaned, path, i), tokens in zip(candidates, token_lists):
+        meta = {
+            "watermark": WATERMARK,
+            "length": len(cleaned),
+            "lineage_id": LINEAGE_TAG,
+            "type": path.suffix or "text",
+            "token_count": len(tokens),
+            "source_file": str(path),
+            "line": i + 1,
+            "timestamp": now,
+        }
+        entry = {
+            "input": cleaned,
+            "output": "TBD",
+            "tokens": tokens,
+            "meta": meta,
+        }
+        h = hash_entry(entry) if dedup else None
+        if not dedup or h not in hashes:
+            entries.append(entry)
+            if dedup:
+                hashes.add(h)
+
     # Optionally deduplicate with previous dataset
     if dedup and os.path.exists(output_file):
         try:
@@ -84,11 +84,13 @@ def evaluate_with_diff(
     diff_info = None
     if reference_text:
         diff_info = diff_texts(reference_text, output_text, debug=debug)
-        # Advanced heuristics: penalize large embedding delta or low semantic score
-        if diff_info["embedding_delta"] > 2.0:
+        # Advanced heuristics: penalize large embedding delta or low semantic score.
+        # Gated on the worst hunk: file-level values of a long text are
+        # line-weighted and barely move when one function is rewritten.
+        if diff_info["max_hunk_delta"] > 2.0:
             base["reward"] -= 0.2
             base["reason"] += "+embedding_penalty"
-        if diff_info["semantic_score"] < 0.5:
+        if diff_info["min_hunk_score"] < 0.5:
             base["reward"] -= 0.2
             base["reason"] += "+semantic_penalty"
         base["semantic_score"] = diff_info["semantic_score"]